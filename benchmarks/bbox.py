@@ -0,0 +1,71 @@
+"""Benchmark checking pages of search results against a bbox query.
+
+Compares testing each feature's bbox against the query bbox in Python, allowing for
+bboxes crossing the antimeridian, with loading
+the whole page's bboxes into a NumPy array and testing them in one vectorized pass:
+
+    python benchmarks/bbox.py --items 1000
+"""
+
+import argparse
+import time
+
+from synthetic import synthetic_items
+
+from stac_api_validator.spatial import outside_bbox
+
+
+query = [-100.0, -50.0, 100.0, 50.0]
+
+
+def intervals(west: float, east: float) -> list:
+    return [(west, 180.0), (-180.0, east)] if west > east else [(west, east)]
+
+
+def per_item(features: list) -> list:
+    # the same test, antimeridian included, one feature at a time
+    west, south, east, north = query
+    result = []
+    for i, item in enumerate(features):
+        item_west, item_south, item_east, item_north = item["bbox"]
+        if not (
+            item_south <= north
+            and item_north >= south
+            and any(
+                a <= d and c <= b
+                for a, b in intervals(item_west, item_east)
+                for c, d in intervals(west, east)
+            )
+        ):
+            result.append(i)
+    return result
+
+
+def vectorized(features: list) -> list:
+    return outside_bbox(query, features)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    features = synthetic_items(args.items)
+    assert per_item(features) == vectorized(features)
+
+    timings = {}
+    for check in [per_item, vectorized]:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            check(features)
+        timings[check.__name__] = (time.perf_counter() - start) / args.repeat
+        print(
+            f"{check.__name__:>10}: {timings[check.__name__] * 1000:7.3f} ms per page of "
+            f"{args.items}, {args.items / timings[check.__name__]:10.0f} items/s"
+        )
+    print(f"speedup: {timings['per_item'] / timings['vectorized']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark matching query windows against a crawled slice of a collection.
+
+Compares testing every window against every item's geometry, one window at a time,
+with building an STRtree over the items once and querying it with all the windows in
+a single call:
+
+    python benchmarks/completeness.py --items 10000 --windows 1000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import shapely
+from synthetic import synthetic_items
+
+from stac_api_validator.digests import item_digest
+from stac_api_validator.spatial import ItemIndex
+from stac_api_validator.spatial import page_geometries
+from stac_api_validator.spatial import random_windows
+
+
+def per_window(features: list, windows: np.ndarray) -> list:
+    geometries = page_geometries(features)
+    digests = np.array(
+        [item_digest(f["collection"], f["id"]) for f in features], dtype=np.uint64
+    )
+    return [
+        np.sort(digests[shapely.intersects(shapely.box(*window), geometries)])
+        for window in windows
+    ]
+
+
+def bulk(features: list, windows: np.ndarray) -> list:
+    index = ItemIndex()
+    index.add([item_digest(f["collection"], f["id"]) for f in features], features)
+    index.build()
+    return index.matches(windows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--windows", type=int, default=1000)
+    args = parser.parse_args()
+
+    features = synthetic_items(args.items)
+    windows = random_windows(shapely.bounds(page_geometries(features)), args.windows)
+
+    timings = {}
+    results = {}
+    for match in [per_window, bulk]:
+        start = time.perf_counter()
+        results[match.__name__] = match(features, windows)
+        timings[match.__name__] = time.perf_counter() - start
+        print(
+            f"{match.__name__:>10}: {timings[match.__name__]:.3f}s for {args.windows} windows "
+            f"over {args.items} items"
+        )
+    assert all(
+        np.array_equal(a, b) for a, b in zip(results["per_window"], results["bulk"])
+    )
+    print(f"speedup: {timings['per_window'] / timings['bulk']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
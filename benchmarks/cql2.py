@@ -0,0 +1,137 @@
+"""Benchmark checking pages of filter search results against their CQL2-JSON filters.
+
+Times compiling each CQL2-JSON filter of the Filter Extension checks and evaluating
+it over a page of synthetic items, and compares the spatial filters with evaluating
+them item by item, converting each geometry with shapely.geometry.shape. Then runs
+the filter searches against the local fake API, with a fixed latency per request, as
+they used to be, CQL2-text over GET and CQL2-JSON over POST one at a time, and as
+they are now, both encodings over both methods concurrently:
+
+    python benchmarks/cql2.py --items 1000 --latency 0.05
+"""
+
+import argparse
+import time
+
+import requests
+from shapely.geometry import shape
+from synthetic import FakeStacApi
+from synthetic import synthetic_items
+
+from stac_api_validator import filters
+from stac_api_validator.cql2 import CompiledFilter
+from stac_api_validator.validations import Errors
+from stac_api_validator.validations import Method
+from stac_api_validator.validations import validate_filter_searches
+
+
+collection = "synthetic"
+expressions = {
+    "ex_2": filters.cql2_json_ex_2(collection),
+    "ex_3": filters.cql2_json_ex_3,
+    "ex_4": filters.cql2_json_ex_4,
+    "ex_6": filters.cql2_json_ex_6,
+    "ex_8": filters.cql2_json_ex_8,
+    "ex_9": filters.cql2_json_ex_9,
+    "and": filters.cql2_json_and("item-1", collection),
+    "or": filters.cql2_json_or("item-1", collection),
+    "not": filters.cql2_json_not("item-1"),
+    "between": filters.cql2_json_between,
+    "not_between": filters.cql2_json_not_between,
+    "like": filters.cql2_json_like,
+    "s_intersects": filters.cql2_json_s_intersects,
+    "common_1": filters.cql2_json_common_1,
+    **{
+        f"numeric {e['op']}": e
+        for e in filters.cql2_json_numeric_comparisons  # type: ignore
+    },
+    **{
+        f"timestamp {e['op']}": e
+        for e in filters.cql2_json_timestamp_comparisons  # type: ignore
+    },
+}
+
+
+def per_item_intersects(expression: dict, features: list) -> list:
+    # the literal is converted once, and each feature's geometry once per feature
+    query = shape(expression["args"][1])
+    return [
+        i
+        for i, feature in enumerate(features)
+        if not query.intersects(shape(feature["geometry"]))
+    ]
+
+
+def best_of(repeat: int, function, *args) -> float:  # type: ignore
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    features = synthetic_items(args.items, collection=collection)
+    print(f"{'filter':<16} {'compile ms':>10} {'page ms':>10} {'non-matching':>12}")
+    for name, expression in expressions.items():
+        compile_ms = best_of(args.repeat, CompiledFilter, expression)
+        compiled = CompiledFilter(expression)
+        page_ms = best_of(args.repeat, compiled.non_matching, features)
+        print(
+            f"{name:<16} {compile_ms:>10.3f} {page_ms:>10.3f} "
+            f"{len(compiled.non_matching(features)):>12}"
+        )
+
+    print()
+    print(f"{'s_intersects':<16} {'per item ms':>11} {'page ms':>10}")
+    for name in ("s_intersects", "ex_8"):
+        expression = expressions[name]
+        single = expression if name == "s_intersects" else expression["args"][0]
+        compiled = CompiledFilter(single)
+        assert per_item_intersects(single, features) == compiled.non_matching(features)
+        per_item_ms = best_of(args.repeat, per_item_intersects, single, features)
+        page_ms = best_of(args.repeat, compiled.non_matching, features)
+        print(f"{name:<16} {per_item_ms:>11.3f} {page_ms:>10.3f}")
+
+    print()
+    suite = list(expressions.values())
+    with FakeStacApi(items=args.items, latency=args.latency) as api:
+        url = f"{api.url}/search"
+        session = requests.Session()
+        for label, runs, workers in [
+            (
+                "text GET, JSON POST, sequential",
+                [(["cql2-text"], Method.GET), (["cql2-json"], Method.POST)],
+                1,
+            ),
+            (
+                "both over both, concurrent",
+                [(["cql2-text", "cql2-json"], None)],
+                8,
+            ),
+        ]:
+            start = time.perf_counter()
+            for encodings, method in runs:
+                urls = {
+                    m: url for m in (Method.GET, Method.POST) if method in (m, None)
+                }
+                # without the sequential latency pass, which both would add
+                validate_filter_searches(
+                    suite, encodings, urls, Errors(), session, workers, repeats=0
+                )
+            print(
+                f"{label}: {sum(api.requests.values())} searches in "
+                f"{time.perf_counter() - start:.2f}s"
+            )
+            api.reset()
+
+
+if __name__ == "__main__":
+    main()
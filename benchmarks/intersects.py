@@ -0,0 +1,67 @@
+"""Benchmark checking pages of search results against an intersects geometry.
+
+Compares building a Shapely geometry from each item and testing it against the query
+geometry one at a time with converting the whole page with shapely.from_geojson and
+testing it in one vectorized call against the prepared query geometry:
+
+    python benchmarks/intersects.py --items 1000
+"""
+
+import argparse
+import time
+
+from shapely.geometry import shape
+from synthetic import synthetic_items
+
+from stac_api_validator.spatial import non_intersecting
+from stac_api_validator.spatial import query_geometry
+
+
+query = {
+    "type": "Polygon",
+    "coordinates": [
+        [[-180, -85], [0, -85], [180, 0], [180, 85], [-180, 85], [-180, -85]]
+    ],
+}
+
+
+intersects_shape = shape(query)
+prepared = query_geometry(query)
+
+
+def per_item(features: list) -> list:
+    return [
+        i
+        for i, item in enumerate(features)
+        if not intersects_shape.intersects(shape(item.get("geometry")))
+    ]
+
+
+def vectorized(features: list) -> list:
+    return non_intersecting(prepared, features)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    features = synthetic_items(args.items)
+    assert per_item(features) == vectorized(features)
+
+    timings = {}
+    for check in [per_item, vectorized]:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            check(features)
+        timings[check.__name__] = (time.perf_counter() - start) / args.repeat
+        print(
+            f"{check.__name__:>10}: {timings[check.__name__] * 1000:7.2f} ms per page of "
+            f"{args.items}, {args.items / timings[check.__name__]:9.0f} items/s"
+        )
+    print(f"speedup: {timings['per_item'] / timings['vectorized']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
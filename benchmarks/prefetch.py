@@ -0,0 +1,75 @@
+"""Benchmark deep collection validation with and without prefetching of pages.
+
+Runs validate_deep_collection against a local fake STAC API that takes a fixed time
+to serve each page, fetching each page only after the previous one is validated and
+with several depths of prefetching:
+
+    python benchmarks/prefetch.py --items 2000 --latency 0.05
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from requests import Session
+from synthetic import FakeStacApi
+from synthetic import write_schema_bundle
+
+from stac_api_validator import validations
+from stac_api_validator.schemas import SchemaStore
+from stac_api_validator.schemas import ValidatorIndex
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--prefetch", type=int, nargs="+", default=[0, 1, 2, 4])
+    args = parser.parse_args()
+
+    # the prefetch timings are logged at the end of each run
+    logging.basicConfig(level=logging.INFO, format="  %(message)s")
+    logging.getLogger("stac_api_validator").setLevel(logging.WARNING)
+    logging.getLogger("stac_api_validator.validations").setLevel(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as bundle_dir:
+        write_schema_bundle(Path(bundle_dir))
+        schema_store = SchemaStore(bundle_dir=Path(bundle_dir))
+
+        with (
+            schema_store.installed(),
+            FakeStacApi(items=args.items, latency=args.latency) as api,
+        ):
+            for prefetch_pages in args.prefetch:
+                print(f"prefetch {prefetch_pages} pages:")
+                run = validations.ValidationRun(
+                    schema_store=schema_store,
+                    validator_index=ValidatorIndex(schema_store),
+                )
+                errors = validations.Errors()
+                start = time.perf_counter()
+                validations.validate_deep_collection(
+                    api.landing_page(),
+                    api.collection,
+                    errors,
+                    validations.Warnings(),
+                    Session(),
+                    open_assets_urls=False,
+                    run=run,
+                    workers=args.workers,
+                    limit=args.limit,
+                    progress_seconds=3600,
+                    prefetch_pages=prefetch_pages,
+                )
+                seconds = time.perf_counter() - start
+                print(f"  {args.items / seconds:.0f} items/s, {seconds:.2f}s")
+                if errors:
+                    print(f"  unexpected errors: {errors.as_list()[:3]}")
+
+
+if __name__ == "__main__":
+    main()
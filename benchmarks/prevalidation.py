@@ -0,0 +1,105 @@
+"""Benchmark per-item validation cost with and without the structural pre-validator.
+
+Validates synthetic pages in which a share of the items is broken in the ways we
+most often see (missing bbox, missing datetime, bad links, wrong type), either with
+full validation of every item or with full validation only of the items that pass
+the structural checks:
+
+    python benchmarks/prevalidation.py --items 5000
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+
+from synthetic import synthetic_items
+from synthetic import write_schema_bundle
+
+from stac_api_validator import validations
+from stac_api_validator.schemas import SchemaStore
+from stac_api_validator.schemas import ValidatorIndex
+from stac_api_validator.structure import page_structure_errors
+
+
+def break_item(item: Dict[str, Any], rng: random.Random) -> None:
+    match rng.randrange(4):
+        case 0:
+            del item["bbox"]
+        case 1:
+            del item["properties"]["datetime"]
+        case 2:
+            item["links"].append({"rel": "alternate"})
+        case 3:
+            item["type"] = "feature"
+
+
+def failure_heavy_items(
+    count: int, failure_rate: float, seed: int = 0
+) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    items = synthetic_items(count)
+    for item in items:
+        if rng.random() < failure_rate:
+            break_item(item, rng)
+    return items
+
+
+def validate_all(items: List[Dict[str, Any]], run: validations.ValidationRun) -> int:
+    errors = validations.Errors()
+    for item in items:
+        validations.stac_validate(
+            "https://example.com/search",
+            item,
+            errors,
+            validations.Context.ITEM_SEARCH,
+            run=run,
+        )
+    return len(errors.errors)
+
+
+def prevalidate(items: List[Dict[str, Any]], run: validations.ValidationRun) -> int:
+    structure_errors = page_structure_errors(items)
+    return len(structure_errors) + validate_all(
+        [item for i, item in enumerate(items) if i not in structure_errors], run
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as bundle_dir:
+        write_schema_bundle(Path(bundle_dir))
+        schema_store = SchemaStore(bundle_dir=Path(bundle_dir))
+
+        with schema_store.installed():
+            run = validations.ValidationRun(
+                schema_store=schema_store, validator_index=ValidatorIndex(schema_store)
+            )
+            # build the validator before timing
+            validate_all(synthetic_items(1), run)
+
+            print("failure rate | full validation | pre-validated | speedup")
+            for failure_rate in [0.1, 0.5, 0.9]:
+                items = failure_heavy_items(args.items, failure_rate)
+                timings = []
+                for validate in [validate_all, prevalidate]:
+                    start = time.perf_counter()
+                    validate(items, run)
+                    timings.append(
+                        (time.perf_counter() - start) / len(items) * 1_000_000
+                    )
+                print(
+                    f"{failure_rate:12.0%} | {timings[0]:10.1f} us/item | "
+                    f"{timings[1]:8.1f} us/item | {timings[0] / timings[1]:6.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark the Query Extension searches against the local fake API.
+
+Runs the 20 GET and POST searches of the Query Extension checks one at a time, as
+they used to be, and concurrently, with a fixed latency per request:
+
+    python benchmarks/query.py --latency 0.2
+"""
+
+import argparse
+import time
+
+import requests
+from synthetic import FakeStacApi
+
+from stac_api_validator.query import QueryProbe
+from stac_api_validator.validations import QUERY_PROBES
+from stac_api_validator.validations import Context
+from stac_api_validator.validations import Errors
+from stac_api_validator.validations import Method
+from stac_api_validator.validations import validate_query_probes
+
+
+values = {
+    "eq": "50",
+    "neq": "50",
+    "lt": "50",
+    "lte": "50",
+    "gt": "50",
+    "gte": "50",
+    "startsWith": "item",
+    "endsWith": "1",
+    "contains": "tem",
+    "in": ["1", "2"],
+}
+fields = {
+    "query_comparison_field": "eo:cloud_cover",
+    "query_substring_field": "datetime",
+    "query_in_field": "eo:cloud_cover",
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    probes = [
+        QueryProbe(fields[field], operator, values[operator])
+        for operator, field, _ in QUERY_PROBES
+    ]
+    with FakeStacApi(items=100, latency=args.latency) as api:
+        urls = {Method.GET: f"{api.url}/search", Method.POST: f"{api.url}/search"}
+        session = requests.Session()
+        for workers in (1, 8):
+            start = time.perf_counter()
+            validate_query_probes(
+                probes,
+                urls,
+                api.collection,
+                Errors(),
+                Context.ITEM_SEARCH_QUERY,
+                session,
+                workers=workers,
+            )
+            print(
+                f"{workers} workers: {sum(api.requests.values())} searches in "
+                f"{time.perf_counter() - start:.2f}s"
+            )
+            api.reset()
+
+
+if __name__ == "__main__":
+    main()
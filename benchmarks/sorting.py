@@ -0,0 +1,128 @@
+"""Benchmark checking the order of sorted search results.
+
+Compares collecting every datetime string, deep-copying and sorting the list and
+comparing it with the original, with parsing each page into a datetime64 array and
+checking it against the last datetime of the previous page. Then, for a sortby of
+several fields, compares a Python loop written for just those fields, comparing each
+item with the next, with the compiled, vectorized multi-key check for any sortby:
+
+    python benchmarks/sorting.py --items 100000
+"""
+
+import argparse
+import copy
+import time
+import tracemalloc
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from stac_api_validator.sorting import SortChecker
+from stac_api_validator.sorting import parse_sortby
+
+
+sortby = "eo:cloud_cover,-datetime,id"
+
+
+def pages(items: int, limit: int, offsets: bool) -> list:
+    # sorted by cloud cover, then by datetime descending, then by id
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    features = []
+    for i in range(items):
+        moment = start + timedelta(seconds=items - i % 1000)
+        features.append(
+            {
+                "id": f"item-{i:08d}",
+                "properties": {
+                    "eo:cloud_cover": i // 1000,
+                    "datetime": moment.isoformat()
+                    if offsets
+                    else f"{moment.isoformat()[:-6]}Z",
+                },
+            }
+        )
+    return [features[i : i + limit] for i in range(0, items, limit)]
+
+
+def sort_strings(stream: list) -> bool:
+    datetimes = [f["properties"]["datetime"] for page in stream for f in page]
+    sorted_datetimes = copy.deepcopy(datetimes)
+    sorted_datetimes.sort(reverse=True)
+    return datetimes == sorted_datetimes
+
+
+def streaming(stream: list) -> bool:
+    checker = SortChecker(parse_sortby("-datetime"))
+    cover = 0
+    for page in stream:
+        # within one cloud cover, so datetimes alone are in order
+        if page[0]["properties"]["eo:cloud_cover"] != cover:
+            break
+        rows = [checker.key(f) for f in page]
+        checker.check(rows, [f["id"] for f in page])
+    return not checker.out_of_order
+
+
+def pairwise(stream: list) -> bool:
+    previous = None
+    for page in stream:
+        for f in page:
+            p = f["properties"]
+            key = (
+                p["eo:cloud_cover"],
+                datetime.fromisoformat(p["datetime"].replace("Z", "+00:00")),
+                f["id"],
+            )
+            if previous is not None:
+                for a, b, descending in zip(previous, key, (False, True, False)):
+                    if a != b:
+                        if (a > b) != descending:
+                            return False
+                        break
+            previous = key
+    return True
+
+
+def compiled(stream: list) -> bool:
+    checker = SortChecker(parse_sortby(sortby))
+    for page in stream:
+        rows = [checker.key(f) for f in page]
+        checker.check(rows, [f["id"] for f in page])
+    return not checker.out_of_order
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument(
+        "--offsets", action="store_true", help="write datetimes as +00:00, not Z"
+    )
+    args = parser.parse_args()
+
+    stream = pages(args.items, args.limit, args.offsets)
+    # the first cloud cover only, for the checks of datetimes alone
+    first = stream[: 1000 // args.limit]
+    for check, checked in [
+        (sort_strings, first),
+        (streaming, first),
+        (pairwise, stream),
+        (compiled, stream),
+    ]:
+        items = sum(len(page) for page in checked)
+        start = time.perf_counter()
+        assert check(checked)
+        seconds = time.perf_counter() - start
+        # timed without tracing, which slows allocation-heavy code unevenly
+        tracemalloc.start()
+        check(checked)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{check.__name__:>12}: {seconds:.3f}s, {items / seconds:10.0f} items/s, "
+            f"peak {peak / 2**20:.2f} MiB over {items} items"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark requests and wall time of the Collections and Features validations.
+
+Runs validate_collections and validate_features against a local fake STAC API with
+stac-check given the object URL (so it downloads each object again) and given the
+already-retrieved body, with and without the asset reachability stage:
+
+    python benchmarks/stac_check_bodies.py
+"""
+
+import argparse
+import tempfile
+import time
+import unittest.mock
+from pathlib import Path
+from typing import Any
+
+from requests import Session
+from synthetic import FakeStacApi
+from synthetic import write_schema_bundle
+
+from stac_api_validator import validations
+from stac_api_validator.assets import AssetChecker
+from stac_api_validator.schemas import SchemaStore
+from stac_api_validator.schemas import ValidatorIndex
+
+
+stac_check = validations.stac_check
+
+
+def stac_check_by_url(*args: Any, body: Any = None, **kwargs: Any) -> None:
+    stac_check(*args, **kwargs)
+
+
+def run_validations(
+    api: FakeStacApi, schema_store: SchemaStore, asset_stage: bool
+) -> None:
+    r_session = Session()
+    run = validations.ValidationRun(
+        schema_store=schema_store,
+        validator_index=ValidatorIndex(schema_store),
+        asset_checker=AssetChecker(headers=r_session.headers) if asset_stage else None,
+    )
+    errors = validations.Errors()
+    warnings = validations.Warnings()
+    root_body = api.landing_page()
+    validations.validate_collections(
+        root_body, api.collection, errors, warnings, r_session, run=run
+    )
+    validations.validate_features(
+        root_body,
+        root_body["conformsTo"],
+        api.collection,
+        None,
+        warnings,
+        errors,
+        r_session,
+        validate_pagination=False,
+        run=run,
+    )
+    if run.asset_checker:
+        run.asset_checker.check()
+    if errors:
+        print(f"  unexpected errors: {errors.as_list()}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as bundle_dir:
+        write_schema_bundle(Path(bundle_dir))
+        schema_store = SchemaStore(bundle_dir=Path(bundle_dir))
+
+        with schema_store.installed(), FakeStacApi(items=10) as api:
+            for label, by_url, asset_stage in [
+                ("stac-check by url, assets opened per object", True, False),
+                ("stac-check by url, asset stage", True, True),
+                ("stac-check by body, asset stage", False, True),
+            ]:
+                api.reset()
+                with unittest.mock.patch.object(
+                    validations,
+                    "stac_check",
+                    stac_check_by_url if by_url else stac_check,
+                ):
+                    start = time.perf_counter()
+                    for _ in range(args.repeat):
+                        run_validations(api, schema_store, asset_stage)
+                    seconds = (time.perf_counter() - start) / args.repeat
+
+                requests = {k: v / args.repeat for k, v in sorted(api.requests.items())}
+                print(f"{label}:")
+                print(
+                    f"  {sum(requests.values()):.0f} requests, {seconds:.3f}s per run"
+                )
+                print(f"  {api.bytes_sent / args.repeat / 1024:.0f} KiB served per run")
+                print(f"  {', '.join(f'{k}: {v:g}' for k, v in requests.items())}")
+
+
+if __name__ == "__main__":
+    main()
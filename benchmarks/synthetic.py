@@ -0,0 +1,459 @@
+"""Synthetic schemas, items, and a local fake STAC API for the benchmarks.
+
+Nothing here touches the network: the schemas are written to a temporary offline
+schema bundle and the API is served from a local thread.
+"""
+
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from urllib.parse import parse_qs
+from urllib.parse import urlencode
+from urllib.parse import urlparse
+
+from shapely.geometry import shape
+
+from stac_api_validator.schemas import bundle_path
+
+
+item_schema_url = "https://schemas.stacspec.org/v1.0.0/item-spec/json-schema/item.json"
+collection_schema_url = (
+    "https://schemas.stacspec.org/v1.0.0/collection-spec/json-schema/collection.json"
+)
+extension_url = "https://stac-extensions.github.io/eo/v1.0.0/schema.json"
+
+bundle_schemas: Dict[str, Dict[str, Any]] = {
+    item_schema_url: {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "$id": f"{item_schema_url}#",
+        "type": "object",
+        "required": ["type", "stac_version", "id", "geometry", "properties", "links"],
+        "properties": {
+            "type": {"const": "Feature"},
+            "id": {"type": "string"},
+            "geometry": {"$ref": "#/definitions/polygon"},
+            "properties": {"$ref": "datetime.json"},
+            "links": {"type": "array", "items": {"type": "object"}},
+        },
+        "definitions": {
+            "polygon": {
+                "type": "object",
+                "required": ["type", "coordinates"],
+                "properties": {
+                    "type": {"const": "Polygon"},
+                    "coordinates": {
+                        "type": "array",
+                        "items": {
+                            "type": "array",
+                            "minItems": 4,
+                            "items": {
+                                "type": "array",
+                                "minItems": 2,
+                                "items": {"type": "number"},
+                            },
+                        },
+                    },
+                },
+            }
+        },
+    },
+    "https://schemas.stacspec.org/v1.0.0/item-spec/json-schema/datetime.json": {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "required": ["datetime"],
+        "properties": {"datetime": {"type": ["string", "null"]}},
+    },
+    collection_schema_url: {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "$id": f"{collection_schema_url}#",
+        "type": "object",
+        "required": ["type", "stac_version", "id", "extent", "links"],
+        "properties": {
+            "type": {"const": "Collection"},
+            "id": {"type": "string"},
+            "links": {"type": "array", "items": {"type": "object"}},
+        },
+    },
+    extension_url: {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "properties": {
+            "properties": {
+                "type": "object",
+                "properties": {"eo:cloud_cover": {"type": "number"}},
+            }
+        },
+    },
+}
+
+
+def write_schema_bundle(bundle_dir: Path) -> None:
+    for url, schema in bundle_schemas.items():
+        path = bundle_path(bundle_dir, url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(schema))
+
+
+def synthetic_item(
+    i: int, base_url: str = "https://example.com", collection: str = "synthetic"
+) -> Dict[str, Any]:
+    x = (i * 7) % 360 - 180
+    y = (i * 3) % 170 - 85
+    items_url = f"{base_url}/collections/{collection}/items"
+    return {
+        "type": "Feature",
+        "stac_version": "1.0.0",
+        "stac_extensions": [extension_url],
+        "id": f"item-{i}",
+        "collection": collection,
+        "bbox": [x, y, x + 1, y + 1],
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[[x, y], [x + 1, y], [x + 1, y + 1], [x, y + 1], [x, y]]],
+        },
+        "properties": {
+            "datetime": f"2020-01-{1 + i % 28:02d}T00:00:00Z",
+            "eo:cloud_cover": i % 100,
+        },
+        "links": [
+            {"rel": "self", "href": f"{items_url}/item-{i}"},
+            {"rel": "root", "href": base_url},
+            {"rel": "parent", "href": f"{base_url}/collections/{collection}"},
+            {"rel": "collection", "href": f"{base_url}/collections/{collection}"},
+        ],
+        "assets": {
+            "data": {
+                "href": f"{base_url}/assets/item-{i}.tif",
+                "type": "image/tiff; application=geotiff; profile=cloud-optimized",
+                "roles": ["data"],
+            },
+            "thumbnail": {
+                "href": f"{base_url}/assets/item-{i}.png",
+                "type": "image/png",
+                "roles": ["thumbnail"],
+            },
+        },
+    }
+
+
+def synthetic_items(
+    count: int, base_url: str = "https://example.com", collection: str = "synthetic"
+) -> List[Dict[str, Any]]:
+    return [synthetic_item(i, base_url, collection) for i in range(count)]
+
+
+class FakeStacApi:
+    """A STAC API over synthetic items, served on localhost, that counts requests."""
+
+    def __init__(
+        self,
+        items: int = 100,
+        collection: str = "synthetic",
+        asset_size: int = 256 * 1024,
+        max_limit: int = 1000,
+        latency: float = 0.0,
+        offset_cost: float = 0.0,
+        dropped: Optional[Set[str]] = None,
+    ) -> None:
+        self.collection = collection
+        self.asset_size = asset_size
+        self.max_limit = max_limit
+        # seconds per request, and per item skipped to reach a page, as with offset paging
+        self.latency = latency
+        self.offset_cost = offset_cost
+        # ids left out of search results, as by a spatial index out of sync
+        self.dropped = dropped or set()
+        self.requests: Counter = Counter()
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self.items = synthetic_items(items, self.url, collection)
+        self.items_by_id = {item["id"]: item for item in self.items}
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self) -> "FakeStacApi":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests.clear()
+            self.bytes_sent = 0
+
+    def count(self, kind: str, size: int) -> None:
+        with self._lock:
+            self.requests[kind] += 1
+            self.bytes_sent += size
+
+    def landing_page(self) -> Dict[str, Any]:
+        return {
+            "type": "Catalog",
+            "stac_version": "1.0.0",
+            "id": "fake",
+            "description": "fake",
+            "conformsTo": [
+                "https://api.stacspec.org/v1.0.0/core",
+                "https://api.stacspec.org/v1.0.0/collections",
+                "https://api.stacspec.org/v1.0.0/ogcapi-features",
+                "https://api.stacspec.org/v1.0.0/item-search",
+                "http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/core",
+                "http://www.opengis.net/spec/ogcapi-features-1/1.0/conf/geojson",
+            ],
+            "links": [
+                {"rel": "self", "href": self.url},
+                {"rel": "root", "href": self.url},
+                {"rel": "conformance", "href": f"{self.url}/conformance"},
+                {
+                    "rel": "service-desc",
+                    "href": f"{self.url}/api",
+                    "type": "application/vnd.oai.openapi+json;version=3.0",
+                },
+                {"rel": "data", "href": f"{self.url}/collections"},
+                {
+                    "rel": "search",
+                    "href": f"{self.url}/search",
+                    "type": "application/geo+json",
+                    "method": "GET",
+                },
+                {
+                    "rel": "search",
+                    "href": f"{self.url}/search",
+                    "type": "application/geo+json",
+                    "method": "POST",
+                },
+            ],
+        }
+
+    def service_desc(self) -> Dict[str, Any]:
+        limit = {
+            "name": "limit",
+            "in": "query",
+            "schema": {"type": "integer", "minimum": 1, "maximum": self.max_limit},
+        }
+        return {
+            "openapi": "3.0.3",
+            "paths": {
+                "/search": {"get": {"parameters": [limit]}},
+                f"/collections/{self.collection}/items": {
+                    "get": {"parameters": [limit]}
+                },
+            },
+        }
+
+    def collection_body(self) -> Dict[str, Any]:
+        return {
+            "type": "Collection",
+            "stac_version": "1.0.0",
+            "id": self.collection,
+            "description": "synthetic items",
+            "license": "proprietary",
+            "extent": {
+                "spatial": {"bbox": [[-180, -90, 180, 90]]},
+                "temporal": {
+                    "interval": [["2020-01-01T00:00:00Z", "2020-01-29T00:00:00Z"]]
+                },
+            },
+            "links": [
+                {"rel": "self", "href": f"{self.url}/collections/{self.collection}"},
+                {"rel": "root", "href": self.url},
+                {"rel": "parent", "href": self.url},
+                {
+                    "rel": "items",
+                    "href": f"{self.url}/collections/{self.collection}/items",
+                },
+            ],
+        }
+
+    def matching(
+        self, query: Dict[str, List[str]], search: bool
+    ) -> List[Dict[str, Any]]:
+        # items are axis-aligned boxes, so bbox and the bounds of intersects select them
+        if "bbox" in query:
+            west, south, east, north = map(float, query["bbox"][0].split(","))
+        elif "intersects" in query:
+            west, south, east, north = shape(json.loads(query["intersects"][0])).bounds
+        else:
+            return self.items
+        return [
+            item
+            for item in self.items
+            if item["bbox"][0] <= east
+            and west <= item["bbox"][2]
+            and item["bbox"][1] <= north
+            and south <= item["bbox"][3]
+            and not (search and item["id"] in self.dropped)
+        ]
+
+    def items_page(
+        self,
+        page_url: str,
+        query: Dict[str, List[str]],
+        method: str = "GET",
+        search: bool = False,
+    ) -> Dict[str, Any]:
+        limit = min(int(query.get("limit", ["10"])[0]), self.max_limit)
+        offset = int(query.get("token", ["0"])[0])
+        time.sleep(self.latency + self.offset_cost * offset)
+        items = self.matching(query, search)
+        features = items[offset : offset + limit]
+        links = [
+            {"rel": "self", "href": page_url},
+            {"rel": "root", "href": self.url},
+        ]
+        if offset + limit < len(items) and method == "POST":
+            links.append(
+                {
+                    "rel": "next",
+                    "href": page_url,
+                    "type": "application/geo+json",
+                    "method": "POST",
+                    "body": {"token": str(offset + limit)},
+                    "merge": True,
+                }
+            )
+        elif offset + limit < len(items):
+            next_query = {k: v[0] for k, v in query.items() if k != "token"}
+            next_query.update(limit=str(limit), token=str(offset + limit))
+            links.append(
+                {
+                    "rel": "next",
+                    "href": f"{page_url}?{urlencode(next_query)}",
+                    "type": "application/geo+json",
+                }
+            )
+        return {
+            "type": "FeatureCollection",
+            "features": features,
+            "links": links,
+            "numberReturned": len(features),
+        }
+
+    def _handler(self) -> type:
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def send(
+                self,
+                kind: str,
+                status: int,
+                body: Optional[Any] = None,
+                content_type: str = "application/json",
+                raw: Optional[bytes] = None,
+            ) -> None:
+                data = raw if raw is not None else json.dumps(body).encode()
+                api.count(kind, len(data))
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(data)
+
+            def do_HEAD(self) -> None:
+                self.do_GET()
+
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                parts = [p for p in url.path.split("/") if p]
+                page_url = f"{api.url}{url.path}"
+                geojson = "application/geo+json"
+
+                if not parts:
+                    self.send("landing page", 200, api.landing_page())
+                elif parts == ["api"]:
+                    self.send(
+                        "service-desc",
+                        200,
+                        api.service_desc(),
+                        "application/vnd.oai.openapi+json;version=3.0",
+                    )
+                elif parts == ["conformance"]:
+                    self.send(
+                        "conformance",
+                        200,
+                        {"conformsTo": api.landing_page()["conformsTo"]},
+                    )
+                elif parts == ["collections"]:
+                    self.send(
+                        "collections",
+                        200,
+                        {
+                            "collections": [api.collection_body()],
+                            "links": [
+                                {"rel": "self", "href": page_url},
+                                {"rel": "root", "href": api.url},
+                            ],
+                        },
+                    )
+                elif parts == ["collections", api.collection]:
+                    self.send("collection", 200, api.collection_body())
+                elif parts in (["collections", api.collection, "items"], ["search"]):
+                    self.send(
+                        "items page",
+                        200,
+                        api.items_page(page_url, query, search=parts == ["search"]),
+                        geojson,
+                    )
+                elif (
+                    len(parts) == 4
+                    and parts[:3] == ["collections", api.collection, "items"]
+                    and parts[3] in api.items_by_id
+                ):
+                    self.send("item", 200, api.items_by_id[parts[3]], geojson)
+                elif parts[0] == "assets" and self.headers.get("Range"):
+                    self.send(
+                        f"asset {self.command}",
+                        206,
+                        raw=b"\0",
+                        content_type="image/tiff",
+                    )
+                elif parts[0] == "assets":
+                    self.send(
+                        f"asset {self.command}",
+                        200,
+                        raw=b"\0" * api.asset_size,
+                        content_type="image/tiff",
+                    )
+                else:
+                    self.send("not found", 404, {"code": "NotFound"})
+
+            def do_POST(self) -> None:
+                url = urlparse(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if url.path.strip("/") != "search":
+                    self.send("not found", 404, {"code": "NotFound"})
+                    return
+                query = {
+                    k: [str(v)] for k, v in body.items() if k in ("limit", "token")
+                }
+                if "bbox" in body:
+                    query["bbox"] = [",".join(map(str, body["bbox"]))]
+                if "intersects" in body:
+                    query["intersects"] = [json.dumps(body["intersects"])]
+                self.send(
+                    "items page POST",
+                    200,
+                    api.items_page(f"{api.url}{url.path}", query, "POST", True),
+                    "application/geo+json",
+                )
+
+        return Handler
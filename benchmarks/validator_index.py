@@ -0,0 +1,54 @@
+"""Benchmark schema validation throughput with and without the validator index.
+
+Validates a synthetic FeatureCollection against a synthetic offline schema bundle,
+so no network access is needed:
+
+    python benchmarks/validator_index.py --items 10000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from stac_validator.stac_validator import StacValidate
+from synthetic import synthetic_items
+from synthetic import write_schema_bundle
+
+from stac_api_validator.schemas import SchemaStore
+from stac_api_validator.schemas import ValidatorIndex
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as bundle_dir:
+        write_schema_bundle(Path(bundle_dir))
+        schema_store = SchemaStore(bundle_dir=Path(bundle_dir))
+        items = synthetic_items(args.items)
+
+        with schema_store.installed():
+            start = time.perf_counter()
+            for item in items:
+                StacValidate().validate_dict(item)
+            stac_validate_seconds = time.perf_counter() - start
+
+            index = ValidatorIndex(schema_store)
+            start = time.perf_counter()
+            for item in items:
+                index.validate(item)
+            index_seconds = time.perf_counter() - start
+
+    print(f"items: {len(items)}")
+    print(f"stac-validator:  {len(items) / stac_validate_seconds:10.0f} items/s")
+    print(f"validator index: {len(items) / index_seconds:10.0f} items/s")
+    print(
+        f"index: {len(index)} signatures, {index.hits} hits, {index.misses} misses, "
+        f"hit rate {index.hit_rate:.2%}, built in {index.build_seconds:.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,12 +8,45 @@ from typing import Optional
 
 import click
 
+from stac_api_validator.assets import DEFAULT_ASSET_HOST_LIMIT
+from stac_api_validator.pipeline import DEFAULT_PREFETCH_PAGES
+from stac_api_validator.schemas import DEFAULT_SCHEMA_BUNDLE_DIR
+from stac_api_validator.schemas import refresh_schema_bundle
+from stac_api_validator.validations import DEFAULT_COMPLETENESS_ITEMS
+from stac_api_validator.validations import DEFAULT_FILTER_REPEATS
+from stac_api_validator.validations import DEFAULT_PAGINATION_LATENCY_BUDGET
+from stac_api_validator.validations import DEFAULT_PAGINATION_MAX_ITEMS
+from stac_api_validator.validations import DEFAULT_SORT_MAX_ITEMS
 from stac_api_validator.validations import QueryConfig
 from stac_api_validator.validations import validate_api
 
 
+def refresh_schemas(ctx: click.Context, param: click.Parameter, value: bool) -> None:
+    if not value or ctx.resilient_parsing:
+        return
+
+    fetched, failed = refresh_schema_bundle(DEFAULT_SCHEMA_BUNDLE_DIR)
+    click.secho(
+        f"Bundled {len(fetched)} schemas in {DEFAULT_SCHEMA_BUNDLE_DIR}",
+        fg="green",
+    )
+    if failed:
+        click.secho("Could not fetch these schemas:", fg="red")
+        for url in failed:
+            click.secho(f"- {url}")
+    ctx.exit(1 if failed else 0)
+
+
 @click.command()
 @click.version_option()
+@click.option(
+    "--refresh-schemas",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=refresh_schemas,
+    help="Download the core and common extension STAC schemas into the offline schema bundle and exit.",
+)
 @click.option(
     "--log-level",
     default="INFO",
@@ -141,6 +174,138 @@ from stac_api_validator.validations import validate_api
     "--stac-check-config",
     help="Path to a YAML stac-check configuration file",
 )
+@click.option(
+    "--schema-dir",
+    type=click.Path(exists=True, file_okay=False),
+    help="Directory of additional JSON Schemas (e.g., private extensions), resolved by their '$id' instead of being fetched",
+)
+@click.option(
+    "--validate-all-features/--no-validate-all-features",
+    default=False,
+    help="Schema-validate every feature of each fetched Item Search and Features items page, not only the page itself",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Number of worker processes for --validate-all-features and worker threads for --deep-collection, defaults to the number of CPUs",
+)
+@click.option(
+    "--asset-host-limit",
+    type=click.IntRange(min=1),
+    default=DEFAULT_ASSET_HOST_LIMIT,
+    show_default=True,
+    help="Maximum number of concurrent asset reachability requests to any one host",
+)
+@click.option(
+    "--sample-items",
+    type=click.IntRange(min=1),
+    help="Validate a sample of this many items, spread over the collection's temporal and spatial extent",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=0,
+    show_default=True,
+    help="Random seed for --sample-items, so the same sample is drawn on every run",
+)
+@click.option(
+    "--deep-collection",
+    help="The name of a collection to validate every item of, paging through all of its items",
+)
+@click.option(
+    "--deep-collection-search/--no-deep-collection-search",
+    default=False,
+    help="Page through --deep-collection with Item Search instead of the collection's items endpoint",
+)
+@click.option(
+    "--full-validation-rate",
+    type=click.FloatRange(min=0, max=1),
+    default=1.0,
+    show_default=True,
+    help="Share of the structurally valid items of each page that also get full validation with --validate-all-features and --deep-collection",
+)
+@click.option(
+    "--prefetch-pages",
+    type=click.IntRange(min=0),
+    default=DEFAULT_PREFETCH_PAGES,
+    show_default=True,
+    help="Number of pages to fetch ahead of validation with --deep-collection, or 0 to fetch each page only after the previous one is validated",
+)
+@click.option(
+    "--pagination-max-items",
+    type=click.IntRange(min=1),
+    default=DEFAULT_PAGINATION_MAX_ITEMS,
+    show_default=True,
+    help="Number of items to page through with --validate-pagination when checking for duplicate items",
+)
+@click.option(
+    "--pagination-bloom/--no-pagination-bloom",
+    default=False,
+    show_default=True,
+    help="Check --validate-pagination for duplicates with a Bloom filter and a second confirming pass, for very large --pagination-max-items",
+)
+@click.option(
+    "--pagination-latency-pages",
+    type=click.IntRange(min=1),
+    help="With --validate-pagination, follow Item Search 'next' links this many pages deep with GET and POST, and warn if latency grows with depth",
+)
+@click.option(
+    "--pagination-latency-budget",
+    type=click.FloatRange(min=0, min_open=True),
+    default=DEFAULT_PAGINATION_LATENCY_BUDGET,
+    show_default=True,
+    help="Seconds per page; with --pagination-latency-pages, warn of the first page deeper than this",
+)
+@click.option(
+    "--geometry-complexity-budget",
+    "geometry_latency_budget",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Probe Item Search intersects with polygons of 10 to 100,000 vertices over the --geometry area, and warn of the first that fails or takes longer than this many seconds",
+)
+@click.option(
+    "--benchmark-page-sizes",
+    "benchmark_items",
+    type=click.IntRange(min=1),
+    help="Benchmark page sizes of /search GET and POST and /collections/{id}/items by paging through this many items of --collection with each, and report the fastest",
+)
+@click.option(
+    "--completeness-windows",
+    type=click.IntRange(min=1),
+    help="Check that Item Search bbox and intersects searches of this many random windows return every item of a crawled slice of --collection that intersects them",
+)
+@click.option(
+    "--completeness-items",
+    type=click.IntRange(min=1),
+    default=DEFAULT_COMPLETENESS_ITEMS,
+    show_default=True,
+    help="Number of items of --collection to crawl from /collections/{id}/items and index for --completeness-windows",
+)
+@click.option(
+    "--sort-max-items",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SORT_MAX_ITEMS,
+    show_default=True,
+    help="Number of sorted Item Search results to page through when checking the Sort extension",
+)
+@click.option(
+    "--sortby",
+    "sort_keys",
+    multiple=True,
+    help="A sortby to check the Sort extension with, in GET syntax, e.g. 'eo:cloud_cover,-datetime,id'; may be given more than once",
+)
+@click.option(
+    "--sort-sortables/--no-sort-sortables",
+    default=False,
+    show_default=True,
+    help="Check the Sort extension with each of the API's sortables, ascending and descending",
+)
+@click.option(
+    "--filter-repeats",
+    type=click.IntRange(min=0),
+    default=DEFAULT_FILTER_REPEATS,
+    show_default=True,
+    help="Number of times to send each Filter Extension search again one at a time, for the p50 and p95 latencies of a report of the slowest filter operators and queryables; 0 skips the report",
+)
 def main(
     log_level: str,
     root_url: str,
@@ -167,6 +332,28 @@ def main(
     transaction_collection: Optional[str] = None,
     headers: Optional[List[str]] = None,
     stac_check_config: Optional[str] = None,
+    schema_dir: Optional[str] = None,
+    validate_all_features: bool = False,
+    workers: Optional[int] = None,
+    asset_host_limit: int = DEFAULT_ASSET_HOST_LIMIT,
+    sample_items: Optional[int] = None,
+    seed: int = 0,
+    deep_collection: Optional[str] = None,
+    deep_collection_search: bool = False,
+    full_validation_rate: float = 1.0,
+    pagination_max_items: int = DEFAULT_PAGINATION_MAX_ITEMS,
+    pagination_bloom: bool = False,
+    pagination_latency_pages: Optional[int] = None,
+    pagination_latency_budget: float = DEFAULT_PAGINATION_LATENCY_BUDGET,
+    benchmark_items: Optional[int] = None,
+    prefetch_pages: int = DEFAULT_PREFETCH_PAGES,
+    geometry_latency_budget: Optional[float] = None,
+    completeness_windows: Optional[int] = None,
+    completeness_items: int = DEFAULT_COMPLETENESS_ITEMS,
+    sort_max_items: int = DEFAULT_SORT_MAX_ITEMS,
+    sort_keys: Optional[List[str]] = None,
+    sort_sortables: bool = False,
+    filter_repeats: int = DEFAULT_FILTER_REPEATS,
 ) -> int:
     """STAC API Validator."""
     logging.basicConfig(stream=sys.stdout, level=log_level)
@@ -208,6 +395,28 @@ def main(
             transaction_collection=transaction_collection,
             headers=processed_headers,
             stac_check_config=stac_check_config,
+            schema_dir=schema_dir,
+            validate_all_features=validate_all_features,
+            workers=workers,
+            asset_host_limit=asset_host_limit,
+            sample_items=sample_items,
+            seed=seed,
+            deep_collection=deep_collection,
+            deep_collection_search=deep_collection_search,
+            full_validation_rate=full_validation_rate,
+            pagination_max_items=pagination_max_items,
+            pagination_bloom=pagination_bloom,
+            pagination_latency_pages=pagination_latency_pages,
+            pagination_latency_budget=pagination_latency_budget,
+            benchmark_items=benchmark_items,
+            prefetch_pages=prefetch_pages,
+            geometry_latency_budget=geometry_latency_budget,
+            completeness_windows=completeness_windows,
+            completeness_items=completeness_items,
+            sort_max_items=sort_max_items,
+            sort_keys=list(sort_keys or []),
+            sort_sortables=sort_sortables,
+            filter_repeats=filter_repeats,
         )
     except Exception as e:
         click.secho(
@@ -0,0 +1,186 @@
+"""Asset href reachability checks."""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
+from urllib.parse import urljoin
+from urllib.parse import urlparse
+
+from more_itertools import roundrobin
+from requests import RequestException
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ASSET_WORKERS = 32
+DEFAULT_ASSET_HOST_LIMIT = 4
+
+
+@dataclass(frozen=True)
+class AssetReference:
+    context: str
+    method: str
+    url: str
+    item_id: Optional[str]
+    key: str
+    href: str
+
+
+def self_href(body: Dict[str, Any]) -> Optional[str]:
+    for link in body.get("links") or []:
+        if isinstance(link, dict) and link.get("rel") == "self":
+            href = link.get("href")
+            return href if isinstance(href, str) else None
+    return None
+
+
+def asset_hrefs(
+    body: Dict[str, Any], base_url: Optional[str] = None
+) -> Iterator[Tuple[Optional[str], str, str]]:
+    # relative hrefs resolve against the object's self link, then the url it was retrieved from
+    base = self_href(body) or base_url
+    assets = body.get("assets")
+    if not isinstance(assets, dict):
+        return
+    for key, asset in assets.items():
+        href = asset.get("href") if isinstance(asset, dict) else None
+        if isinstance(href, str) and href:
+            yield body.get("id"), key, urljoin(base, href) if base else href
+
+
+def references(
+    context: Any, method: Any, url: str, body: Dict[str, Any]
+) -> Iterator[AssetReference]:
+    for item_id, key, href in asset_hrefs(body, url):
+        yield AssetReference(str(context), str(method), url, item_id, key, href)
+
+
+def is_checkable(href: str) -> bool:
+    return urlparse(href).scheme in ("http", "https")
+
+
+class AssetChecker:
+    def __init__(
+        self,
+        headers: Optional[Mapping[str, Union[str, bytes]]] = None,
+        workers: int = DEFAULT_ASSET_WORKERS,
+        host_limit: int = DEFAULT_ASSET_HOST_LIMIT,
+        timeout: int = 10,
+        r_session: Optional[Session] = None,
+    ) -> None:
+        self.workers = workers
+        self.host_limit = host_limit
+        self.timeout = timeout
+        self.references: List[AssetReference] = []
+        self._seen: Set[AssetReference] = set()
+        # href -> failure message, or None when reachable
+        self.results: Dict[str, Optional[str]] = {}
+        self.requests = 0
+        self.seconds = 0.0
+        self.checked_hrefs = 0
+        self.checked_references = 0
+        self._host_limits: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+        if r_session is None:
+            r_session = Session()
+            r_session.mount("https://", HTTPAdapter(pool_maxsize=workers))
+            r_session.mount("http://", HTTPAdapter(pool_maxsize=workers))
+        if headers:
+            r_session.headers.update(headers)
+        self.r_session = r_session
+
+    def collect(self, context: Any, method: Any, url: str, body: Dict[str, Any]) -> int:
+        collected = 0
+        for reference in references(context, method, url, body):
+            if reference not in self._seen:
+                self._seen.add(reference)
+                self.references.append(reference)
+                collected += 1
+        return collected
+
+    def check(self) -> List[Tuple[AssetReference, str]]:
+        return self.check_references(self.references, self.results)
+
+    def check_references(
+        self,
+        references: List[AssetReference],
+        results: Optional[Dict[str, Optional[str]]] = None,
+    ) -> List[Tuple[AssetReference, str]]:
+        # without earlier results to reuse, nothing is kept once the failures are returned
+        if results is None:
+            results = {}
+        by_host: Dict[str, List[str]] = {}
+        for href in dict.fromkeys(r.href for r in references):
+            if href not in results and is_checkable(href):
+                by_host.setdefault(urlparse(href).netloc, []).append(href)
+
+        # interleave hosts so workers aren't all parked on one host's limit
+        unchecked = list(roundrobin(*by_host.values()))
+        if unchecked:
+            logger.debug(
+                f"checking {len(unchecked)} asset hrefs on {len(by_host)} hosts"
+            )
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                results.update(
+                    zip(unchecked, executor.map(self._check_href, unchecked))
+                )
+            self.seconds += time.perf_counter() - start
+        self.checked_hrefs += len(unchecked)
+        self.checked_references += len(references)
+
+        return [
+            (r, failure)
+            for r in references
+            if (failure := results.get(r.href)) is not None
+        ]
+
+    def _host_limit(self, href: str) -> threading.BoundedSemaphore:
+        host = urlparse(href).netloc
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.host_limit)
+            return self._host_limits[host]
+
+    def _count_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def _check_href(self, href: str) -> Optional[str]:
+        with self._host_limit(href):
+            try:
+                self._count_request()
+                resp = self.r_session.head(
+                    href, allow_redirects=True, timeout=self.timeout
+                )
+                if resp.status_code < 400:
+                    return None
+
+                # some object stores and signed urls reject HEAD but serve GET
+                self._count_request()
+                with self.r_session.get(
+                    href,
+                    headers={"Range": "bytes=0-0"},
+                    allow_redirects=True,
+                    stream=True,
+                    timeout=self.timeout,
+                ) as resp:
+                    if resp.status_code < 400:
+                        return None
+                    return f"returned status code {resp.status_code}"
+            except RequestException as e:
+                return f"request failed: {e}"
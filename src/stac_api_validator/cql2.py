@@ -0,0 +1,395 @@
+"""CQL2-JSON filters, their CQL2-text encoding, and their evaluation against search results."""
+
+import itertools
+import json
+import operator
+import re
+from datetime import date
+from datetime import datetime
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import shapely
+
+from stac_api_validator.sampling import parse_datetime
+from stac_api_validator.spatial import page_geometries
+
+
+# A compiled expression takes a feature and the results of the filter's spatial
+# operators for it, which are evaluated for the whole page beforehand. Boolean
+# expressions follow CQL2's three-valued logic, with None for unknown, as when a
+# property is null, and a feature matches only if its filter is True.
+Spatial = Tuple[Any, ...]
+Expression = Callable[[Dict[str, Any], Spatial], Any]
+
+# properties that are members of the feature rather than of its properties
+TOP_LEVEL_PROPERTIES = ("id", "collection", "geometry")
+
+COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "=": operator.eq,
+    "<>": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _timestamp(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    try:
+        return parse_datetime(value) if isinstance(value, str) else None
+    except ValueError:
+        return None
+
+
+def _date(value: Any) -> Optional[date]:
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    instant = _timestamp(value)
+    if instant is not None:
+        return instant.date()
+    try:
+        return date.fromisoformat(value) if isinstance(value, str) else None
+    except ValueError:
+        return None
+
+
+def _literal_parser(node: Any) -> Optional[Callable[[Any], Any]]:
+    if isinstance(node, dict) and "timestamp" in node:
+        return _timestamp
+    if isinstance(node, dict) and "date" in node:
+        return _date
+    return None
+
+
+# The CQL2-JSON of a filter is its canonical form, from which its CQL2-text is
+# derived, so the two encodings of a filter cannot drift apart.
+IDENTIFIER = re.compile(r"[A-Za-z_:][A-Za-z0-9_:.]*")
+TEXT_PREDICATES = {"like": "LIKE", "in": "IN", "between": "BETWEEN"}
+TEXT_FUNCTIONS = {
+    "s_intersects": "S_INTERSECTS",
+    "s_disjoint": "S_DISJOINT",
+    "s_within": "S_WITHIN",
+    "s_contains": "S_CONTAINS",
+    "t_intersects": "T_INTERSECTS",
+    "anyinteracts": "ANYINTERACTS",
+}
+
+# the class of each predicate operator, by which filter latency is profiled
+OPERATOR_CLASSES = {
+    **{op: "comparison" for op in COMPARISONS},
+    "like": "like",
+    "between": "between",
+    "in": "in",
+    "isNull": "isNull",
+    **{
+        op: "spatial" for op in ("s_intersects", "s_disjoint", "s_within", "s_contains")
+    },
+    **{op: "temporal" for op in ("t_intersects", "anyinteracts")},
+}
+
+
+def filter_constructs(node: Any) -> List[Tuple[str, str]]:
+    # the distinct (operator class, queryable) of each predicate of a filter, in
+    # order, through and, or and not
+    if not isinstance(node, dict) or "op" not in node:
+        return []
+    args = node.get("args") or []
+    if node["op"] in ("and", "or", "not"):
+        return list(
+            dict.fromkeys(
+                construct for arg in args for construct in filter_constructs(arg)
+            )
+        )
+    op = str(node["op"])
+    queryable = next(
+        (
+            str(arg["property"])
+            for arg in args
+            if isinstance(arg, dict) and "property" in arg
+        ),
+        "",
+    )
+    return [(OPERATOR_CLASSES.get(op, op), queryable)]
+
+
+def _text_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def to_text(node: Any) -> str:
+    if isinstance(node, bool):
+        return "TRUE" if node else "FALSE"
+    if isinstance(node, (int, float)):
+        return repr(node)
+    if isinstance(node, str):
+        return _text_literal(node)
+    if node is None:
+        return "NULL"
+    if isinstance(node, list):
+        return "(" + ", ".join(to_text(v) for v in node) + ")"
+    if not isinstance(node, dict):
+        raise ValueError(f"unsupported CQL2 value {node!r}")
+
+    if "op" in node:
+        op = node["op"]
+        args = node.get("args") or []
+        if op in ("and", "or"):
+            # nested boolean expressions are parenthesized, whatever their precedence
+            return f" {op.upper()} ".join(
+                f"({to_text(arg)})"
+                if isinstance(arg, dict) and arg.get("op") in ("and", "or", "not")
+                else to_text(arg)
+                for arg in args
+            )
+        if op == "not":
+            return f"NOT ({to_text(args[0])})"
+        if op in COMPARISONS:
+            return f"{to_text(args[0])} {op} {to_text(args[1])}"
+        if op == "between":
+            low, high = args[1] if len(args) == 2 else args[1:]
+            return f"{to_text(args[0])} BETWEEN {to_text(low)} AND {to_text(high)}"
+        if op in TEXT_PREDICATES:
+            return f"{to_text(args[0])} {TEXT_PREDICATES[op]} {to_text(args[1])}"
+        if op == "isNull":
+            return f"{to_text(args[0])} IS NULL"
+        if op in TEXT_FUNCTIONS:
+            return f"{TEXT_FUNCTIONS[op]}({', '.join(to_text(arg) for arg in args)})"
+        raise ValueError(f"unsupported CQL2 operator {op!r}")
+    if "property" in node:
+        name = str(node["property"])
+        return name if IDENTIFIER.fullmatch(name) else '"' + name + '"'
+    if "timestamp" in node:
+        return f"TIMESTAMP({_text_literal(node['timestamp'])})"
+    if "date" in node:
+        return f"DATE({_text_literal(node['date'])})"
+    if "interval" in node:
+        return f"INTERVAL({', '.join(_text_literal(b) for b in node['interval'])})"
+    if "bbox" in node:
+        return f"BBOX({', '.join(to_text(b) for b in node['bbox'])})"
+    if "type" in node:
+        geometry = shapely.from_geojson(json.dumps(node))
+        return str(shapely.to_wkt(geometry, rounding_precision=-1, trim=True))
+    raise ValueError(f"unsupported CQL2 value {json.dumps(node)}")
+
+
+def like_pattern(pattern: str) -> "re.Pattern[str]":
+    # % is any run of characters, _ any one character, and \ escapes either
+    parts = []
+    escaped = False
+    for c in pattern:
+        if escaped:
+            parts.append(re.escape(c))
+            escaped = False
+        elif c == "\\":
+            escaped = True
+        elif c == "%":
+            parts.append(".*")
+        elif c == "_":
+            parts.append(".")
+        else:
+            parts.append(re.escape(c))
+    return re.compile("".join(parts), re.DOTALL)
+
+
+def _all(values: List[Any]) -> Optional[bool]:
+    if any(v is False for v in values):
+        return False
+    return None if any(v is None for v in values) else True
+
+
+def _any(values: List[Any]) -> Optional[bool]:
+    if any(v is True for v in values):
+        return True
+    return None if any(v is None for v in values) else False
+
+
+# A CQL2-JSON filter compiled once into a tree of closures. Spatial operators are
+# evaluated for the whole page at once, with the literal geometry prepared once and
+# each feature's geometry parsed once per page, before the tree is evaluated for
+# each feature. The results of a page are local to the call, so one compiled filter
+# can check pages from several threads at once.
+class CompiledFilter:
+    def __init__(self, expression: Dict[str, Any]) -> None:
+        self.expression = expression
+        self._page_steps: List[Callable[[np.ndarray], List[Any]]] = []
+        self.predicate = self._compile(expression)
+
+    def matches(self, features: List[Any]) -> List[bool]:
+        spatial: Iterable[Spatial] = itertools.repeat(())
+        if self._page_steps:
+            geometries = page_geometries(features)
+            spatial = zip(*[step(geometries) for step in self._page_steps])
+        return [
+            isinstance(feature, dict) and self.predicate(feature, s) is True
+            for feature, s in zip(features, spatial)
+        ]
+
+    def non_matching(self, features: List[Any]) -> List[int]:
+        return [i for i, match in enumerate(self.matches(features)) if not match]
+
+    def _compile(self, node: Any) -> Expression:
+        if isinstance(node, dict) and "op" in node:
+            op = node["op"]
+            args = node.get("args") or []
+            if op in ("and", "or"):
+                parts = [self._compile(arg) for arg in args]
+                combine = _all if op == "and" else _any
+                return lambda f, s: combine([part(f, s) for part in parts])
+            if op == "not":
+                [part] = [self._compile(arg) for arg in args]
+
+                def negate(f: Dict[str, Any], s: Spatial) -> Optional[bool]:
+                    value = part(f, s)
+                    return None if value is None else not value
+
+                return negate
+            if op in COMPARISONS:
+                return self._comparison(COMPARISONS[op], *args)
+            if op == "like":
+                return self._like(*args)
+            if op == "between":
+                # the interval is either an array or two more arguments
+                low, high = args[1] if len(args) == 2 else args[1:]
+                return self._between(args[0], low, high)
+            if op == "in":
+                return self._in(*args)
+            if op == "isNull":
+                [value] = [self._compile(arg) for arg in args]
+                return lambda f, s: value(f, s) is None
+            if op in ("s_intersects", "s_disjoint", "s_within", "s_contains"):
+                return self._spatial(op, *args)
+            if op in ("t_intersects", "anyinteracts"):
+                return self._temporal(*args)
+            raise ValueError(f"unsupported CQL2 operator {op!r}")
+        return self._value(node)
+
+    def _value(self, node: Any) -> Expression:
+        if isinstance(node, dict):
+            if "property" in node:
+                name = node["property"]
+                if name in TOP_LEVEL_PROPERTIES:
+                    return lambda f, s: f.get(name)
+                return lambda f, s: (f.get("properties") or {}).get(name)
+            if "timestamp" in node:
+                instant = _timestamp(node["timestamp"])
+                return lambda f, s: instant
+            if "date" in node:
+                day = _date(node["date"])
+                return lambda f, s: day
+            raise ValueError(f"unsupported CQL2 value {json.dumps(node)}")
+        if isinstance(node, (str, int, float, bool)) or node is None:
+            return lambda f, s: node
+        raise ValueError(f"unsupported CQL2 value {json.dumps(node)}")
+
+    def _typed_pair(self, left: Any, right: Any) -> Tuple[Expression, Expression]:
+        # compared with a timestamp or date literal, a property is parsed as one
+        a, b = self._value(left), self._value(right)
+        parse = _literal_parser(left) or _literal_parser(right)
+        if parse is None:
+            return a, b
+        return (lambda f, s: parse(a(f, s))), (lambda f, s: parse(b(f, s)))
+
+    def _comparison(
+        self, compare: Callable[[Any, Any], bool], left: Any, right: Any
+    ) -> Expression:
+        a, b = self._typed_pair(left, right)
+
+        def comparison(f: Dict[str, Any], s: Spatial) -> Optional[bool]:
+            x, y = a(f, s), b(f, s)
+            if x is None or y is None:
+                return None
+            try:
+                return compare(x, y)
+            except TypeError:
+                # values of different types are neither equal nor ordered
+                return compare is operator.ne
+
+        return comparison
+
+    def _like(self, value: Any, pattern: Any) -> Expression:
+        get = self._value(value)
+        regex = like_pattern(pattern)
+
+        def like(f: Dict[str, Any], s: Spatial) -> Optional[bool]:
+            x = get(f, s)
+            return None if x is None else regex.fullmatch(str(x)) is not None
+
+        return like
+
+    def _between(self, value: Any, low: Any, high: Any) -> Expression:
+        lower = self._comparison(operator.ge, value, low)
+        upper = self._comparison(operator.le, value, high)
+        return lambda f, s: _all([lower(f, s), upper(f, s)])
+
+    def _in(self, value: Any, values: Any) -> Expression:
+        get = self._value(value)
+        candidates = [self._value(v)({}, ()) for v in values]
+
+        def contained(f: Dict[str, Any], s: Spatial) -> Optional[bool]:
+            x = get(f, s)
+            return None if x is None else x in candidates
+
+        return contained
+
+    def _spatial(self, op: str, left: Any, right: Any) -> Expression:
+        # one side is the feature's geometry, the other a literal geometry or bbox
+        swapped = not (isinstance(left, dict) and "property" in left)
+        literal = left if swapped else right
+        if isinstance(literal, dict) and "bbox" in literal:
+            bbox = literal["bbox"]
+            if len(bbox) == 6:
+                bbox = bbox[:2] + bbox[3:5]
+            query = shapely.box(*bbox)
+        else:
+            query = shapely.from_geojson(json.dumps(literal))
+        shapely.prepare(query)
+        relation = {
+            "s_intersects": shapely.intersects,
+            "s_disjoint": shapely.disjoint,
+            # the feature within the literal is the literal containing the feature
+            "s_within": shapely.within if swapped else shapely.contains,
+            "s_contains": shapely.contains if swapped else shapely.within,
+        }[op]
+        index = len(self._page_steps)
+
+        def evaluate_page(geometries: np.ndarray) -> List[Any]:
+            related = relation(query, geometries).tolist()
+            missing = shapely.is_missing(geometries).tolist()
+            return [None if m else r for m, r in zip(missing, related)]
+
+        self._page_steps.append(evaluate_page)
+        return lambda f, s: s[index]
+
+    def _temporal(self, value: Any, interval: Any) -> Expression:
+        start, end = (
+            None if bound in ("..", None) else _timestamp(bound)
+            for bound in interval["interval"]
+        )
+        get = self._value(value)
+        datetime_property = isinstance(value, dict) and value.get("property") in (
+            "datetime",
+            "properties.datetime",
+        )
+
+        def intersects(f: Dict[str, Any], s: Spatial) -> Optional[bool]:
+            instant = _timestamp(get(f, s))
+            first = last = instant
+            if instant is None and datetime_property:
+                # an item with a null datetime covers its start to end datetimes
+                properties = f.get("properties") or {}
+                first = _timestamp(properties.get("start_datetime"))
+                last = _timestamp(properties.get("end_datetime"))
+            if first is None or last is None:
+                return None
+            return (end is None or first <= end) and (start is None or start <= last)
+
+        return intersects
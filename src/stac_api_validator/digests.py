@@ -0,0 +1,185 @@
+"""Memory-bounded duplicate detection over (collection, id) digests."""
+
+import hashlib
+import math
+from array import array
+from collections import Counter
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
+
+
+# Memory per million items:
+#  - exact mode keeps 8 byte digests in an open addressing table that is at most half
+#    full, so between 8 and 16 MiB (16 MiB at exactly one million)
+#  - Bloom mode keeps ~14.4 bits per item at a 0.1% false positive rate, so ~1.7 MiB,
+#    plus a 16 MiB per million table of the candidate duplicates it flags
+# compared with hundreds of MiB for a set of id strings, or GiBs for the item dicts.
+
+DEFAULT_FALSE_POSITIVE_RATE = 0.001
+MAX_LOAD_FACTOR = 0.5
+MASK_64 = 2**64 - 1
+# odd, so multiplying by it mod 2^64 is a bijection
+ROLLING_MULTIPLIER = 0x100000001B3
+
+
+def item_digest(collection: Optional[str], item_id: str) -> int:
+    # 64 bits collide with probability ~n^2 / 2^65, negligible at millions of items
+    key = f"{collection or ''}\0{item_id}".encode()
+    digest = int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+    # zero marks an empty slot
+    return digest or 1
+
+
+class DigestSet:
+    def __init__(self, capacity: int = 1024) -> None:
+        size = 1 << max(4, math.ceil(math.log2(max(capacity, 1) / MAX_LOAD_FACTOR)))
+        self.slots = array("Q", bytes(8 * size))
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def nbytes(self) -> int:
+        return self.slots.itemsize * len(self.slots)
+
+    def _find(self, digest: int) -> int:
+        # linear probing, the index of the digest's slot or of the empty slot ending its run
+        mask = len(self.slots) - 1
+        i = digest & mask
+        while (slot := self.slots[i]) and slot != digest:
+            i = (i + 1) & mask
+        return i
+
+    def __contains__(self, digest: int) -> bool:
+        return self.slots[self._find(digest)] == digest
+
+    def add(self, digest: int) -> bool:
+        # True if the digest was not already present
+        i = self._find(digest)
+        if self.slots[i]:
+            return False
+        self.slots[i] = digest
+        self.count += 1
+        if self.count > len(self.slots) * MAX_LOAD_FACTOR:
+            self._grow()
+        return True
+
+    def _grow(self) -> None:
+        old = self.slots
+        self.slots = array("Q", bytes(16 * len(old)))
+        for digest in old:
+            if digest:
+                self.slots[self._find(digest)] = digest
+
+
+class BloomFilter:
+    def __init__(
+        self,
+        expected_items: int,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+    ) -> None:
+        n = max(expected_items, 1)
+        self.size = max(
+            64, math.ceil(-n * math.log(false_positive_rate) / math.log(2) ** 2)
+        )
+        self.hashes = max(1, round(self.size / n * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.bits)
+
+    def add(self, digest: int) -> bool:
+        # True if the digest may already have been added; False is never wrong
+        h1 = digest & 0xFFFFFFFF
+        # odd, so the probe sequence does not collapse onto a few bits
+        h2 = (digest >> 32) | 1
+        present = True
+        for i in range(self.hashes):
+            position = (h1 + i * h2) % self.size
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                present = False
+                self.bits[byte] |= 1 << bit
+        return present
+
+
+# Counts repeated (collection, id) pairs without keeping the items. In Bloom mode, add
+# only flags candidate duplicates, and the true duplicates are counted by confirm when
+# given the same sequence of items a second time.
+class DuplicateDetector:
+    def __init__(
+        self,
+        bloom: bool = False,
+        expected_items: int = 1024,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+    ) -> None:
+        self.bloom = BloomFilter(expected_items, false_positive_rate) if bloom else None
+        self.digests = DigestSet(expected_items if not bloom else 1024)
+        self.items = 0
+        self.duplicates = 0
+        self.confirmed = not bloom
+
+    @property
+    def nbytes(self) -> int:
+        return self.digests.nbytes + (self.bloom.nbytes if self.bloom else 0)
+
+    @property
+    def needs_confirmation(self) -> bool:
+        return not self.confirmed and len(self.digests) > 0
+
+    def add(self, collection: Optional[str], item_id: str) -> bool:
+        # True if the item is a duplicate (in Bloom mode, a candidate duplicate)
+        self.items += 1
+        digest = item_digest(collection, item_id)
+        if self.bloom is not None:
+            if self.bloom.add(digest):
+                self.digests.add(digest)
+                return True
+            return False
+        if self.digests.add(digest):
+            return False
+        self.duplicates += 1
+        return True
+
+    def confirm(self, keys: Iterable[Tuple[Optional[str], str]]) -> int:
+        # exact occurrences of only the candidates, so a false positive costs nothing
+        occurrences: "Counter[int]" = Counter()
+        for collection, item_id in keys:
+            if (digest := item_digest(collection, item_id)) in self.digests:
+                occurrences[digest] += 1
+        self.duplicates = sum(n - 1 for n in occurrences.values() if n > 1)
+        self.confirmed = True
+        return self.duplicates
+
+
+# Summarizes a stream of (collection, id) pairs in constant memory, so two streams
+# can be compared without keeping either: the ordered digest changes with the order
+# of the items, and the sum is of the multiset of items regardless of order.
+class StreamDigest:
+    def __init__(self) -> None:
+        self.count = 0
+        self.ordered = 0
+        self.total = 0
+
+    def add(self, collection: Optional[str], item_id: str) -> int:
+        digest = item_digest(collection, item_id)
+        self.count += 1
+        self.ordered = (self.ordered * ROLLING_MULTIPLIER + digest) & MASK_64
+        self.total = (self.total + digest) & MASK_64
+        return digest
+
+    def same_items(self, other: "StreamDigest") -> bool:
+        return (self.count, self.total) == (other.count, other.total)
+
+    def same_order(self, other: "StreamDigest") -> bool:
+        return self.same_items(other) and self.ordered == other.ordered
+
+    def extra_digest(self, other: "StreamDigest") -> Optional[int]:
+        # the digest of the one item this stream has more than the other, if that is
+        # the only difference between them
+        if self.count != other.count + 1:
+            return None
+        return (self.total - other.total) & MASK_64
@@ -1,3 +1,9 @@
+import math
+from typing import Any
+from typing import Dict
+from typing import Tuple
+
+
 point = {"type": "Point", "coordinates": [100.0, 0.0]}
 
 linestring = {"type": "LineString", "coordinates": [[100.0, 0.0], [101.0, 1.0]]}
@@ -42,3 +48,50 @@ geometry_collection = {
         {"type": "LineString", "coordinates": [[101.0, 0.0], [102.0, 1.0]]},
     ],
 }
+
+
+# Valid polygons of any number of vertices, for probing how an API copes with complex
+# areas of interest: a star inscribed in the bounds, its points alternating between two
+# radii at increasing angles, so the ring never crosses itself
+def complex_polygon(
+    bounds: Tuple[float, float, float, float], vertices: int
+) -> Dict[str, Any]:
+    min_x, min_y, max_x, max_y = bounds
+    center_x, center_y = (min_x + max_x) / 2, (min_y + max_y) / 2
+    radius_x, radius_y = (max_x - min_x) / 2, (max_y - min_y) / 2
+    vertices = max(vertices, 3)
+    ring = []
+    for i in range(vertices):
+        angle = 2 * math.pi * i / vertices
+        scale = 1.0 if i % 2 == 0 else 0.8
+        ring.append(
+            [
+                round(center_x + radius_x * scale * math.cos(angle), 7),
+                round(center_y + radius_y * scale * math.sin(angle), 7),
+            ]
+        )
+    ring.append(ring[0])
+    return {"type": "Polygon", "coordinates": [ring]}
+
+
+def complex_multipolygon(
+    bounds: Tuple[float, float, float, float], vertices: int, parts: int = 4
+) -> Dict[str, Any]:
+    # one polygon in each of a row of cells, so the parts do not overlap
+    min_x, min_y, max_x, max_y = bounds
+    width = (max_x - min_x) / parts
+    return {
+        "type": "MultiPolygon",
+        "coordinates": [
+            complex_polygon(
+                (
+                    min_x + width * (i + 0.05),
+                    min_y,
+                    min_x + width * (i + 0.95),
+                    max_y,
+                ),
+                vertices // parts,
+            )["coordinates"]
+            for i in range(parts)
+        ],
+    }
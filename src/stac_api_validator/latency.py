@@ -0,0 +1,103 @@
+"""Per-page latency profiles of paginated responses."""
+
+import math
+from dataclasses import dataclass
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+
+# fewer pages than this are too noisy to fit a trend to
+MIN_TREND_PAGES = 5
+# fitted latency at the last page, as a multiple of that at the first page
+DEFAULT_MIN_GROWTH = 2.0
+DEFAULT_MIN_CORRELATION = 0.5
+
+
+@dataclass(frozen=True)
+class PageTiming:
+    page: int
+    seconds: float
+    size: int
+    items: int = 0
+
+
+def linear_fit(xs: Sequence[float], ys: Sequence[float]) -> Tuple[float, float, float]:
+    # least squares slope and intercept, and the Pearson correlation coefficient
+    n = len(xs)
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    syy = sum((y - mean_y) ** 2 for y in ys)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    if sxx == 0:
+        return 0.0, mean_y, 0.0
+    slope = sxy / sxx
+    r = sxy / math.sqrt(sxx * syy) if syy else 0.0
+    return slope, mean_y - slope * mean_x, r
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    # linear interpolation between closest ranks, q in [0, 1]
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class LatencyProfile:
+    def __init__(self) -> None:
+        self.pages: List[PageTiming] = []
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def record(self, seconds: float, size: int, items: int = 0) -> None:
+        self.pages.append(PageTiming(len(self.pages) + 1, seconds, size, items))
+
+    @property
+    def seconds(self) -> float:
+        return sum(p.seconds for p in self.pages)
+
+    @property
+    def size(self) -> int:
+        return sum(p.size for p in self.pages)
+
+    @property
+    def items(self) -> int:
+        return sum(p.items for p in self.pages)
+
+    def latency_percentile(self, q: float) -> float:
+        return percentile([p.seconds for p in self.pages], q)
+
+    def trend(self) -> Tuple[float, float, float]:
+        # seconds per page of depth, fitted seconds at page 0, correlation
+        return linear_fit([p.page for p in self.pages], [p.seconds for p in self.pages])
+
+    def size_trend(self) -> Tuple[float, float, float]:
+        return linear_fit([p.page for p in self.pages], [p.size for p in self.pages])
+
+    def fitted(self, page: int) -> float:
+        slope, intercept, _ = self.trend()
+        return intercept + slope * page
+
+    def growth(self) -> float:
+        # the fitted latency at the last page over that at the first, floored at the
+        # fastest page so a steep fit through zero does not divide by nothing
+        first = max(self.fitted(1), min(p.seconds for p in self.pages))
+        return self.fitted(len(self.pages)) / first if first > 0 else 1.0
+
+    def degrades(
+        self,
+        min_growth: float = DEFAULT_MIN_GROWTH,
+        min_correlation: float = DEFAULT_MIN_CORRELATION,
+    ) -> bool:
+        if len(self.pages) < MIN_TREND_PAGES:
+            return False
+        _, _, r = self.trend()
+        return r >= min_correlation and self.growth() >= min_growth
+
+    def first_over_budget(self, budget: float) -> Optional[PageTiming]:
+        return next((p for p in self.pages if p.seconds > budget), None)
@@ -0,0 +1,61 @@
+"""Memoization of validation findings by object content."""
+
+import hashlib
+import json
+import threading
+from collections import Counter
+from collections import OrderedDict
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+# ("error" or "warning", whether the message is relative to the object's url, message)
+Finding = Tuple[str, bool, str]
+
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+def content_digest(body: Any, settings: Any) -> str:
+    # canonical JSON, so key order and whitespace differences hash the same
+    canonical = json.dumps(
+        [body, settings],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class VerdictCache:
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        # least recently used first, so memory stays bounded on very long runs
+        self.entries: "OrderedDict[str, Tuple[List[Finding], float]]" = OrderedDict()
+        self.lookups: "Counter[str]" = Counter()
+        self.hits: "Counter[str]" = Counter()
+        self.seconds_saved = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, kind: str, key: str) -> Optional[List[Finding]]:
+        with self._lock:
+            self.lookups[kind] += 1
+            if (entry := self.entries.get(key)) is None:
+                return None
+            self.entries.move_to_end(key)
+            self.hits[kind] += 1
+            findings, seconds = entry
+            self.seconds_saved += seconds
+            return findings
+
+    def put(self, key: str, findings: List[Finding], seconds: float) -> None:
+        with self._lock:
+            self.entries[key] = (findings, seconds)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
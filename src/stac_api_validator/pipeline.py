@@ -0,0 +1,98 @@
+"""Prefetching of paginated responses, overlapping fetching with processing."""
+
+import queue
+import threading
+import time
+from typing import Any
+from typing import Generic
+from typing import Iterator
+from typing import Tuple
+from typing import TypeVar
+
+
+DEFAULT_PREFETCH_PAGES = 2
+
+T = TypeVar("T")
+
+_ITEM, _DONE, _ERROR = range(3)
+
+
+# Pulls from the source in a thread, so the next page is requested as soon as the
+# previous one is parsed rather than when the consumer is done with it. At most depth
+# pages wait in the buffer, so memory stays bounded however slow the consumer is.
+class Prefetcher(Generic[T]):
+    def __init__(
+        self, source: Iterator[T], depth: int = DEFAULT_PREFETCH_PAGES
+    ) -> None:
+        self.source = source
+        self.buffer: "queue.Queue[Tuple[int, Any]]" = queue.Queue(maxsize=max(depth, 1))
+        # time spent in the source, by the consumer between pages, and by the consumer
+        # waiting on an empty buffer
+        self.fetch_seconds = 0.0
+        self.process_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.wall_seconds = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._fetch, daemon=True)
+
+    @property
+    def overlap_seconds(self) -> float:
+        return max(0.0, self.fetch_seconds + self.process_seconds - self.wall_seconds)
+
+    def __iter__(self) -> Iterator[T]:
+        start = time.perf_counter()
+        self._thread.start()
+        try:
+            while True:
+                waiting = time.perf_counter()
+                kind, value = self.buffer.get()
+                resumed = time.perf_counter()
+                self.wait_seconds += resumed - waiting
+                if kind == _DONE:
+                    return
+                if kind == _ERROR:
+                    raise value
+                yield value
+                self.process_seconds += time.perf_counter() - resumed
+        finally:
+            self.close()
+            self.wall_seconds = time.perf_counter() - start
+
+    def close(self) -> None:
+        self._stop.set()
+        # unblock a producer waiting on a full buffer
+        while True:
+            try:
+                self.buffer.get_nowait()
+            except queue.Empty:
+                break
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _put(self, kind: int, value: Any) -> None:
+        while not self._stop.is_set():
+            try:
+                self.buffer.put((kind, value), timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def _fetch(self) -> None:
+        try:
+            while not self._stop.is_set():
+                start = time.perf_counter()
+                try:
+                    value = next(self.source)
+                except StopIteration:
+                    self._put(_DONE, None)
+                    return
+                finally:
+                    self.fetch_seconds += time.perf_counter() - start
+                self._put(_ITEM, value)
+        except BaseException as e:
+            # whatever ended the source is raised to the consumer, as if it were
+            # iterating the source itself
+            self._put(_ERROR, e)
+        finally:
+            if close := getattr(self.source, "close", None):
+                close()
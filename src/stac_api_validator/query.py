@@ -0,0 +1,100 @@
+"""Query Extension operators, and the predicates their results must satisfy."""
+
+import json
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+
+Predicate = Callable[[Any], bool]
+
+
+def _comparison(compare: Callable[[float, float], bool]) -> Callable[[Any], Predicate]:
+    def predicate(value: Any) -> Predicate:
+        # the value is converted once, not once per feature
+        target = float(value)
+        return lambda x: (
+            isinstance(x, (int, float))
+            and not isinstance(x, bool)
+            and compare(x, target)
+        )
+
+    return predicate
+
+
+def _not_equal(value: Any) -> Predicate:
+    # a missing or non-numeric property is not equal to the number
+    target = float(value)
+    return lambda x: x != target
+
+
+def _starts_with(value: Any) -> Predicate:
+    prefix = str(value)
+    return lambda x: str(x).startswith(prefix)
+
+
+def _ends_with(value: Any) -> Predicate:
+    suffix = str(value)
+    return lambda x: str(x).endswith(suffix)
+
+
+def _contains(value: Any) -> Predicate:
+    substring = str(value)
+    return lambda x: substring in str(x)
+
+
+def _in(values: Any) -> Predicate:
+    # an array property matches if any of its values are in the query's values
+    targets = frozenset(values)
+    return lambda x: any(
+        isinstance(v, str) and v in targets or str(v) in targets
+        for v in (x if isinstance(x, list) else [x])
+    )
+
+
+# Each operator's predicate factory, given the query's value, returns the test every
+# result's property value must pass. Adding an operator is adding a row.
+OPERATORS: Dict[str, Callable[[Any], Predicate]] = {
+    "eq": _comparison(lambda x, v: x == v),
+    "neq": _not_equal,
+    "lt": _comparison(lambda x, v: x < v),
+    "lte": _comparison(lambda x, v: x <= v),
+    "gt": _comparison(lambda x, v: x > v),
+    "gte": _comparison(lambda x, v: x >= v),
+    "startsWith": _starts_with,
+    "endsWith": _ends_with,
+    "contains": _contains,
+    "in": _in,
+}
+
+
+@dataclass
+class QueryProbe:
+    property_name: str
+    operator: str
+    value: Any
+    predicate: Predicate = field(init=False, repr=False)
+    text: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # compiled once, however many requests and features it is checked against
+        self.predicate = OPERATORS[self.operator](self.value)
+        self.text = json.dumps(self.query)
+
+    @property
+    def query(self) -> Dict[str, Any]:
+        return {self.property_name: {self.operator: self.value}}
+
+    def values(self, features: List[Any]) -> List[Any]:
+        return [
+            (f.get("properties") or {}).get(self.property_name)
+            if isinstance(f, dict)
+            else None
+            for f in features
+        ]
+
+    def non_matching(self, features: List[Any]) -> List[Any]:
+        return [v for v in self.values(features) if not self.predicate(v)]
@@ -0,0 +1,106 @@
+"""Stratified item sampling over a collection's extent."""
+
+import math
+import random
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+BBox = Tuple[float, float, float, float]
+
+WORLD_BBOX: BBox = (-180.0, -90.0, 180.0, 90.0)
+# used when a collection's temporal extent is open at the start
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    dt = datetime.fromisoformat(value.replace("z", "Z").replace("Z", "+00:00"))
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def format_datetime(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def collection_extent(
+    collection: Dict[str, Any], now: Optional[datetime] = None
+) -> Tuple[BBox, datetime, datetime]:
+    extent = collection.get("extent") or {}
+    try:
+        bbox = extent["spatial"]["bbox"][0]
+        if len(bbox) == 6:
+            bbox = [bbox[0], bbox[1], bbox[3], bbox[4]]
+        spatial: BBox = (
+            float(bbox[0]),
+            float(bbox[1]),
+            float(bbox[2]),
+            float(bbox[3]),
+        )
+    except (KeyError, IndexError, TypeError, ValueError):
+        spatial = WORLD_BBOX
+
+    try:
+        start, end = extent["temporal"]["interval"][0]
+    except (KeyError, IndexError, TypeError, ValueError):
+        start, end = None, None
+
+    return (
+        spatial,
+        parse_datetime(start) or EPOCH,
+        parse_datetime(end) or now or datetime.now(timezone.utc),
+    )
+
+
+def strata(
+    bbox: BBox, start: datetime, end: datetime, count: int, seed: int
+) -> List[Tuple[str, List[float]]]:
+    # each stratum is its own slice of the temporal extent, paired with a cell of a
+    # grid over the bbox by a seeded permutation, so the sample spreads over time and space
+    rng = random.Random(seed)
+    min_x, min_y, max_x, max_y = bbox
+    if min_x > max_x:
+        # crosses the antimeridian
+        max_x += 360
+
+    side = math.ceil(math.sqrt(count))
+    cells = [(i, j) for i in range(side) for j in range(side)]
+    rng.shuffle(cells)
+    cell_width = (max_x - min_x) / side
+    cell_height = (max_y - min_y) / side
+    step = (end - start) / count
+
+    result = []
+    for n in range(count):
+        i, j = cells[n % len(cells)]
+        west = min_x + i * cell_width
+        east = west + cell_width
+        result.append(
+            (
+                f"{format_datetime(start + step * n)}/{format_datetime(start + step * (n + 1))}",
+                [
+                    west - 360 if west >= 180 else west,
+                    min_y + j * cell_height,
+                    east - 360 if east > 180 else east,
+                    min_y + (j + 1) * cell_height,
+                ],
+            )
+        )
+    return result
+
+
+def wilson_interval(failures: int, total: int, z: float = 1.96) -> Tuple[float, float]:
+    # Wilson score interval for a binomial proportion, 95% by default
+    if total == 0:
+        return 0.0, 1.0
+    p = failures / total
+    denominator = 1 + z**2 / total
+    center = (p + z**2 / (2 * total)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / total + z**2 / (4 * total**2)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
@@ -0,0 +1,418 @@
+"""Offline STAC JSON Schema store."""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
+from urllib.parse import urljoin
+from urllib.parse import urlparse
+
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+from referencing import Registry
+from referencing import Resource
+from referencing.jsonschema import DRAFT7
+from requests import RequestException
+from requests import Session
+from stac_validator import utilities as stac_validator_utilities
+from stac_validator.stac_validator import StacValidate
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCHEMA_BUNDLE_DIR = Path.home() / ".cache" / "stac-api-validator" / "schemas"
+
+STAC_VERSIONS = ["1.0.0", "1.1.0"]
+
+core_schema_urls = [
+    f"https://schemas.stacspec.org/v{version}/{spec}-spec/json-schema/{spec}.json"
+    for version in STAC_VERSIONS
+    for spec in ["catalog", "collection", "item"]
+]
+
+extension_schema_urls = [
+    "https://stac-extensions.github.io/eo/v1.0.0/schema.json",
+    "https://stac-extensions.github.io/eo/v1.1.0/schema.json",
+    "https://stac-extensions.github.io/projection/v1.0.0/schema.json",
+    "https://stac-extensions.github.io/projection/v1.1.0/schema.json",
+    "https://stac-extensions.github.io/projection/v2.0.0/schema.json",
+    "https://stac-extensions.github.io/view/v1.0.0/schema.json",
+    "https://stac-extensions.github.io/sat/v1.0.0/schema.json",
+    "https://stac-extensions.github.io/raster/v1.1.0/schema.json",
+    "https://stac-extensions.github.io/file/v2.1.0/schema.json",
+    "https://stac-extensions.github.io/scientific/v1.0.0/schema.json",
+    "https://stac-extensions.github.io/timestamps/v1.1.0/schema.json",
+    "https://stac-extensions.github.io/processing/v1.1.0/schema.json",
+    "https://stac-extensions.github.io/sar/v1.0.0/schema.json",
+    "https://stac-extensions.github.io/mgrs/v1.0.0/schema.json",
+    "https://stac-extensions.github.io/grid/v1.1.0/schema.json",
+    "https://stac-extensions.github.io/item-assets/v1.0.0/schema.json",
+    "https://stac-extensions.github.io/storage/v1.0.0/schema.json",
+    "https://stac-extensions.github.io/version/v1.0.0/schema.json",
+]
+
+# the JSON Schema meta-schemas ship with jsonschema, so never bundle them
+meta_schema_hosts = {"json-schema.org"}
+
+# versions published on schemas.stacspec.org, older ones are left to stac-validator
+indexed_stac_versions = [
+    "1.0.0-beta.2",
+    "1.0.0-rc.1",
+    "1.0.0-rc.2",
+    "1.0.0-rc.3",
+    "1.0.0-rc.4",
+    "1.0.0",
+    "1.1.0-beta.1",
+    "1.1.0",
+]
+
+core_specs = {"Feature": "item", "Collection": "collection", "Catalog": "catalog"}
+
+Signature = Tuple[str, str, FrozenSet[str]]
+
+
+def core_schema_url(stac_type: str, stac_version: str) -> Optional[str]:
+    if stac_version not in indexed_stac_versions or not (
+        spec := core_specs.get(stac_type)
+    ):
+        return None
+    return f"https://schemas.stacspec.org/v{stac_version}/{spec}-spec/json-schema/{spec}.json"
+
+
+# http and https URLs of a schema resolve to the same entry
+def schema_key(url: str) -> str:
+    parsed = urlparse(url)
+    if parsed.scheme in ("http", "https"):
+        return f"{parsed.netloc}{parsed.path}"
+    return url.split("#", 1)[0]
+
+
+def is_remote(url: str) -> bool:
+    return urlparse(url).scheme in ("http", "https")
+
+
+def bundle_path(bundle_dir: Path, url: str) -> Path:
+    return bundle_dir / schema_key(url)
+
+
+def schema_refs(schema: Any) -> Iterator[str]:
+    if isinstance(schema, dict):
+        for key, value in schema.items():
+            if key == "$ref" and isinstance(value, str):
+                yield value
+            else:
+                yield from schema_refs(value)
+    elif isinstance(schema, list):
+        for value in schema:
+            yield from schema_refs(value)
+
+
+# Bundled schemas are laid out by URL (<host>/<path>), as written by
+# refresh_schema_bundle. Schemas in schema_dir are indexed by their $id, so they
+# can be named and nested freely, and they win over bundled schemas.
+class SchemaStore:
+    def __init__(
+        self,
+        bundle_dir: Optional[Union[str, Path]] = DEFAULT_SCHEMA_BUNDLE_DIR,
+        schema_dir: Optional[Union[str, Path]] = None,
+    ) -> None:
+        self.bundle_dir = bundle_dir
+        self.schema_dir = schema_dir
+        self.schemas: Dict[str, Path] = {}
+        self.remote_fetches: List[str] = []
+        self._fetch: Callable[..., Dict[str, Any]] = (
+            stac_validator_utilities.fetch_and_parse_file
+        )
+
+        if bundle_dir is not None and (bundle := Path(bundle_dir)).is_dir():
+            for path in bundle.rglob("*.json"):
+                self.schemas[path.relative_to(bundle).as_posix()] = path
+
+        if schema_dir is not None:
+            if not (user_dir := Path(schema_dir)).is_dir():
+                raise ValueError(f"schema directory {schema_dir} does not exist")
+            for path in user_dir.rglob("*.json"):
+                try:
+                    with open(path) as f:
+                        schema_id = json.load(f).get("$id")
+                except (OSError, ValueError, AttributeError) as e:
+                    logger.warning(f"Could not read schema {path}, ignoring it: {e}")
+                    continue
+                if not schema_id:
+                    logger.warning(f"Schema {path} does not define '$id', ignoring it")
+                    continue
+                self.schemas[schema_key(schema_id)] = path
+
+    def __contains__(self, url: str) -> bool:
+        return self.path_for(url) is not None
+
+    def __len__(self) -> int:
+        return len(self.schemas)
+
+    def path_for(self, url: str) -> Optional[Path]:
+        return self.schemas.get(schema_key(url))
+
+    def fetch(
+        self, input_path: str, headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        if path := self.path_for(input_path):
+            with open(path) as f:
+                schema: Dict[str, Any] = json.load(f)
+                return schema
+
+        if is_remote(input_path) and input_path not in self.remote_fetches:
+            logger.debug(f"schema not found in offline store, fetching: {input_path}")
+            self.remote_fetches.append(input_path)
+
+        return self._fetch(input_path, headers)
+
+    def install(self) -> None:
+        # stac-validator (and stac-check, which delegates to it) loads every
+        # schema through this module-level function, so swapping it out routes
+        # all schema resolution through the store
+        self._fetch = stac_validator_utilities.fetch_and_parse_file
+        stac_validator_utilities.fetch_and_parse_file = self.fetch
+
+    def uninstall(self) -> None:
+        stac_validator_utilities.fetch_and_parse_file = self._fetch
+
+    @contextmanager
+    def installed(self) -> Iterator["SchemaStore"]:
+        self.install()
+        try:
+            yield self
+        finally:
+            self.uninstall()
+
+
+# Every object sharing a type, stac_version and set of stac_extensions is validated
+# by the same composed validator, whose registry already holds every schema
+# reachable from the core and extension schemas, so no $ref is resolved twice.
+class ValidatorIndex:
+    def __init__(self, schema_store: SchemaStore) -> None:
+        self.schema_store = schema_store
+        self.validators: Dict[Signature, Optional[Validator]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.build_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.validators)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @staticmethod
+    def signature(body: Dict[str, Any]) -> Optional[Signature]:
+        extensions = body.get("stac_extensions") or []
+        if not isinstance(extensions, list) or not all(
+            isinstance(x, str) and is_remote(x) for x in extensions
+        ):
+            return None
+        return (
+            str(body.get("type")),
+            str(body.get("stac_version")),
+            frozenset(extensions),
+        )
+
+    def validator_for(self, body: Dict[str, Any]) -> Optional[Validator]:
+        if not (signature := self.signature(body)):
+            return None
+
+        # shared by the deep collection validation threads
+        with self._lock:
+            if signature in self.validators:
+                self.hits += 1
+                return self.validators[signature]
+
+            self.misses += 1
+            start = time.perf_counter()
+            try:
+                self.validators[signature] = self._build(*signature)
+            except (OSError, ValueError, RequestException) as e:
+                # a schema that cannot be read, parsed or fetched
+                logger.warning(
+                    f"Could not build a schema validator for {signature}: {e}"
+                )
+                self.validators[signature] = None
+            self.build_seconds += time.perf_counter() - start
+            return self.validators[signature]
+
+    def validate(self, body: Dict[str, Any]) -> Optional[List[str]]:
+        if not (validator := self.validator_for(body)):
+            return None
+
+        if not (errors := list(validator.iter_errors(body))):
+            return []
+
+        error = best_match(errors)
+        path = " -> ".join(str(x) for x in error.absolute_path)
+        return [f"{error.message}{f'. Error is in {path}' if path else ''}"]
+
+    def _build(
+        self, stac_type: str, stac_version: str, extensions: FrozenSet[str]
+    ) -> Optional[Validator]:
+        if not (core_url := core_schema_url(stac_type, stac_version)):
+            return None
+
+        urls = [core_url, *sorted(extensions)]
+        resources: Dict[str, Resource[Any]] = {}
+        queue = list(urls)
+        while queue:
+            url = queue.pop()
+            if url in resources:
+                continue
+            contents = self.schema_store.fetch(url)
+            resources[url] = Resource.from_contents(
+                contents, default_specification=DRAFT7
+            )
+            for ref in schema_refs(contents):
+                ref_url = urljoin(url, ref).split("#", 1)[0]
+                if (
+                    is_remote(ref_url)
+                    and urlparse(ref_url).netloc not in meta_schema_hosts
+                    and ref_url not in resources
+                ):
+                    queue.append(ref_url)
+
+        core_schema = resources[core_url].contents
+        cls = validator_for(core_schema, default=Draft7Validator)
+        schema = {"allOf": [{"$ref": url} for url in urls]}
+        registry: Registry[Any] = Registry().with_resources(resources.items())
+        return cls(schema, registry=registry.crawl())
+
+
+worker_validator_index: Optional[ValidatorIndex] = None
+
+
+def init_feature_worker(
+    bundle_dir: Optional[Union[str, Path]], schema_dir: Optional[Union[str, Path]]
+) -> None:
+    global worker_validator_index
+
+    (
+        schema_store := SchemaStore(bundle_dir=bundle_dir, schema_dir=schema_dir)
+    ).install()
+    worker_validator_index = ValidatorIndex(schema_store)
+
+    # build the plain Item validators up front, so they are ready before real work arrives
+    for version in STAC_VERSIONS:
+        worker_validator_index.validator_for(
+            {"type": "Feature", "stac_version": version}
+        )
+
+
+def validate_feature(feature: Dict[str, Any]) -> List[str]:
+    if (
+        worker_validator_index
+        and (messages := worker_validator_index.validate(feature)) is not None
+    ):
+        return messages
+
+    if not (validator := StacValidate()).validate_dict(feature):
+        return [
+            str(message.get("error_message", message))
+            for message in validator.message
+            if isinstance(message, dict)
+        ] or [str(validator.message)]
+    return []
+
+
+class FeatureValidationPool:
+    def __init__(self, schema_store: SchemaStore, workers: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=init_feature_worker,
+            initargs=(schema_store.bundle_dir, schema_store.schema_dir),
+        )
+
+    def __enter__(self) -> "FeatureValidationPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(cancel_futures=True)
+
+    def validate(self, features: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        # large chunks amortize the cost of pickling features over to the workers,
+        # while still leaving a few chunks per worker to balance the load
+        chunksize = max(1, len(features) // (self.workers * 4))
+        findings: Dict[str, List[str]] = {}
+        for i, (feature, messages) in enumerate(
+            zip(
+                features,
+                self.executor.map(validate_feature, features, chunksize=chunksize),
+            )
+        ):
+            if messages:
+                item_id = str(feature.get("id") or f"features[{i}]")
+                findings.setdefault(item_id, []).extend(messages)
+        return findings
+
+
+def refresh_schema_bundle(
+    bundle_dir: Union[str, Path] = DEFAULT_SCHEMA_BUNDLE_DIR,
+    urls: Optional[List[str]] = None,
+    r_session: Optional[Session] = None,
+) -> Tuple[List[str], List[str]]:
+    bundle = Path(bundle_dir)
+    session = r_session or Session()
+
+    queue = [
+        url.split("#", 1)[0]
+        for url in (urls or core_schema_urls + extension_schema_urls)
+    ]
+    seen: Set[str] = {schema_key(url) for url in queue}
+    fetched: List[str] = []
+    failed: List[str] = []
+
+    while queue:
+        url = queue.pop(0)
+        try:
+            resp = session.get(url, timeout=30)
+            resp.raise_for_status()
+            schema = resp.json()
+        except (RequestException, ValueError) as e:
+            logger.warning(f"Could not fetch schema {url}: {e}")
+            failed.append(url)
+            continue
+
+        path = bundle_path(bundle, url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(schema, f, indent=2)
+        fetched.append(url)
+
+        for ref in schema_refs(schema):
+            ref_url = urljoin(url, ref).split("#", 1)[0]
+            if (
+                is_remote(ref_url)
+                and urlparse(ref_url).netloc not in meta_schema_hosts
+                and schema_key(ref_url) not in seen
+            ):
+                seen.add(schema_key(ref_url))
+                queue.append(ref_url)
+
+    return fetched, failed
@@ -0,0 +1,193 @@
+"""Streaming verification of the order of sorted search results."""
+
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+
+
+NAT = np.datetime64("NaT", "ns")
+TOP_LEVEL_FIELDS = ("id", "collection")
+
+
+def _split_offset(value: Any) -> Tuple[str, int]:
+    # the local date and time, and the UTC offset in minutes, of an RFC 3339 datetime
+    if not isinstance(value, str):
+        return "NaT", 0
+    value = value.strip()
+    if value[-1:] in ("Z", "z"):
+        return value[:-1], 0
+    if len(value) > 6 and value[-6] in "+-" and value[-3] == ":":
+        try:
+            minutes = int(value[-5:-3]) * 60 + int(value[-2:])
+        except ValueError:
+            return "NaT", 0
+        return value[:-6], -minutes if value[-6] == "-" else minutes
+    return value, 0
+
+
+def parse_datetimes(values: Sequence[Any]) -> np.ndarray:
+    # datetime64[ns] in UTC, with NaT for null and unparseable values, so instants
+    # with different offsets compare by when they are rather than how they are written
+    if all(isinstance(v, str) and v[-1:] == "Z" for v in values):
+        # the usual page, all in UTC, needs no offsets
+        try:
+            return np.array([v[:-1] for v in values], dtype="datetime64[ns]")
+        except ValueError:
+            pass
+    local, offsets = zip(*map(_split_offset, values)) if values else ((), ())
+    try:
+        parsed = np.array(local, dtype="datetime64[ns]")
+    except ValueError:
+        # one bad value fails the whole array, so only then parse them one at a time
+        parsed = np.array([_parse_one(v) for v in local], dtype="datetime64[ns]")
+    return np.asarray(parsed - np.array(offsets, dtype="timedelta64[m]"))
+
+
+def _parse_one(value: str) -> np.datetime64:
+    try:
+        return np.datetime64(value, "ns")
+    except ValueError:
+        return NAT
+
+
+# A field of a sortby, as in the "+field" or "-field" of a GET sortby, or a
+# {"field": ..., "direction": ...} of a POST sortby.
+@dataclass(frozen=True)
+class SortField:
+    field: str
+    descending: bool = False
+
+    @property
+    def text(self) -> str:
+        return f"{'-' if self.descending else '+'}{self.field}"
+
+    @property
+    def json(self) -> Dict[str, str]:
+        return {"field": self.field, "direction": "desc" if self.descending else "asc"}
+
+
+def parse_sortby(sortby: str) -> List[SortField]:
+    return [
+        SortField(part.lstrip("+-"), part.startswith("-"))
+        for part in (p.strip() for p in sortby.split(","))
+        if part.lstrip("+-")
+    ]
+
+
+def field_getter(field: str) -> Callable[[Dict[str, Any]], Any]:
+    # id and collection are top-level, and every other field is a property, named
+    # with or without the 'properties.' prefix
+    if field in TOP_LEVEL_FIELDS:
+        return lambda item: item.get(field)
+    name = field.removeprefix("properties.")
+    return lambda item: (item.get("properties") or {}).get(name)
+
+
+def compile_key(
+    fields: Sequence[SortField],
+) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+    # the getters are built once per sortby, so each item only pays for looking up
+    # the values of its sort fields
+    getters = tuple(field_getter(f.field) for f in fields)
+    return lambda item: tuple(get(item) for get in getters)
+
+
+def sortby_text(fields: Sequence[SortField]) -> str:
+    return ",".join(f.text for f in fields)
+
+
+def _looks_like_datetime(value: str) -> bool:
+    return len(value) >= 10 and value[4] == "-" and value[:4].isdigit()
+
+
+def sort_column(values: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    # the values of one sort field as an array that compares as the field sorts
+    # (numbers as numbers, datetimes as instants, other strings by code point), and
+    # which of them are missing; a field of mixed or other types cannot be compared
+    types = set(map(type, values))
+    nullable = type(None) in types
+    types.discard(type(None))
+    missing = (
+        np.array([v is None for v in values], dtype=bool)
+        if nullable
+        else np.zeros(len(values), dtype=bool)
+    )
+    if types <= {int, float, bool}:
+        if nullable:
+            values = [0 if v is None else v for v in values]
+        return np.array(values, dtype=float), missing
+    if types == {str}:
+        if _looks_like_datetime(next(v for v in values if v is not None)):
+            parsed = parse_datetimes(values)
+            if (np.isnat(parsed) == missing).all():
+                return parsed.astype(np.int64), missing
+        if nullable:
+            values = ["" if v is None else v for v in values]
+        return np.array(values, dtype=str), missing
+    return np.zeros(len(values)), np.ones(len(values), dtype=bool)
+
+
+def out_of_order(
+    columns: Sequence[np.ndarray], descending: Sequence[bool]
+) -> np.ndarray:
+    # indexes i of the rows followed by a row that should come before them, comparing
+    # the columns lexicographically, each in its own direction, for all pairs at once
+    pairs = len(columns[0]) - 1
+    decided = np.zeros(pairs, dtype=bool)
+    wrong = np.zeros(pairs, dtype=bool)
+    for column, desc in zip(columns, descending):
+        a, b = column[:-1], column[1:]
+        before, after = (a > b, a < b) if desc else (a < b, a > b)
+        wrong |= ~decided & after
+        decided |= before | after
+        if decided.all():
+            break
+    return np.flatnonzero(wrong)
+
+
+# Checks that a stream of pages is in order, within each page with vectorized
+# comparisons, and across pages against the last key of the previous page, which is
+# all that is kept between pages.
+class SortChecker:
+    def __init__(self, fields: Sequence[SortField]) -> None:
+        self.fields = list(fields)
+        self.key = compile_key(self.fields)
+        self.last: Optional[Tuple[Any, ...]] = None
+        self.last_label: Optional[str] = None
+        self.pages = 0
+        self.items = 0
+        self.unsortable = 0
+        self.out_of_order = 0
+
+    def check(
+        self, rows: Sequence[Tuple[Any, ...]], labels: Sequence[str]
+    ) -> List[Tuple[str, str]]:
+        # the (earlier, later) labels of each adjacent pair of rows out of order;
+        # rows missing a sort field are skipped, as their order is not specified
+        self.pages += 1
+        self.items += len(rows)
+        if self.last is not None:
+            rows = [self.last, *rows]
+            labels = [self.last_label or "", *labels]
+        if not rows:
+            return []
+
+        columns = [sort_column(values) for values in zip(*rows)]
+        keep = np.flatnonzero(~np.logical_or.reduce([m for _, m in columns]))
+        self.unsortable += len(rows) - len(keep)
+        if not len(keep):
+            return []
+
+        wrong = out_of_order(
+            [column[keep] for column, _ in columns], [f.descending for f in self.fields]
+        )
+        self.last, self.last_label = rows[keep[-1]], labels[keep[-1]]
+        self.out_of_order += len(wrong)
+        return [(labels[keep[i]], labels[keep[i + 1]]) for i in wrong]
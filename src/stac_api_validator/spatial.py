@@ -0,0 +1,178 @@
+"""Vectorized spatial checks of pages of search results."""
+
+import json
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import numpy as np
+import shapely
+
+
+# the largest query window, as a fraction of the extent of the indexed items
+DEFAULT_MAX_WINDOW_SIZE = 0.1
+# in degrees, so windows over a single point item are not empty
+MIN_WINDOW_SIZE = 0.01
+
+
+def page_geometries(features: List[Any]) -> np.ndarray:
+    # one GEOS parse of each geometry, with None for missing or unreadable geometries
+    return np.asarray(
+        shapely.from_geojson(
+            [
+                json.dumps(geometry)
+                if isinstance(feature, dict)
+                and isinstance(geometry := feature.get("geometry"), dict)
+                else None
+                for feature in features
+            ],
+            on_invalid="ignore",
+        )
+    )
+
+
+def query_geometry(geometry: Dict[str, Any]) -> shapely.Geometry:
+    # prepared once, so each intersects test against it reuses its spatial index
+    query = shapely.from_geojson(json.dumps(geometry))
+    shapely.prepare(query)
+    return query
+
+
+def non_intersecting(query: shapely.Geometry, features: List[Any]) -> List[int]:
+    # indexes of the features without a geometry that intersects the query, in a
+    # single vectorized call for the whole page
+    if not features:
+        return []
+    intersects = shapely.intersects(query, page_geometries(features))
+    return np.flatnonzero(~intersects).tolist()
+
+
+def page_bboxes(features: List[Any]) -> np.ndarray:
+    # (west, south, east, north) of each feature, from its bbox, or from the bounds of
+    # its geometry if it has no bbox, and NaN if it has neither
+    try:
+        # the usual page, in which every feature has a 2D bbox, converts in one call
+        boxes = np.array([feature["bbox"] for feature in features], dtype=float)
+        if boxes.shape == (len(features), 4):
+            return boxes
+    except (KeyError, TypeError, ValueError):
+        pass
+
+    boxes = np.full((len(features), 4), np.nan)
+    missing = []
+    for i, feature in enumerate(features):
+        bbox = feature.get("bbox") if isinstance(feature, dict) else None
+        if isinstance(bbox, list) and len(bbox) in (4, 6):
+            try:
+                boxes[i] = bbox if len(bbox) == 4 else bbox[:2] + bbox[3:5]
+                continue
+            except (TypeError, ValueError):
+                pass
+        missing.append(i)
+    if missing:
+        boxes[missing] = shapely.bounds(page_geometries([features[i] for i in missing]))
+    return boxes
+
+
+def longitude_intervals(west: Any, east: Any) -> List[Any]:
+    # a box whose west edge is east of its east edge crosses the antimeridian, and
+    # is split into its parts either side of it; NaN bounds never overlap anything
+    crosses = west > east
+    return [
+        (west, np.where(crosses, 180.0, east)),
+        (np.where(crosses, -180.0, np.nan), np.where(crosses, east, np.nan)),
+    ]
+
+
+def bbox_intersects(query: List[float], boxes: np.ndarray) -> np.ndarray:
+    if len(query) == 6:
+        query = query[:2] + query[3:5]
+    west, south, east, north = (float(x) for x in query)
+    latitudes = (boxes[:, 1] <= north) & (boxes[:, 3] >= south)
+    longitudes = np.zeros(len(boxes), dtype=bool)
+    for query_west, query_east in longitude_intervals(
+        np.float64(west), np.float64(east)
+    ):
+        for box_west, box_east in longitude_intervals(boxes[:, 0], boxes[:, 2]):
+            longitudes |= (box_west <= query_east) & (query_west <= box_east)
+    return latitudes & longitudes
+
+
+def outside_bbox(query: List[float], features: List[Any]) -> List[int]:
+    # indexes of the features that do not intersect the query bbox, in one pass
+    if not features:
+        return []
+    return np.flatnonzero(~bbox_intersects(query, page_bboxes(features))).tolist()
+
+
+# An STRtree over the geometries of a crawled slice of a collection, keyed by the
+# items' (collection, id) digests. It is built once from all the pages, then queried
+# with every query window in a single call.
+class ItemIndex:
+    def __init__(self) -> None:
+        self._digests: List[np.ndarray] = []
+        self._geometries: List[np.ndarray] = []
+        self.digests = np.empty(0, dtype=np.uint64)
+        self.geometries = np.empty(0, dtype=object)
+        self.tree: Optional[shapely.STRtree] = None
+
+    def __len__(self) -> int:
+        return len(self.digests)
+
+    def add(self, digests: List[int], features: List[Any]) -> None:
+        self._digests.append(np.array(digests, dtype=np.uint64))
+        self._geometries.append(page_geometries(features))
+
+    def build(self) -> None:
+        digests = np.concatenate([self.digests, *self._digests])
+        geometries = np.concatenate([self.geometries, *self._geometries])
+        # items without a usable geometry can never match a spatial search
+        present = ~(shapely.is_missing(geometries) | shapely.is_empty(geometries))
+        # and an item crawled twice is indexed once
+        _, first = np.unique(digests, return_index=True)
+        keep = np.intersect1d(first, np.flatnonzero(present))
+        self.digests, self.geometries = digests[keep], geometries[keep]
+        self._digests, self._geometries = [], []
+        self.tree = shapely.STRtree(self.geometries)
+
+    def bounds(self) -> np.ndarray:
+        return np.asarray(shapely.bounds(self.geometries))
+
+    def matches(self, windows: np.ndarray) -> List[np.ndarray]:
+        # the sorted digests of the items intersecting each (west, south, east, north)
+        # window, from one bulk query of the tree
+        if self.tree is None:
+            self.build()
+        boxes = shapely.box(windows[:, 0], windows[:, 1], windows[:, 2], windows[:, 3])
+        window, item = self.tree.query(boxes, predicate="intersects")  # type: ignore
+        order = np.lexsort((self.digests[item], window))
+        window, item = window[order], item[order]
+        splits = np.searchsorted(window, np.arange(1, len(windows)))
+        return np.split(self.digests[item], splits)
+
+
+def random_windows(
+    bounds: np.ndarray,
+    count: int,
+    seed: int = 0,
+    max_size: float = DEFAULT_MAX_WINDOW_SIZE,
+) -> np.ndarray:
+    # windows centred on a point of a randomly chosen item's bounds, so most contain
+    # some items, of up to max_size of the extent of all the items on each side
+    rng = np.random.default_rng(seed)
+    chosen = bounds[rng.integers(0, len(bounds), count)]
+    x = rng.uniform(chosen[:, 0], chosen[:, 2])
+    y = rng.uniform(chosen[:, 1], chosen[:, 3])
+    width = np.nanmax(bounds[:, 2]) - np.nanmin(bounds[:, 0])
+    height = np.nanmax(bounds[:, 3]) - np.nanmin(bounds[:, 1])
+    half_width = rng.uniform(0.0, max_size / 2, count) * max(width, MIN_WINDOW_SIZE)
+    half_height = rng.uniform(0.0, max_size / 2, count) * max(height, MIN_WINDOW_SIZE)
+    return np.column_stack(
+        [
+            np.maximum(x - half_width, -180.0),
+            np.maximum(y - half_height, -90.0),
+            np.minimum(x + half_width, 180.0),
+            np.minimum(y + half_height, 90.0),
+        ]
+    )
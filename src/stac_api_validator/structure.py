@@ -0,0 +1,114 @@
+"""Fast structural checks of STAC Items, run before full schema validation."""
+
+import zlib
+from typing import Any
+from typing import Dict
+from typing import List
+
+
+required_item_fields = [
+    "type",
+    "stac_version",
+    "id",
+    "geometry",
+    "bbox",
+    "links",
+    "assets",
+]
+
+
+def is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def item_structure_errors(item: Any) -> List[str]:
+    if not isinstance(item, dict):
+        return ["is not a JSON object"]
+
+    messages = []
+    for field in required_item_fields:
+        # a null geometry is allowed, in which case bbox is not required
+        if field not in item and not (field == "bbox" and item.get("geometry") is None):
+            messages.append(f"missing '{field}'")
+
+    if "type" in item and item["type"] != "Feature":
+        messages.append(f"'type' is '{item['type']}' instead of 'Feature'")
+
+    if "id" in item and not (isinstance(item["id"], str) and item["id"]):
+        messages.append("'id' is not a non-empty string")
+
+    if "stac_version" in item and not isinstance(item["stac_version"], str):
+        messages.append("'stac_version' is not a string")
+
+    if (geometry := item.get("geometry")) is not None and not (
+        isinstance(geometry, dict) and "type" in geometry
+    ):
+        messages.append("'geometry' is not a GeoJSON geometry")
+
+    if "bbox" in item and not (
+        isinstance(bbox := item["bbox"], list)
+        and len(bbox) in (4, 6)
+        and all(is_number(x) for x in bbox)
+    ):
+        messages.append("'bbox' is not an array of 4 or 6 numbers")
+
+    if not isinstance(properties := item.get("properties"), dict):
+        messages.append("missing 'properties'")
+    elif not (
+        properties.get("datetime")
+        or (properties.get("start_datetime") and properties.get("end_datetime"))
+    ):
+        messages.append(
+            "does not have either 'properties.datetime' or "
+            "('properties.start_datetime' and 'properties.end_datetime')"
+        )
+
+    if "links" in item:
+        if not isinstance(links := item["links"], list):
+            messages.append("'links' is not an array")
+        elif bad_links := [
+            i
+            for i, link in enumerate(links)
+            if not (
+                isinstance(link, dict)
+                and isinstance(link.get("href"), str)
+                and isinstance(link.get("rel"), str)
+            )
+        ]:
+            messages.append(
+                f"'links' entries {bad_links} do not have string 'href' and 'rel'"
+            )
+
+    if "assets" in item:
+        if not isinstance(assets := item["assets"], dict):
+            messages.append("'assets' is not an object")
+        elif bad_assets := [
+            key
+            for key, asset in assets.items()
+            if not (isinstance(asset, dict) and isinstance(asset.get("href"), str))
+        ]:
+            messages.append(f"'assets' {bad_assets} do not have a string 'href'")
+
+    if "stac_extensions" in item and not (
+        isinstance(extensions := item["stac_extensions"], list)
+        and all(isinstance(x, str) for x in extensions)
+    ):
+        messages.append("'stac_extensions' is not an array of strings")
+
+    return messages
+
+
+def page_structure_errors(features: List[Any]) -> Dict[int, List[str]]:
+    # index of each feature in the page -> its structural errors, in a single pass
+    return {
+        i: messages
+        for i, feature in enumerate(features)
+        if (messages := item_structure_errors(feature))
+    }
+
+
+def in_sample(item: Dict[str, Any], rate: float) -> bool:
+    # deterministic on the item id, so the same items are sampled on every run
+    if rate >= 1:
+        return True
+    return zlib.crc32(str(item.get("id")).encode()) < rate * 2**32
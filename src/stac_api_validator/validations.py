@@ -4,24 +4,35 @@ import copy
 import itertools
 import json
 import logging
+import os
+import queue
+import random
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from dataclasses import replace
 from enum import Enum
 from typing import (
     Any,
+    Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Mapping,
     Optional,
     Pattern,
+    Sequence,
     Set,
     Tuple,
     Union,
 )
 
+import numpy as np
 import pystac
+import shapely
 import yaml
 from deepdiff import DeepDiff
 from more_itertools import take
@@ -34,12 +45,26 @@ from pystac import (
     STACValidationError,
 )
 from pystac_client import Client
-from requests import Request, Session
+from requests import Request, RequestException, Session
+from shapely.errors import ShapelyError
 from shapely.geometry import shape
+from shapely.validation import explain_validity
 from stac_check.lint import Linter
 from stac_validator.stac_validator import StacValidate
 
+from stac_api_validator.assets import DEFAULT_ASSET_HOST_LIMIT
+from stac_api_validator.assets import AssetChecker
+from stac_api_validator.assets import AssetReference
+from stac_api_validator.assets import references
+from stac_api_validator.cql2 import CompiledFilter
+from stac_api_validator.cql2 import filter_constructs
+from stac_api_validator.cql2 import to_text
+from stac_api_validator.digests import DuplicateDetector
+from stac_api_validator.digests import StreamDigest
+from stac_api_validator.digests import item_digest
 from stac_api_validator.geometries import (
+    complex_multipolygon,
+    complex_polygon,
     geometry_collection,
     linestring,
     multilinestring,
@@ -49,6 +74,30 @@ from stac_api_validator.geometries import (
     polygon,
     polygon_with_hole,
 )
+from stac_api_validator.latency import LatencyProfile
+from stac_api_validator.latency import percentile
+from stac_api_validator.memo import VerdictCache
+from stac_api_validator.memo import content_digest
+from stac_api_validator.pipeline import DEFAULT_PREFETCH_PAGES
+from stac_api_validator.pipeline import Prefetcher
+from stac_api_validator.query import QueryProbe
+from stac_api_validator.sampling import collection_extent
+from stac_api_validator.sampling import strata
+from stac_api_validator.sampling import wilson_interval
+from stac_api_validator.schemas import FeatureValidationPool
+from stac_api_validator.schemas import SchemaStore
+from stac_api_validator.schemas import ValidatorIndex
+from stac_api_validator.sorting import SortChecker
+from stac_api_validator.sorting import SortField
+from stac_api_validator.sorting import parse_sortby
+from stac_api_validator.spatial import ItemIndex
+from stac_api_validator.spatial import non_intersecting
+from stac_api_validator.spatial import outside_bbox
+from stac_api_validator.spatial import query_geometry
+from stac_api_validator.spatial import random_windows
+from stac_api_validator.structure import in_sample
+from stac_api_validator.structure import page_structure_errors
+from stac_api_validator.structure import required_item_fields
 
 from .filters import (
     cql2_json_and,
@@ -69,29 +118,58 @@ from .filters import (
     cql2_json_s_intersects,
     cql2_json_string_comparisons,
     cql2_json_timestamp_comparisons,
-    cql2_text_and,
-    cql2_text_between,
-    cql2_text_ex_2,
-    cql2_text_ex_3,
-    cql2_text_ex_4,
-    cql2_text_ex_6,
-    cql2_text_ex_8,
-    cql2_text_ex_9,
-    cql2_text_like,
-    cql2_text_not,
-    cql2_text_not_between,
-    cql2_text_not_like,
-    cql2_text_numeric_comparisons,
-    cql2_text_or,
-    cql2_text_s_intersects,
-    cql2_text_string_comparisons,
-    cql2_text_timestamp_comparisons,
 )
 
 logger = logging.getLogger(__name__)
 
 LATEST_STAC_API_FOUNDATION_VERSION = "https://api.stacspec.org/v1.0.0/"
 
+# errors and warnings reported by deep collection validation, beyond which they are only counted
+DEFAULT_DEEP_MAX_FINDINGS = 1000
+DEFAULT_PAGINATION_MAX_ITEMS = 100
+# paging through this many intersecting items suggests the last page references itself
+DEFAULT_INTERSECTS_MAX_ITEMS = 20000
+DEFAULT_PAGINATION_LATENCY_BUDGET = 5.0
+DEFAULT_PAGINATION_LATENCY_LIMIT = 10
+DEFAULT_EQUIVALENCE_LIMIT = 10
+DEFAULT_INTERSECTS_LIMIT = 100
+# pages of each bbox search whose results are checked against the bbox
+DEFAULT_BBOX_MAX_PAGES = 10
+DEFAULT_SAMPLE_IDS = 10
+DEFAULT_BENCHMARK_ITEMS = 1000
+DEFAULT_GEOMETRY_VERTICES = (10, 100, 1000, 10000, 100000)
+DEFAULT_GEOMETRY_LATENCY_BUDGET = 5.0
+DEFAULT_GEOMETRY_TIMEOUT = 60.0
+DEFAULT_BENCHMARK_LIMITS = (10, 100, 250, 1000)
+DEFAULT_COMPLETENESS_ITEMS = 1000
+DEFAULT_SORT_MAX_ITEMS = 1000
+# sortables beyond this many are not each checked
+DEFAULT_SORTABLE_FIELDS = 10
+# Query Extension searches in flight at once
+DEFAULT_QUERY_WORKERS = 8
+# results of each filter search checked against the filter
+DEFAULT_FILTER_LIMIT = 100
+# Filter Extension searches in flight at once
+DEFAULT_FILTER_WORKERS = 8
+# searches of each filter, encoding and method, timed one at a time for their latency
+DEFAULT_FILTER_REPEATS = 0
+
+# each Query Extension operator, and the QueryConfig attributes of its field and value
+QUERY_PROBES = [
+    ("eq", "query_comparison_field", "query_eq_value"),
+    ("neq", "query_comparison_field", "query_neq_value"),
+    ("lt", "query_comparison_field", "query_lt_value"),
+    ("lte", "query_comparison_field", "query_lte_value"),
+    ("gt", "query_comparison_field", "query_gt_value"),
+    ("gte", "query_comparison_field", "query_gte_value"),
+    ("startsWith", "query_substring_field", "query_starts_with_value"),
+    ("endsWith", "query_substring_field", "query_ends_with_value"),
+    ("contains", "query_substring_field", "query_contains_value"),
+    ("in", "query_in_field", "query_in_values"),
+]
+# results per search window, beyond which missing items cannot be told apart
+DEFAULT_COMPLETENESS_MAX_RESULTS = 1000
+
 
 class Method(Enum):
     GET = "GET"
@@ -183,6 +261,21 @@ class QueryConfig:
     query_in_values: Optional[str]
 
 
+@dataclass
+class ValidationRun:
+    schema_store: SchemaStore
+    validator_index: Optional[ValidatorIndex] = None
+    feature_pool: Optional[FeatureValidationPool] = None
+    asset_checker: Optional[AssetChecker] = None
+    verdicts: Optional[VerdictCache] = None
+    # share of structurally valid page features that also get full validation
+    full_validation_rate: float = 1.0
+
+    def close(self) -> None:
+        if self.feature_pool:
+            self.feature_pool.shutdown()
+
+
 cc_core_regex = re.compile(r"https://api\.stacspec\.org/(.+)/core")
 cc_browseable_regex = re.compile(r"https://api\.stacspec\.org/(.+)/browseable")
 cc_children_regex = re.compile(r"https://api\.stacspec\.org/(.+)/children")
@@ -331,6 +424,58 @@ def has_geojson_content_type(headers: Mapping[str, str]) -> bool:
     return is_geojson_type(headers.get("content-type"))
 
 
+def feature_label(features: List[Any], i: int) -> str:
+    feature = features[i]
+    if isinstance(feature, dict) and feature.get("id") is not None:
+        return str(feature["id"])
+    return f"features[{i}]"
+
+
+def feature_labels(features: List[Any], indexes: List[int]) -> str:
+    return ", ".join(f"features[{i}] '{feature_label(features, i)}'" for i in indexes)
+
+
+def memoize_findings(
+    kind: str,
+    body: Dict[str, Any],
+    settings: Any,
+    url: str,
+    errors: Errors,
+    warnings: Warnings,
+    context: Context,
+    method: Method,
+    run: Optional[ValidationRun],
+    validate: Callable[[Errors, Warnings], None],
+) -> None:
+    if not run or run.verdicts is None:
+        validate(errors, warnings)
+        return
+
+    # identical objects served by several urls are validated once, and the findings
+    # are attributed to each url that served them
+    prefix = f"[{context}] : {method} {url} "
+    key = content_digest(body, [kind, settings])
+    if (findings := run.verdicts.get(kind, key)) is None:
+        start = time.perf_counter()
+        new_errors = Errors()
+        new_warnings = Warnings()
+        validate(new_errors, new_warnings)
+        findings = [
+            (target, message.startswith(prefix), message.removeprefix(prefix))
+            for target, messages in [("error", new_errors), ("warning", new_warnings)]
+            for message in messages
+        ]
+        run.verdicts.put(key, findings, time.perf_counter() - start)
+
+    for target, attributed, message in findings:
+        if attributed:
+            message = f"{prefix}{message}"
+        if target == "error":
+            errors += message
+        else:
+            warnings += message
+
+
 def stac_validate(
     url: str,
     body: Optional[Dict[str, Any]],
@@ -338,36 +483,99 @@ def stac_validate(
     context: Context,
     method: Method = Method.GET,
     open_assets_urls: bool = True,
-    headers: Optional[dict] = None,
+    headers: Optional[Mapping[str, Any]] = None,
+    run: Optional[ValidationRun] = None,
 ) -> None:
     if not body:
         errors += f"[{context}] : {method} {url} body was empty when running stac-validate and stac-check"
     else:
         if _type := body.get("type"):
-            try:
-                match _type:
-                    case "Collection":
-                        Collection.from_dict(body)
-                    case "FeatureCollection":
-                        ItemCollection.from_dict(body)
-                    case "Feature":
-                        Item.from_dict(body)
-                    case _:
-                        errors += f"[{context}] : {method} {url} object with type '{_type}' could not be hydrated with pystac"
-            except Exception as e:
-                errors += f"[{context}] : {method} {url} '{body.get('id')}' failed pystac hydration: {e}"
-
-            if _type in ["Collection", "Feature"]:
-                logger.debug(f"stac-validator validation: {url}")
-                if not (
-                    stac_validator := StacValidate(
-                        links=True,
-                        assets=True,
-                        assets_open_urls=open_assets_urls,
-                        headers=headers or {},
-                    )
-                ).validate_dict(body):
-                    errors += f"[{context}] : {method} {url} failed stac-validator validation: {stac_validator.message}"
+            if run and run.asset_checker:
+                if _type in ["Collection", "Feature"]:
+                    run.asset_checker.collect(context, method, url, body)
+                elif _type == "FeatureCollection" and run.feature_pool:
+                    for feature in body.get("features") or []:
+                        if isinstance(feature, dict):
+                            run.asset_checker.collect(context, method, url, feature)
+                # assets are opened once per href by the asset reachability stage instead
+                open_assets_urls = False
+
+            def validate(errors: Errors, warnings: Warnings) -> None:
+                try:
+                    match _type:
+                        case "Collection":
+                            Collection.from_dict(body)
+                        case "FeatureCollection":
+                            ItemCollection.from_dict(body)
+                        case "Feature":
+                            Item.from_dict(body)
+                        case _:
+                            errors += f"[{context}] : {method} {url} object with type '{_type}' could not be hydrated with pystac"
+                except Exception as e:
+                    errors += f"[{context}] : {method} {url} '{body.get('id')}' failed pystac hydration: {e}"
+
+                if _type in ["Collection", "Feature"]:
+                    if (
+                        run
+                        and run.validator_index is not None
+                        and (messages := run.validator_index.validate(body)) is not None
+                    ):
+                        logger.debug(f"indexed schema validation: {url}")
+                        if messages:
+                            errors += f"[{context}] : {method} {url} failed schema validation: {'; '.join(messages)}"
+                    else:
+                        logger.debug(f"stac-validator validation: {url}")
+                        if not (
+                            stac_validator := StacValidate(
+                                links=True,
+                                assets=True,
+                                assets_open_urls=open_assets_urls,
+                                headers=headers or {},
+                            )
+                        ).validate_dict(body):
+                            errors += f"[{context}] : {method} {url} failed stac-validator validation: {stac_validator.message}"
+
+                # structural validation of every feature is opted into with
+                # --validate-all-features, as it screens their full validation
+                if (
+                    _type == "FeatureCollection"
+                    and run
+                    and run.feature_pool
+                    and isinstance(features := body.get("features"), list)
+                ):
+                    structure_errors = page_structure_errors(features)
+                    for i, messages in structure_errors.items():
+                        errors += f"[{context}] : {method} {url} item '{feature_label(features, i)}' failed structural validation: {'; '.join(messages)}"
+
+                    logger.debug(f"stac-validator validation of all features: {url}")
+                    for item_id, messages in run.feature_pool.validate(
+                        [
+                            feature
+                            for i, feature in enumerate(features)
+                            if i not in structure_errors
+                            and in_sample(feature, run.full_validation_rate)
+                        ]
+                    ).items():
+                        errors += f"[{context}] : {method} {url} item '{item_id}' failed stac-validator validation: {'; '.join(messages)}"
+
+            memoize_findings(
+                "stac-validator",
+                body,
+                [
+                    open_assets_urls,
+                    sorted(dict(headers or {}).items()),
+                    bool(run and run.validator_index is not None),
+                    bool(run and run.feature_pool),
+                    run.full_validation_rate if run else None,
+                ],
+                url,
+                errors,
+                Warnings(),
+                context,
+                method,
+                run,
+                validate,
+            )
 
         else:
             errors += f"[{context}] : {method} {url} missing 'type' attribute"
@@ -380,26 +588,48 @@ def stac_check(
     context: Context,
     method: Method = Method.GET,
     open_assets_urls: bool = True,
-    headers: Optional[dict] = None,
+    headers: Optional[Mapping[str, Any]] = None,
     config_file: Optional[str] = None,
+    run: Optional[ValidationRun] = None,
+    body: Optional[Dict[str, Any]] = None,
 ) -> None:
-    try:
-        logger.debug(f"stac-check validation: {url}")
-        linter = Linter(
+    open_assets_urls = open_assets_urls and not (run and run.asset_checker)
+
+    def lint(errors: Errors, warnings: Warnings) -> None:
+        try:
+            logger.debug(f"stac-check validation: {url}")
+            # lint the body already retrieved rather than having stac-check download it again
+            linter = Linter(
+                body if body is not None else url,
+                config_file=config_file,
+                assets_open_urls=open_assets_urls,
+                headers=headers or {},
+            )
+            if not linter.valid_stac:
+                errors += f"[{context}] : {method} {url} is not a valid STAC object: {linter.error_msg}"
+            if msgs := linter.best_practices_msg[1:]:  # first msg is a header, so skip
+                warnings += f"[{context}] : {method} {url} has these stac-check recommendations: {','.join([x.strip() for x in msgs])}"
+        except KeyError as e:
+            # see https://github.com/stac-utils/stac-check/issues/104
+            errors += f"[{Context.CORE}] Error running stac-check, probably because an item doesn't have a bbox defined, which is okay!: {e} "
+        except Exception as e:
+            errors += f"[{Context.CORE}] Error while running stac-check: {e} "
+
+    if body is None:
+        lint(errors, warnings)
+    else:
+        memoize_findings(
+            "stac-check",
+            body,
+            [open_assets_urls, config_file, sorted(dict(headers or {}).items())],
             url,
-            config_file=config_file,
-            assets_open_urls=open_assets_urls,
-            headers=headers or {},
-        )
-        if not linter.valid_stac:
-            errors += f"[{context}] : {method} {url} is not a valid STAC object: {linter.error_msg}"
-        if msgs := linter.best_practices_msg[1:]:  # first msg is a header, so skip
-            warnings += f"[{context}] : {method} {url} has these stac-check recommendations: {','.join([x.strip() for x in msgs])}"
-    except KeyError as e:
-        # see https://github.com/stac-utils/stac-check/issues/104
-        errors += f"[{Context.CORE}] Error running stac-check, probably because an item doesn't have a bbox defined, which is okay!: {e} "
-    except Exception as e:
-        errors += f"[{Context.CORE}] Error while running stac-check: {e} "
+            errors,
+            warnings,
+            context,
+            method,
+            run,
+            lint,
+        )
 
 
 def retrieve(
@@ -451,6 +681,80 @@ def retrieve(
     return resp.status_code, None, resp.headers
 
 
+def paginate(
+    method: Method,
+    url: str,
+    errors: Errors,
+    context: Context,
+    r_session: Session,
+    params: Optional[Dict[str, Any]] = None,
+    body: Optional[Dict[str, Any]] = None,
+    max_pages: Optional[int] = None,
+    profile: Optional[LatencyProfile] = None,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    # streams pages by following 'next' links, holding only the current page
+    pages = 0
+    next_url: Optional[str] = url
+    while next_url:
+        start = time.perf_counter()
+        _, page, headers = retrieve(
+            method,
+            next_url,
+            errors,
+            context,
+            r_session=r_session,
+            params=params,
+            body=body,
+            content_type=geojson_mt,
+        )
+        if not page:
+            return
+
+        if profile is not None:
+            seconds = time.perf_counter() - start
+            size = (headers or {}).get("content-length")
+            profile.record(
+                seconds,
+                int(size) if size else len(json.dumps(page).encode()),
+                len(page.get("features") or []),
+            )
+
+        yield next_url, page
+
+        pages += 1
+        if max_pages and pages >= max_pages:
+            return
+
+        if not (link := link_by_rel(page.get("links"), "next")):
+            return
+
+        if (next_href := link.get("href")) is None:
+            errors += (
+                f"[{context}] : {method} {next_url} 'next' link relation missing href"
+            )
+            return
+
+        try:
+            next_method = Method(link.get("method", "GET"))
+        except ValueError:
+            errors += f"[{context}] : {method} {next_url} 'next' link relation has unsupported method {link.get('method')}"
+            return
+
+        next_body: Optional[Dict[str, Any]] = None
+        if next_method == Method.POST:
+            next_body = link.get("body", {})
+            if link.get("merge", False):
+                next_body = {**(body or {}), **(next_body or {})}
+
+        if (next_href, next_method, next_body) == (next_url, method, body) and (
+            params is None
+        ):
+            errors += f"[{context}] : {method} {next_url} 'next' link relation refers to the same page"
+            return
+
+        next_url, method, body, params = next_href, next_method, next_body, None
+
+
 def validate_core_landing_page_body(
     body: Dict[str, Any],
     headers: Mapping[str, str],
@@ -572,203 +876,373 @@ def validate_api(
     headers: Optional[Dict[str, str]],
     open_assets_urls: bool = True,
     stac_check_config: Optional[str] = None,
+    schema_dir: Optional[str] = None,
+    validate_all_features: bool = False,
+    workers: Optional[int] = None,
+    asset_host_limit: int = DEFAULT_ASSET_HOST_LIMIT,
+    sample_items: Optional[int] = None,
+    seed: int = 0,
+    deep_collection: Optional[str] = None,
+    deep_collection_search: bool = False,
+    full_validation_rate: float = 1.0,
+    pagination_max_items: int = DEFAULT_PAGINATION_MAX_ITEMS,
+    pagination_bloom: bool = False,
+    pagination_latency_pages: Optional[int] = None,
+    pagination_latency_budget: float = DEFAULT_PAGINATION_LATENCY_BUDGET,
+    benchmark_items: Optional[int] = None,
+    prefetch_pages: int = DEFAULT_PREFETCH_PAGES,
+    geometry_latency_budget: Optional[float] = None,
+    completeness_windows: Optional[int] = None,
+    completeness_items: int = DEFAULT_COMPLETENESS_ITEMS,
+    sort_max_items: int = DEFAULT_SORT_MAX_ITEMS,
+    sort_keys: Optional[List[str]] = None,
+    sort_sortables: bool = False,
+    filter_repeats: int = DEFAULT_FILTER_REPEATS,
 ) -> Tuple[Warnings, Errors]:
     warnings = Warnings()
     errors = Errors()
 
-    r_session = Session()
-    if auth_bearer_token:
-        r_session.headers.update({"Authorization": f"Bearer {auth_bearer_token}"})
+    schema_store = SchemaStore(schema_dir=schema_dir)
+    run = ValidationRun(
+        schema_store=schema_store,
+        validator_index=ValidatorIndex(schema_store),
+        feature_pool=FeatureValidationPool(schema_store, workers)
+        if validate_all_features
+        else None,
+        verdicts=VerdictCache(),
+        full_validation_rate=full_validation_rate,
+    )
+    try:
+        with schema_store.installed():
+            r_session = Session()
+            if auth_bearer_token:
+                r_session.headers.update(
+                    {"Authorization": f"Bearer {auth_bearer_token}"}
+                )
 
-    if auth_query_parameter and (xs := auth_query_parameter.split("=", 1)):
-        r_session.params = {xs[0]: xs[1]}
+            if auth_query_parameter and (xs := auth_query_parameter.split("=", 1)):
+                r_session.params = {xs[0]: xs[1]}
 
-    if headers:
-        r_session.headers.update(headers)
+            if headers:
+                r_session.headers.update(headers)
 
-    _, landing_page_body, landing_page_headers = retrieve(
-        Method.GET, root_url, errors, Context.CORE, r_session
-    )
+            if open_assets_urls:
+                run.asset_checker = AssetChecker(
+                    headers=r_session.headers, host_limit=asset_host_limit
+                )
 
-    if not landing_page_body:
-        return warnings, errors
+            _, landing_page_body, landing_page_headers = retrieve(
+                Method.GET, root_url, errors, Context.CORE, r_session
+            )
 
-    assert landing_page_body is not None
-    assert landing_page_headers is not None
+            if not landing_page_body:
+                return warnings, errors
 
-    if "core" in ccs_to_validate:
-        # fail fast if there are errors with conformance or links so far
-        if not validate_core_landing_page_body(
-            landing_page_body,
-            landing_page_headers,
-            errors,
-            warnings,
-            ccs_to_validate,
-            collection,
-            geometry,
-        ):
-            return warnings, errors
+            assert landing_page_body is not None
+            assert landing_page_headers is not None
 
-        logger.info("Validating STAC API - Core conformance class.")
-        validate_core(landing_page_body, errors, warnings, r_session)
+            if "core" in ccs_to_validate:
+                # fail fast if there are errors with conformance or links so far
+                if not validate_core_landing_page_body(
+                    landing_page_body,
+                    landing_page_headers,
+                    errors,
+                    warnings,
+                    ccs_to_validate,
+                    collection,
+                    geometry,
+                ):
+                    return warnings, errors
 
-    if "browseable" in ccs_to_validate:
-        logger.info("Validating STAC API - Browseable conformance class.")
-        validate_browseable(landing_page_body, errors, warnings, r_session)
+                logger.info("Validating STAC API - Core conformance class.")
+                validate_core(landing_page_body, errors, warnings, r_session)
 
-    if "children" in ccs_to_validate:
-        logger.info("Validating STAC API - Children conformance class.")
-        validate_children(landing_page_body, errors, warnings, r_session)
+            if "browseable" in ccs_to_validate:
+                logger.info("Validating STAC API - Browseable conformance class.")
+                validate_browseable(landing_page_body, errors, warnings, r_session)
 
-    if "collections" in ccs_to_validate:
-        logger.info("Validating STAC API - Collections conformance class.")
-        validate_collections(
-            landing_page_body,
-            collection,
-            errors,
-            warnings,
-            r_session,
-            open_assets_urls,
-            stac_check_config,
-        )
+            if "children" in ccs_to_validate:
+                logger.info("Validating STAC API - Children conformance class.")
+                validate_children(landing_page_body, errors, warnings, r_session)
 
-    conforms_to = landing_page_body.get("conformsTo", [])
+            if "collections" in ccs_to_validate:
+                logger.info("Validating STAC API - Collections conformance class.")
+                validate_collections(
+                    landing_page_body,
+                    collection,
+                    errors,
+                    warnings,
+                    r_session,
+                    open_assets_urls,
+                    stac_check_config,
+                    run=run,
+                )
 
-    if "features" in ccs_to_validate:
-        logger.info("Validating STAC API - Features conformance class.")
-        validate_collections(
-            landing_page_body,
-            collection,
-            errors,
-            warnings,
-            r_session,
-            open_assets_urls,
-            stac_check_config,
-        )
-        validate_features(
-            landing_page_body,
-            conforms_to,
-            collection,
-            geometry,
-            warnings,
-            errors,
-            r_session,
-            validate_pagination,
-            open_assets_urls,
-            stac_check_config,
-        )
+            conforms_to = landing_page_body.get("conformsTo", [])
 
-    if "transaction" in ccs_to_validate:
-        logger.info(
-            "STAC API - Features - Transaction extension conformance class found."
-        )
-        validate_transaction(
-            context=Context.FEATURES_TXN,
-            landing_page_body=landing_page_body,
-            collection=collection,
-            errors=errors,
-            warnings=warnings,
-            r_session=r_session,
-            transaction_collection=transaction_collection,
-        )
+            if "features" in ccs_to_validate:
+                logger.info("Validating STAC API - Features conformance class.")
+                validate_collections(
+                    landing_page_body,
+                    collection,
+                    errors,
+                    warnings,
+                    r_session,
+                    open_assets_urls,
+                    stac_check_config,
+                    run=run,
+                )
+                validate_features(
+                    landing_page_body,
+                    conforms_to,
+                    collection,
+                    geometry,
+                    warnings,
+                    errors,
+                    r_session,
+                    validate_pagination,
+                    open_assets_urls,
+                    stac_check_config,
+                    run=run,
+                )
 
-    if "features#fields" in ccs_to_validate:
-        logger.info("STAC API - Features - Fields extension conformance class found.")
-        logger.info("STAC API - Features - Fields extension is not yet supported.")
+            if "transaction" in ccs_to_validate:
+                logger.info(
+                    "STAC API - Features - Transaction extension conformance class found."
+                )
+                validate_transaction(
+                    context=Context.FEATURES_TXN,
+                    landing_page_body=landing_page_body,
+                    collection=collection,
+                    errors=errors,
+                    warnings=warnings,
+                    r_session=r_session,
+                    transaction_collection=transaction_collection,
+                )
 
-    if "features#sort" in ccs_to_validate:
-        logger.info("STAC API - Features - Sort extension conformance class found.")
-        logger.info("STAC API - Features - Sort extension is not yet supported.")
+            if "features#fields" in ccs_to_validate:
+                logger.info(
+                    "STAC API - Features - Fields extension conformance class found."
+                )
+                logger.info(
+                    "STAC API - Features - Fields extension is not yet supported."
+                )
 
-    if "features#query" in ccs_to_validate:
-        logger.info("STAC API - Features - Query extension conformance class found.")
-        logger.info("STAC API - Features - Query extension is not yet supported.")
+            if "features#sort" in ccs_to_validate:
+                logger.info(
+                    "STAC API - Features - Sort extension conformance class found."
+                )
+                logger.info(
+                    "STAC API - Features - Sort extension is not yet supported."
+                )
 
-    if "features#filter" in ccs_to_validate:
-        logger.info("STAC API - Features - Filter Extension conformance class found.")
-        validate_features_filter(
-            root_body=landing_page_body,
-            collection=collection,
-            errors=errors,
-            r_session=r_session,
-        )
+            if "features#query" in ccs_to_validate:
+                logger.info(
+                    "STAC API - Features - Query extension conformance class found."
+                )
+                logger.info(
+                    "STAC API - Features - Query extension is not yet supported."
+                )
 
-    if "item-search" in ccs_to_validate:
-        logger.info("Validating STAC API - Item Search conformance class.")
-        validate_item_search(
-            root_url=root_url,
-            root_body=landing_page_body,
-            collection=collection,  # type:ignore
-            conforms_to=conforms_to,
-            warnings=warnings,
-            errors=errors,
-            geometry=geometry,
-            conformance_classes=ccs_to_validate,
-            r_session=r_session,
-            validate_pagination=validate_pagination,
-            open_assets_urls=open_assets_urls,
-        )
+            if "features#filter" in ccs_to_validate:
+                logger.info(
+                    "STAC API - Features - Filter Extension conformance class found."
+                )
+                validate_features_filter(
+                    root_body=landing_page_body,
+                    collection=collection,
+                    errors=errors,
+                    r_session=r_session,
+                )
 
-    if "item-search#fields" in ccs_to_validate:
-        logger.info(
-            "STAC API - Item Search - Fields extension conformance class found."
-        )
-        validate_fields(
-            context=Context.ITEM_SEARCH_FIELDS,
-            landing_page_body=landing_page_body,
-            collection=collection,
-            errors=errors,
-            warnings=warnings,
-            r_session=r_session,
-            fields_nested_property=fields_nested_property,
-        )
+            if "item-search" in ccs_to_validate:
+                logger.info("Validating STAC API - Item Search conformance class.")
+                validate_item_search(
+                    root_url=root_url,
+                    root_body=landing_page_body,
+                    collection=collection,  # type:ignore
+                    conforms_to=conforms_to,
+                    warnings=warnings,
+                    errors=errors,
+                    geometry=geometry,
+                    conformance_classes=ccs_to_validate,
+                    r_session=r_session,
+                    validate_pagination=validate_pagination,
+                    open_assets_urls=open_assets_urls,
+                    run=run,
+                    pagination_max_items=pagination_max_items,
+                    pagination_bloom=pagination_bloom,
+                    pagination_latency_pages=pagination_latency_pages,
+                    pagination_latency_budget=pagination_latency_budget,
+                    geometry_latency_budget=geometry_latency_budget,
+                    filter_repeats=filter_repeats,
+                )
 
-    if "item-search#sort" in ccs_to_validate:
-        logger.info("STAC API - Item Search - Sort extension conformance class found.")
-        validate_sort(
-            context=Context.ITEM_SEARCH_SORT,
-            landing_page_body=landing_page_body,
-            collection=collection,
-            errors=errors,
-            warnings=warnings,
-            r_session=r_session,
-            query_config=query_config,
-        )
+            if sample_items:
+                logger.info(f"Validating a sample of {sample_items} items.")
+                validate_item_sample(
+                    root_body=landing_page_body,
+                    collection=collection,
+                    sample_items=sample_items,
+                    seed=seed,
+                    errors=errors,
+                    warnings=warnings,
+                    r_session=r_session,
+                    open_assets_urls=open_assets_urls,
+                    stac_check_config=stac_check_config,
+                    run=run,
+                )
 
-    if "item-search#query" in ccs_to_validate:
-        logger.info("STAC API - Item Search - Query extension conformance class found.")
-        validate_query(
-            context=Context.ITEM_SEARCH_QUERY,
-            landing_page_body=landing_page_body,
-            collection=collection,
-            errors=errors,
-            warnings=warnings,
-            r_session=r_session,
-            query_config=query_config,
-        )
+            if deep_collection:
+                logger.info(f"Validating every item of collection '{deep_collection}'.")
+                validate_deep_collection(
+                    root_body=landing_page_body,
+                    collection=deep_collection,
+                    errors=errors,
+                    warnings=warnings,
+                    r_session=r_session,
+                    open_assets_urls=open_assets_urls,
+                    stac_check_config=stac_check_config,
+                    run=run,
+                    workers=workers,
+                    use_search=deep_collection_search,
+                    prefetch_pages=prefetch_pages,
+                )
 
-    if "item-search#filter" in ccs_to_validate:
-        logger.info(
-            "STAC API - Item Search - Filter Extension conformance class found."
-        )
-        validate_item_search_filter(
-            root_url=root_url,
-            root_body=landing_page_body,
-            collection=collection,
-            errors=errors,
-            r_session=r_session,
-        )
+            if benchmark_items:
+                if collection is None:
+                    logger.warning(
+                        "Page size benchmark not run, --collection is not defined"
+                    )
+                else:
+                    logger.info(
+                        f"Benchmarking page sizes over {benchmark_items} items of collection '{collection}'."
+                    )
+                    benchmark_page_sizes(
+                        root_body=landing_page_body,
+                        collection=collection,
+                        r_session=r_session,
+                        items=benchmark_items,
+                    )
 
-    if not errors:
-        try:
-            catalog = Client.open(root_url, headers=headers)
-            catalog.validate()
-            for child in catalog.get_children():
-                child.validate()
-        except STACValidationError as e:
-            errors += f"pystac validation error: {e}"
-        except Exception as e:
-            errors += f"Error with  pystac: {e}"
+            if completeness_windows:
+                if collection is None:
+                    logger.warning(
+                        "Search completeness not checked, --collection is not defined"
+                    )
+                else:
+                    logger.info(
+                        f"Checking search completeness over {completeness_windows} windows of collection '{collection}'."
+                    )
+                    validate_search_completeness(
+                        root_body=landing_page_body,
+                        collection=collection,
+                        errors=errors,
+                        r_session=r_session,
+                        windows=completeness_windows,
+                        crawl_items=completeness_items,
+                        seed=seed,
+                    )
+
+            if "item-search#fields" in ccs_to_validate:
+                logger.info(
+                    "STAC API - Item Search - Fields extension conformance class found."
+                )
+                validate_fields(
+                    context=Context.ITEM_SEARCH_FIELDS,
+                    landing_page_body=landing_page_body,
+                    collection=collection,
+                    errors=errors,
+                    warnings=warnings,
+                    r_session=r_session,
+                    fields_nested_property=fields_nested_property,
+                )
+
+            if "item-search#sort" in ccs_to_validate:
+                logger.info(
+                    "STAC API - Item Search - Sort extension conformance class found."
+                )
+                validate_sort(
+                    context=Context.ITEM_SEARCH_SORT,
+                    landing_page_body=landing_page_body,
+                    collection=collection,
+                    errors=errors,
+                    warnings=warnings,
+                    r_session=r_session,
+                    query_config=query_config,
+                    max_items=sort_max_items,
+                    sort_keys=sort_keys,
+                    sortables=sort_sortables,
+                )
+
+            if "item-search#query" in ccs_to_validate:
+                logger.info(
+                    "STAC API - Item Search - Query extension conformance class found."
+                )
+                validate_query(
+                    context=Context.ITEM_SEARCH_QUERY,
+                    landing_page_body=landing_page_body,
+                    collection=collection,
+                    errors=errors,
+                    warnings=warnings,
+                    r_session=r_session,
+                    query_config=query_config,
+                )
+
+            if "item-search#filter" in ccs_to_validate:
+                logger.info(
+                    "STAC API - Item Search - Filter Extension conformance class found."
+                )
+                validate_item_search_filter(
+                    root_url=root_url,
+                    root_body=landing_page_body,
+                    collection=collection,
+                    errors=errors,
+                    r_session=r_session,
+                    repeats=filter_repeats,
+                )
+
+            if run.asset_checker and run.asset_checker.references:
+                logger.info("Checking reachability of asset hrefs.")
+                for reference, failure in run.asset_checker.check():
+                    warnings += f"[{reference.context}] : {reference.method} {reference.url} '{reference.item_id}' asset '{reference.key}' {reference.href} is not reachable: {failure}"
+
+            if not errors:
+                try:
+                    catalog = Client.open(root_url, headers=headers)
+                    catalog.validate()
+                    for child in catalog.get_children():
+                        child.validate()
+                except STACValidationError as e:
+                    errors += f"pystac validation error: {e}"
+                except Exception as e:
+                    errors += f"Error with  pystac: {e}"
+    finally:
+        run.close()
+        if run.validator_index is not None:
+            logger.info(
+                f"Schema validator index: {len(run.validator_index)} signatures built in "
+                f"{run.validator_index.build_seconds:.2f}s, {run.validator_index.hits} hits, "
+                f"{run.validator_index.misses} misses ({run.validator_index.hit_rate:.0%} hit rate)"
+            )
+        if run.verdicts is not None and (lookups := sum(run.verdicts.lookups.values())):
+            hits = sum(run.verdicts.hits.values())
+            logger.info(
+                f"Validation memo: {hits} of {lookups} validations were of objects already validated "
+                f"({', '.join(f'{kind} {run.verdicts.hits[kind]}/{n}' for kind, n in run.verdicts.lookups.items())}), "
+                f"saving about {run.verdicts.seconds_saved:.2f}s"
+            )
+        if run.asset_checker and run.asset_checker.checked_hrefs:
+            logger.info(
+                f"Asset reachability: {run.asset_checker.checked_hrefs} unique hrefs from "
+                f"{run.asset_checker.checked_references} asset references checked with "
+                f"{run.asset_checker.requests} requests in {run.asset_checker.seconds:.2f}s"
+            )
+        if schema_store.remote_fetches:
+            logger.warning(
+                "These schemas are not in the offline schema bundle or --schema-dir and were "
+                f"fetched remotely (run with --refresh-schemas to bundle them): {', '.join(schema_store.remote_fetches)}"
+            )
 
     return warnings, errors
 
@@ -1008,6 +1482,7 @@ def validate_collections(
     r_session: Session,
     open_assets_urls: bool = True,
     stac_check_config: Optional[str] = None,
+    run: Optional[ValidationRun] = None,
 ) -> None:
     if not (data_link := link_by_rel(root_body["links"], "data")):
         errors += f"[{Context.COLLECTIONS}] /: Link[rel=data] must href /collections"
@@ -1072,6 +1547,7 @@ def validate_collections(
                         Method.GET,
                         open_assets_urls,
                         r_session.headers,
+                        run=run,
                     )
 
             if not collection:
@@ -1112,6 +1588,7 @@ def validate_collections(
                     Method.GET,
                     open_assets_urls,
                     r_session.headers,
+                    run=run,
                 )
                 stac_check(
                     collection_url,
@@ -1122,11 +1599,59 @@ def validate_collections(
                     open_assets_urls,
                     r_session.headers,
                     stac_check_config,
+                    run=run,
+                    body=body,
                 )
 
         # todo: collection pagination
 
 
+def validate_item(
+    item_url: str,
+    body: Dict[str, Any],
+    errors: Errors,
+    warnings: Warnings,
+    context: Context,
+    r_session: Session,
+    open_assets_urls: bool = True,
+    stac_check_config: Optional[str] = None,
+    run: Optional[ValidationRun] = None,
+) -> None:
+    if not (self_link := link_by_rel(body.get("links", []), "self")):
+        errors += f"[{context}] GET {item_url} does not have self link"
+    elif item_url != self_link.get("href"):
+        errors += f"[{context}] GET {item_url} self link does not match requested url"
+
+    if not link_by_rel(body.get("links", []), "root"):
+        errors += f"[{context}] GET {item_url} does not have root link"
+
+    if not link_by_rel(body.get("links", []), "parent"):
+        errors += f"[{context}] GET {item_url} does not have parent link"
+
+    stac_validate(
+        item_url,
+        body,
+        errors,
+        context,
+        Method.GET,
+        open_assets_urls,
+        r_session.headers,
+        run=run,
+    )
+    stac_check(
+        item_url,
+        errors,
+        warnings,
+        context,
+        Method.GET,
+        open_assets_urls,
+        r_session.headers,
+        stac_check_config,
+        run=run,
+        body=body,
+    )
+
+
 def validate_features(
     root_body: Dict[str, Any],
     conforms_to: List[str],
@@ -1138,6 +1663,7 @@ def validate_features(
     validate_pagination: bool,
     open_assets_urls: bool = True,
     stac_check_config: Optional[str] = None,
+    run: Optional[ValidationRun] = None,
 ) -> None:
     if not collection:
         errors += f"[{Context.FEATURES}] Collection parameter required for running Features validations."
@@ -1212,6 +1738,7 @@ def validate_features(
                 Method.GET,
                 open_assets_urls,
                 r_session.headers,
+                run=run,
             )
 
             item_url = link_by_rel(body.get("features", [])[0]["links"], "self")["href"]  # type:ignore
@@ -1233,6 +1760,7 @@ def validate_features(
                 Method.GET,
                 open_assets_urls,
                 r_session.headers,
+                run=run,
             )
             stac_check(
                 item_url,
@@ -1243,6 +1771,8 @@ def validate_features(
                 open_assets_urls,
                 r_session.headers,
                 stac_check_config,
+                run=run,
+                body=body,
             )
 
     # Validate Features non-existent item
@@ -1298,6 +1828,7 @@ def validate_features(
                         Method.GET,
                         open_assets_urls,
                         r_session.headers,
+                        run=run,
                     )
 
                     item = next(iter(body.get("features", [])), None)
@@ -1321,39 +1852,16 @@ def validate_features(
                             )
 
                             if body:
-                                if not (
-                                    self_link := link_by_rel(
-                                        body.get("links", []), "self"
-                                    )
-                                ):
-                                    errors += f"[{Context.FEATURES}] GET {item_url} does not have self link"
-                                elif item_url != self_link.get("href"):
-                                    errors += f"[{Context.FEATURES}] GET {item_url} self link does not match requested url"
-
-                                if not link_by_rel(body.get("links", []), "root"):
-                                    errors += f"[{Context.FEATURES}] GET {item_url} does not have root link"
-
-                                if not link_by_rel(body.get("links", []), "parent"):
-                                    errors += f"[{Context.FEATURES}] GET {item_url} does not have parent link"
-
-                                stac_validate(
+                                validate_item(
                                     item_url,
                                     body,
                                     errors,
-                                    Context.FEATURES,
-                                    Method.GET,
-                                    open_assets_urls,
-                                    r_session.headers,
-                                )
-                                stac_check(
-                                    item_url,
-                                    errors,
                                     warnings,
                                     Context.FEATURES,
-                                    Method.GET,
+                                    r_session,
                                     open_assets_urls,
-                                    r_session.headers,
                                     stac_check_config,
+                                    run=run,
                                 )
 
     if validate_pagination:
@@ -1379,6 +1887,321 @@ def validate_features(
                 )
 
 
+def validate_item_sample(
+    root_body: Dict[str, Any],
+    collection: Optional[str],
+    sample_items: int,
+    seed: int,
+    errors: Errors,
+    warnings: Warnings,
+    r_session: Session,
+    open_assets_urls: bool = True,
+    stac_check_config: Optional[str] = None,
+    run: Optional[ValidationRun] = None,
+) -> None:
+    if not collection:
+        errors += (
+            f"[{Context.ITEM_SEARCH}] Collection parameter required for sampling items."
+        )
+        return
+
+    root_links = root_body.get("links")
+    if not (collections_link := link_by_rel(root_links, "data")):
+        errors += "/: Link[rel=data] must href /collections, cannot sample items"
+        return
+
+    collection_url = f"{collections_link['href']}/{collection}"
+    _, collection_body, _ = retrieve(
+        Method.GET,
+        collection_url,
+        errors,
+        Context.COLLECTIONS,
+        r_session=r_session,
+    )
+    if not collection_body:
+        return
+
+    # sample through Item Search when available, otherwise through the collection items
+    if search_link := link_by_rel(root_links, "search"):
+        context = Context.ITEM_SEARCH
+        search_url = search_link["href"]
+        params: Dict[str, Any] = {"collections": collection}
+    else:
+        context = Context.FEATURES
+        search_url = f"{collection_url}/items"
+        params = {}
+
+    bbox, start, end = collection_extent(collection_body)
+    rng = random.Random(seed)
+    sampled: List[Dict[str, Any]] = []
+    sampled_ids: Set[str] = set()
+    empty_strata = 0
+    for datetime_interval, cell in strata(bbox, start, end, sample_items, seed):
+        features: List[Dict[str, Any]] = []
+        # widen to the whole spatial extent when the stratum's cell has no items
+        for stratum_params in [
+            {"datetime": datetime_interval, "bbox": ",".join(str(x) for x in cell)},
+            {"datetime": datetime_interval},
+        ]:
+            _, body, _ = retrieve(
+                Method.GET,
+                search_url,
+                errors,
+                context,
+                r_session=r_session,
+                params={**params, **stratum_params, "limit": 20},
+            )
+            features = [
+                f
+                for f in (body or {}).get("features", [])
+                if isinstance(f, dict) and f.get("id") not in sampled_ids
+            ]
+            if features:
+                break
+
+        if not features:
+            empty_strata += 1
+            continue
+
+        feature = rng.choice(features)
+        sampled.append(feature)
+        sampled_ids.add(feature.get("id"))  # type: ignore
+
+    if not sampled:
+        warnings += f"[{context}] : GET {search_url} returned no items to sample for collection '{collection}'"
+        return
+
+    items_with_errors = 0
+    items_with_warnings = 0
+    for feature in sampled:
+        item_errors = Errors()
+        item_warnings = Warnings()
+        if not (self_link := link_by_rel(feature.get("links"), "self")):
+            item_errors += f"[{context}] : GET {search_url} sampled item '{feature.get('id')}' does not have self link"
+        else:
+            item_url = self_link["href"]
+            _, body, _ = retrieve(
+                Method.GET,
+                item_url,
+                item_errors,
+                context,
+                content_type=geojson_mt,
+                r_session=r_session,
+            )
+            if body:
+                validate_item(
+                    item_url,
+                    body,
+                    item_errors,
+                    item_warnings,
+                    context,
+                    r_session,
+                    open_assets_urls,
+                    stac_check_config,
+                    run=run,
+                )
+
+        items_with_errors += bool(item_errors)
+        items_with_warnings += bool(item_warnings)
+        for error in item_errors.errors:
+            errors += error
+        for warning in item_warnings.errors:
+            warnings += warning
+
+    logger.info(
+        f"Sampled {len(sampled)} items of collection '{collection}' from {sample_items} "
+        f"datetime/bbox strata (seed {seed}, {empty_strata} strata empty)"
+    )
+    for label, count in [
+        ("errors", items_with_errors),
+        ("stac-check recommendations", items_with_warnings),
+    ]:
+        low, high = wilson_interval(count, len(sampled))
+        logger.info(
+            f"Sampled items with {label}: {count}/{len(sampled)} "
+            f"({count / len(sampled):.1%}, 95% CI {low:.1%} - {high:.1%})"
+        )
+
+
+def validate_item_geometry(
+    item_url: str,
+    body: Dict[str, Any],
+    errors: Errors,
+    context: Context,
+) -> None:
+    if (geometry := body.get("geometry")) is None:
+        return
+    try:
+        # GEOS reads the GeoJSON itself, so malformed geometries only raise its errors
+        if not (geom := shapely.from_geojson(json.dumps(geometry))).is_valid:
+            errors += f"[{context}] GET {item_url} geometry is not valid: {explain_validity(geom)}"
+    except ShapelyError as e:
+        errors += f"[{context}] GET {item_url} geometry could not be parsed: {e}"
+
+
+def validate_deep_collection(
+    root_body: Dict[str, Any],
+    collection: str,
+    errors: Errors,
+    warnings: Warnings,
+    r_session: Session,
+    open_assets_urls: bool = True,
+    stac_check_config: Optional[str] = None,
+    run: Optional[ValidationRun] = None,
+    workers: Optional[int] = None,
+    use_search: bool = False,
+    limit: int = 100,
+    progress_seconds: float = 10.0,
+    max_findings: int = DEFAULT_DEEP_MAX_FINDINGS,
+    prefetch_pages: int = DEFAULT_PREFETCH_PAGES,
+) -> None:
+    root_links = root_body.get("links")
+    if use_search:
+        if not (search_link := link_by_rel(root_links, "search")):
+            errors += f"[{Context.ITEM_SEARCH}] /: Link[rel=search] missing, cannot run deep collection validation"
+            return
+        context = Context.ITEM_SEARCH
+        url = search_link["href"]
+        params: Dict[str, Any] = {"collections": collection, "limit": limit}
+    else:
+        if not (collections_link := link_by_rel(root_links, "data")):
+            errors += "/: Link[rel=data] must href /collections, cannot run deep collection validation"
+            return
+        context = Context.FEATURES
+        url = f"{collections_link['href']}/{collection}/items"
+        params = {"limit": limit}
+
+    asset_checker = run.asset_checker if run else None
+    if run:
+        # each item is retrieved once, so its findings aren't worth remembering, and its
+        # assets are checked with its page rather than collected for the end of the run
+        run = replace(run, asset_checker=None, verdicts=None)
+    if asset_checker:
+        open_assets_urls = False
+
+    workers = workers or os.cpu_count() or 1
+    # bounded, so paging waits for validation and only a few pages of items are held
+    pending: "queue.Queue[Optional[Tuple[str, Dict[str, Any]]]]" = queue.Queue(
+        maxsize=workers * 4
+    )
+    lock = threading.Lock()
+    validated = 0
+    reported = 0
+    unreported_errors = 0
+    unreported_warnings = 0
+
+    def report(new_errors: Errors, new_warnings: Warnings) -> None:
+        nonlocal errors, warnings, reported, unreported_errors, unreported_warnings
+        with lock:
+            for message in new_errors:
+                if reported < max_findings:
+                    errors += message
+                    reported += 1
+                else:
+                    unreported_errors += 1
+            for message in new_warnings:
+                if reported < max_findings:
+                    warnings += message
+                    reported += 1
+                else:
+                    unreported_warnings += 1
+
+    def validate_pending() -> None:
+        nonlocal validated
+        while (entry := pending.get()) is not None:
+            item_url, item = entry
+            item_errors = Errors()
+            item_warnings = Warnings()
+            try:
+                validate_item(
+                    item_url,
+                    item,
+                    item_errors,
+                    item_warnings,
+                    context,
+                    r_session,
+                    open_assets_urls,
+                    stac_check_config,
+                    run=run,
+                )
+                validate_item_geometry(item_url, item, item_errors, context)
+            except Exception as e:
+                # a worker that stopped would leave paging blocked on the full queue
+                item_errors += f"[{context}] GET {item_url} item '{item.get('id')}' could not be validated: {e}"
+            report(item_errors, item_warnings)
+            with lock:
+                validated += 1
+
+    def log_progress(label: str) -> None:
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"{label} '{collection}': {checked} items from {pages} pages in {elapsed:.1f}s "
+            f"({checked / elapsed:.1f} items/s, {pages / elapsed:.2f} pages/s), "
+            f"{malformed} failed structural validation, {validated} fully validated"
+        )
+
+    threads = [threading.Thread(target=validate_pending) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+
+    start = time.perf_counter()
+    last_progress = start
+    pages = 0
+    checked = 0
+    malformed = 0
+    page_stream = paginate(Method.GET, url, errors, context, r_session, params=params)
+    prefetcher = Prefetcher(page_stream, prefetch_pages) if prefetch_pages else None
+    try:
+        for page_url, page in prefetcher or page_stream:
+            pages += 1
+            features = page.get("features") or []
+            # only structurally sound items are worth the cost of full validation
+            structure_errors = page_structure_errors(features)
+            checked += len(features)
+            malformed += len(structure_errors)
+            page_errors = Errors()
+            page_warnings = Warnings()
+            page_assets: List[AssetReference] = []
+            for i, item in enumerate(features):
+                if i in structure_errors:
+                    page_errors += f"[{context}] : GET {page_url} item '{feature_label(features, i)}' failed structural validation: {'; '.join(structure_errors[i])}"
+                elif in_sample(item, run.full_validation_rate if run else 1.0):
+                    self_link = link_by_rel(item.get("links"), "self")
+                    item_url = (
+                        self_link.get("href", page_url) if self_link else page_url
+                    )
+                    if asset_checker:
+                        page_assets.extend(
+                            references(context, Method.GET, item_url, item)
+                        )
+                    pending.put((item_url, item))
+            if asset_checker and page_assets:
+                for reference, failure in asset_checker.check_references(page_assets):
+                    page_warnings += f"[{reference.context}] : {reference.method} {reference.url} '{reference.item_id}' asset '{reference.key}' {reference.href} is not reachable: {failure}"
+            report(page_errors, page_warnings)
+            if time.perf_counter() - last_progress >= progress_seconds:
+                last_progress = time.perf_counter()
+                log_progress("Deep validation of collection")
+    finally:
+        for _ in threads:
+            pending.put(None)
+        for thread in threads:
+            thread.join()
+
+    if unreported_errors:
+        errors += f"[{context}] : GET {url} {unreported_errors} more errors from deep validation of collection '{collection}' were not reported"
+    if unreported_warnings:
+        warnings += f"[{context}] : GET {url} {unreported_warnings} more warnings from deep validation of collection '{collection}' were not reported"
+
+    log_progress("Deep validation finished for collection")
+    if prefetcher is not None:
+        logger.info(
+            f"Prefetching {prefetch_pages} pages: {prefetcher.fetch_seconds:.1f}s fetching and "
+            f"{prefetcher.process_seconds:.1f}s processing pages overlapped for {prefetcher.overlap_seconds:.1f}s "
+            f"of {prefetcher.wall_seconds:.1f}s, with {prefetcher.wait_seconds:.1f}s waiting for pages"
+        )
+
+
 def validate_item_search(
     root_url: str,
     root_body: Dict[str, Any],
@@ -1391,6 +2214,13 @@ def validate_item_search(
     r_session: Session,
     validate_pagination: bool,
     open_assets_urls: bool = True,
+    run: Optional[ValidationRun] = None,
+    pagination_max_items: int = DEFAULT_PAGINATION_MAX_ITEMS,
+    pagination_bloom: bool = False,
+    pagination_latency_pages: Optional[int] = None,
+    pagination_latency_budget: float = DEFAULT_PAGINATION_LATENCY_BUDGET,
+    geometry_latency_budget: Optional[float] = None,
+    filter_repeats: int = DEFAULT_FILTER_REPEATS,
 ) -> None:
     links = root_body.get("links")
 
@@ -1443,8 +2273,10 @@ def validate_item_search(
             body,
             errors,
             Context.ITEM_SEARCH,
+            Method.GET,
             open_assets_urls,
             r_session.headers,
+            run=run,
         )
 
     validate_item_search_limit(search_url, methods, errors, r_session)
@@ -1468,6 +2300,17 @@ def validate_item_search(
             r_session=r_session,
         )
 
+    if geometry_latency_budget is not None:
+        validate_geometry_complexity(
+            search_url=search_url,
+            collection=collection,
+            geometry=geometry,
+            methods=methods,
+            warnings=warnings,
+            r_session=r_session,
+            budget=geometry_latency_budget,
+        )
+
     if validate_pagination:
         validate_item_pagination(
             root_url=root_url,
@@ -1479,6 +2322,11 @@ def validate_item_search(
             use_pystac_client=True,
             context=Context.ITEM_SEARCH,
             r_session=r_session,
+            max_items=pagination_max_items,
+            bloom=pagination_bloom,
+            warnings=warnings,
+            latency_pages=pagination_latency_pages,
+            latency_budget=pagination_latency_budget,
         )
 
     if supports(conforms_to, cc_item_search_fields_regex):
@@ -1515,6 +2363,7 @@ def validate_item_search(
             collection=collection,
             errors=errors,
             r_session=r_session,
+            repeats=filter_repeats,
         )
 
 
@@ -1556,7 +2405,7 @@ def validate_default_fields(
         errors += f"[{context}] : response had not items in response for '{desc}'"
         return
 
-    for field in ["type", "stac_version", "id", "geometry", "bbox", "links", "assets"]:
+    for field in required_item_fields:
         if not item.get(field):
             errors += f"[{context}] : {desc} response missing '{field}'"
     if not (
@@ -1580,647 +2429,198 @@ def validate_query(
     r_session: Session,
     context: Context,
     query_config: QueryConfig,
+    workers: int = DEFAULT_QUERY_WORKERS,
 ) -> None:
     # todo: validate that all the fields are configured
     # if not query_config [all the fields]:
     #     errors += f"[{context}] : cannot validate Query Extension because some configuration is not present"
     #     return
 
-    limit = 20
-
     search_method_to_url: dict[Method, str] = {
         Method[x.get("method", "GET")]: x.get("href")
         for x in links_by_rel(landing_page_body.get("links"), "search")
     }
 
-    # eq
-    query = {query_config.query_comparison_field: {"eq": query_config.query_eq_value}}
-
-    if Method.GET in search_method_to_url:
-        _, body, _ = retrieve(
-            Method.GET,
-            search_method_to_url[Method.GET],
-            params={
-                "query": json.dumps(query),
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
+    probes = []
+    for operator, field_attribute, value_attribute in QUERY_PROBES:
+        value: Any = getattr(query_config, value_attribute)
+        if operator == "in":
+            value = value.split(",")
+        probes.append(
+            QueryProbe(getattr(query_config, field_attribute), operator, value)
         )
 
-        if not len(body["features"]):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had no results"
+    validate_query_probes(
+        probes,
+        search_method_to_url,
+        collection,
+        errors,
+        context,
+        r_session,
+        workers=workers,
+    )
 
-        if not all(
-            f["properties"][query_config.query_comparison_field]
-            == float(query_config.query_eq_value)
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_comparison_field] for f in body['features']]}"
 
-    if Method.POST in search_method_to_url:
-        retrieve(
-            Method.POST,
-            search_method_to_url[Method.POST],
-            body={
-                "query": query,
+def validate_query_probes(
+    probes: List[QueryProbe],
+    search_method_to_url: Dict[Method, str],
+    collection: str,
+    errors: Errors,
+    context: Context,
+    r_session: Session,
+    limit: int = 20,
+    workers: int = DEFAULT_QUERY_WORKERS,
+) -> None:
+    # every probe with every search method, requested concurrently, and reported in
+    # the order of the probes whatever order the responses arrive in
+    requests = [
+        (probe, method)
+        for probe in probes
+        for method in (Method.GET, Method.POST)
+        if method in search_method_to_url
+    ]
+
+    def probe_search(request: Tuple[QueryProbe, Method]) -> Errors:
+        probe, method = request
+        probe_errors = Errors()
+        if method == Method.GET:
+            params: Optional[Dict[str, Any]] = {
+                "query": probe.text,
                 "limit": limit,
                 "collections": collection,
-            },
-            errors=errors,
+            }
+            body: Optional[Dict[str, Any]] = None
+        else:
+            params = None
+            body = {"query": probe.query, "limit": limit, "collections": [collection]}
+        _, response, _ = retrieve(
+            method,
+            search_method_to_url[method],
+            params=params,
+            body=body,
+            errors=probe_errors,
             context=context,
             r_session=r_session,
         )
+        if response is None:
+            return probe_errors
+
+        features = response.get("features") or []
+        if not features:
+            probe_errors += f"[{context}] : {method} search with Query '{probe.text}' had no results"
+        elif probe.non_matching(features):
+            probe_errors += f"[{context}] : {method} search with Query '{probe.text}' had non-matching results: got {probe.values(features)}"
+        return probe_errors
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(workers, len(requests)))
+    ) as executor:
+        for probe_errors in executor.map(probe_search, requests):
+            errors.errors.extend(probe_errors.errors)
+    logger.info(
+        f"[{context}] {len(requests)} Query Extension searches in {time.perf_counter() - start:.2f}s"
+    )
 
-        if not len(body["features"]):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had no results"
 
-        if not all(
-            f["properties"][query_config.query_comparison_field]
-            == float(query_config.query_eq_value)
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_comparison_field] for f in body['features']]}"
+def validate_fields(
+    landing_page_body: Dict[str, Any],
+    collection: str,
+    errors: Errors,
+    warnings: Warnings,
+    r_session: Session,
+    context: Context,
+    fields_nested_property: Optional[str],
+) -> None:
+    if not fields_nested_property:
+        errors += f"[{context}] : cannot validate Fields Extension because --fields-nested-property is not set"
+        return
 
-    # neq
-    query = {query_config.query_comparison_field: {"neq": query_config.query_neq_value}}
+    # 1. If `fields` attribute is specified as an empty object (for POST requests),
+    # an empty string (for GET requests),
+    # or with both `include` and `exclude` set to null or an
+    # empty array, then the recommended behavior is to include only fields
+    # `type`, `stac_version`, `id`, `geometry`, `bbox`, `links`, `assets`, and `properties.datetime`.
 
-    if Method.GET in search_method_to_url:
-        _, body, _ = retrieve(
-            Method.GET,
-            search_method_to_url[Method.GET],
-            params={
-                "query": json.dumps(query),
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
+    search_method_to_url: dict[Method, str] = {
+        Method[x.get("method", "GET")]: x.get("href")
+        for x in links_by_rel(landing_page_body.get("links"), "search")
+    }
 
-        if not len(body["features"]):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had no results"
+    def first_item(body: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+        if body:
+            return next(iter(body.get("features", [])), None)
+        else:
+            return None
 
-        if not all(
-            f["properties"][query_config.query_comparison_field]
-            != float(query_config.query_neq_value)
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_comparison_field] for f in body['features']]}"
+    def validate_include_field(
+        desc: str,
+        body: dict[str, Any],
+        field: str,
+        errors: Errors,
+        warnings: Warnings,
+        allow_extra: bool = False,
+    ):
+        if not body or not (item := first_item(body)):
+            errors += f"[{context}] : response had no items in response for {desc}"
+        else:
+            field = field if not field.startswith("+") else field[1:]
+            # todo: rewrite this to arbitrarily deep
+            if "." in field:
+                parts = field.split(".")
+                value = item.get(parts[0], {}).get(parts[1])
+            else:
+                value = item.get(field)
 
-    if Method.POST in search_method_to_url:
-        retrieve(
-            Method.POST,
-            search_method_to_url[Method.POST],
-            body={
-                "query": query,
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
+            if not value:
+                errors += f"[{context}] : {desc} response missing '{field}'"
+
+            if not allow_extra:
+                if len(item) > 5:
+                    errors += f"[{context}] : {desc} response contained more than 5 extra fields {list(item.keys())}"
 
-        if not len(body["features"]):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had no results"
+                item.pop(field, None)
+                if item:
+                    warnings += f"[{context}] : {desc} response contained extra fields {list(item.keys())}"
 
-        if not all(
-            f["properties"][query_config.query_comparison_field]
-            != float(query_config.query_neq_value)
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_comparison_field] for f in body['features']]}"
+    def validate_exclude_field(
+        desc: str,
+        body: dict[str, Any],
+        field: str,
+        errors: Errors,
+        warnings: Warnings,
+        disallow_extra: bool = True,
+    ):
+        if not body or not (item := first_item(body)):
+            errors += f"[{context}] : response had no items in response for {desc}"
+        else:
+            # todo: rewrite this to arbitrarily deep
+            if "." in field:
+                parts = field.split(".")
+                value = item.get(parts[0], {}).get(parts[1])
+            else:
+                value = item.get(field)
+
+            if value:
+                errors += f"[{context}] : {desc} response contained '{field}', but should have been excluded"
 
-    # lt
-    query = {query_config.query_comparison_field: {"lt": query_config.query_lt_value}}
+            if disallow_extra:
+                if len(item) < 5:
+                    errors += f"[{context}] : {desc} response contained fewer than 5 fields {list(item.keys())}"
 
     if Method.GET in search_method_to_url:
         _, body, _ = retrieve(
             Method.GET,
             search_method_to_url[Method.GET],
-            params={
-                "query": json.dumps(query),
-                "limit": limit,
-                "collections": collection,
-            },
+            params={"fields": "", "limit": 1, "collections": collection},
             errors=errors,
             context=context,
             r_session=r_session,
         )
 
-        if not len(body["features"]):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had no results"
-
-        if not all(
-            f["properties"][query_config.query_comparison_field]
-            < float(query_config.query_lt_value)
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_comparison_field] for f in body['features']]}"
-
-    if Method.POST in search_method_to_url:
-        retrieve(
-            Method.POST,
-            search_method_to_url[Method.POST],
-            body={
-                "query": query,
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had no results"
-
-        if not all(
-            f["properties"][query_config.query_comparison_field]
-            < float(query_config.query_lt_value)
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_comparison_field] for f in body['features']]}"
-
-    # lte
-    query = {query_config.query_comparison_field: {"lte": query_config.query_lte_value}}
-
-    if Method.GET in search_method_to_url:
-        _, body, _ = retrieve(
-            Method.GET,
-            search_method_to_url[Method.GET],
-            params={
-                "query": json.dumps(query),
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had no results"
-
-        if not all(
-            f["properties"][query_config.query_comparison_field]
-            <= float(query_config.query_lte_value)
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_comparison_field] for f in body['features']]}"
-
-    if Method.POST in search_method_to_url:
-        retrieve(
-            Method.POST,
-            search_method_to_url[Method.POST],
-            body={
-                "query": query,
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had no results"
-
-        if not all(
-            f["properties"][query_config.query_comparison_field]
-            <= float(query_config.query_lte_value)
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_comparison_field] for f in body['features']]}"
-
-    # gt
-    query = {query_config.query_comparison_field: {"gt": query_config.query_gt_value}}
-
-    if Method.GET in search_method_to_url:
-        _, body, _ = retrieve(
-            Method.GET,
-            search_method_to_url[Method.GET],
-            params={
-                "query": json.dumps(query),
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had no results"
-
-        if not all(
-            f["properties"][query_config.query_comparison_field]
-            > float(query_config.query_gt_value)
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_comparison_field] for f in body['features']]}"
-
-    if Method.POST in search_method_to_url:
-        retrieve(
-            Method.POST,
-            search_method_to_url[Method.POST],
-            body={
-                "query": query,
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had no results"
-
-        if not all(
-            f["properties"][query_config.query_comparison_field]
-            > float(query_config.query_gt_value)
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_comparison_field] for f in body['features']]}"
-
-    # gte
-    query = {query_config.query_comparison_field: {"gte": query_config.query_gte_value}}
-
-    if Method.GET in search_method_to_url:
-        _, body, _ = retrieve(
-            Method.GET,
-            search_method_to_url[Method.GET],
-            params={
-                "query": json.dumps(query),
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had no results"
-
-        if not all(
-            f["properties"][query_config.query_comparison_field]
-            >= float(query_config.query_gte_value)
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_comparison_field] for f in body['features']]}"
-
-    if Method.POST in search_method_to_url:
-        retrieve(
-            Method.POST,
-            search_method_to_url[Method.POST],
-            body={
-                "query": query,
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had no results"
-
-        if not all(
-            f["properties"][query_config.query_comparison_field]
-            >= float(query_config.query_gte_value)
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_comparison_field] for f in body['features']]}"
-
-    # startsWith
-    query = {
-        query_config.query_substring_field: {
-            "startsWith": query_config.query_starts_with_value
-        }
-    }
-
-    if Method.GET in search_method_to_url:
-        _, body, _ = retrieve(
-            Method.GET,
-            search_method_to_url[Method.GET],
-            params={
-                "query": json.dumps(query),
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had no results"
-
-        if not all(
-            str(f["properties"][query_config.query_substring_field]).startswith(
-                str(query_config.query_starts_with_value)
-            )
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_substring_field] for f in body['features']]}"
-
-    if Method.POST in search_method_to_url:
-        retrieve(
-            Method.POST,
-            search_method_to_url[Method.POST],
-            body={
-                "query": query,
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had no results"
-
-        if not all(
-            str(f["properties"][query_config.query_substring_field]).startswith(
-                str(query_config.query_starts_with_value)
-            )
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_substring_field] for f in body['features']]}"
-
-    # endsWith
-    query = {
-        query_config.query_substring_field: {
-            "endsWith": query_config.query_ends_with_value
-        }
-    }
-
-    if Method.GET in search_method_to_url:
-        _, body, _ = retrieve(
-            Method.GET,
-            search_method_to_url[Method.GET],
-            params={
-                "query": json.dumps(query),
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had no results"
-
-        if not all(
-            str(f["properties"][query_config.query_substring_field]).endswith(
-                str(query_config.query_ends_with_value)
-            )
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_substring_field] for f in body['features']]}"
-
-    if Method.POST in search_method_to_url:
-        retrieve(
-            Method.POST,
-            search_method_to_url[Method.POST],
-            body={
-                "query": query,
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had no results"
-
-        if not all(
-            str(f["properties"][query_config.query_substring_field]).endswith(
-                str(query_config.query_ends_with_value)
-            )
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_substring_field] for f in body['features']]}"
-
-    # contains
-    query = {
-        query_config.query_substring_field: {
-            "contains": query_config.query_contains_value
-        }
-    }
-
-    if Method.GET in search_method_to_url:
-        _, body, _ = retrieve(
-            Method.GET,
-            search_method_to_url[Method.GET],
-            params={
-                "query": json.dumps(query),
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had no results"
-
-        if not all(
-            str(query_config.query_contains_value)
-            in str(f["properties"][query_config.query_substring_field])
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_substring_field] for f in body['features']]}"
-
-    if Method.POST in search_method_to_url:
-        retrieve(
-            Method.POST,
-            search_method_to_url[Method.POST],
-            body={
-                "query": query,
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had no results"
-
-        if not all(
-            str(query_config.query_contains_value)
-            in str(f["properties"][query_config.query_substring_field])
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_substring_field] for f in body['features']]}"
-
-    # in
-    query_in_values_array = query_config.query_in_values.split(",")
-    query = {query_config.query_in_field: {"in": query_in_values_array}}
-
-    if Method.GET in search_method_to_url:
-        _, body, _ = retrieve(
-            Method.GET,
-            search_method_to_url[Method.GET],
-            params={
-                "query": json.dumps(query),
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had no results"
-
-        if any(
-            set(query_in_values_array).isdisjoint(
-                set(f["properties"][query_config.query_in_field])
-            )
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : GET search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_in_field] for f in body['features']]}"
-
-    if Method.POST in search_method_to_url:
-        retrieve(
-            Method.POST,
-            search_method_to_url[Method.POST],
-            body={
-                "query": query,
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had no results"
-
-        if any(
-            set(query_in_values_array).isdisjoint(
-                set(f["properties"][query_config.query_in_field])
-            )
-            for f in body["features"]
-        ):
-            errors += f"[{context}] : POST search with Query '{json.dumps(query)}' had non-matching results: got {[f['properties'][query_config.query_in_field] for f in body['features']]}"
-
-
-def validate_fields(
-    landing_page_body: Dict[str, Any],
-    collection: str,
-    errors: Errors,
-    warnings: Warnings,
-    r_session: Session,
-    context: Context,
-    fields_nested_property: Optional[str],
-) -> None:
-    if not fields_nested_property:
-        errors += f"[{context}] : cannot validate Fields Extension because --fields-nested-property is not set"
-        return
-
-    # 1. If `fields` attribute is specified as an empty object (for POST requests),
-    # an empty string (for GET requests),
-    # or with both `include` and `exclude` set to null or an
-    # empty array, then the recommended behavior is to include only fields
-    # `type`, `stac_version`, `id`, `geometry`, `bbox`, `links`, `assets`, and `properties.datetime`.
-
-    search_method_to_url: dict[Method, str] = {
-        Method[x.get("method", "GET")]: x.get("href")
-        for x in links_by_rel(landing_page_body.get("links"), "search")
-    }
-
-    def first_item(body: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
-        if body:
-            return next(iter(body.get("features", [])), None)
-        else:
-            return None
-
-    def validate_include_field(
-        desc: str,
-        body: dict[str, Any],
-        field: str,
-        errors: Errors,
-        warnings: Warnings,
-        allow_extra: bool = False,
-    ):
-        if not body or not (item := first_item(body)):
-            errors += f"[{context}] : response had no items in response for {desc}"
-        else:
-            field = field if not field.startswith("+") else field[1:]
-            # todo: rewrite this to arbitrarily deep
-            if "." in field:
-                parts = field.split(".")
-                value = item.get(parts[0], {}).get(parts[1])
-            else:
-                value = item.get(field)
-
-            if not value:
-                errors += f"[{context}] : {desc} response missing '{field}'"
-
-            if not allow_extra:
-                if len(item) > 5:
-                    errors += f"[{context}] : {desc} response contained more than 5 extra fields {list(item.keys())}"
-
-                item.pop(field, None)
-                if item:
-                    warnings += f"[{context}] : {desc} response contained extra fields {list(item.keys())}"
-
-    def validate_exclude_field(
-        desc: str,
-        body: dict[str, Any],
-        field: str,
-        errors: Errors,
-        warnings: Warnings,
-        disallow_extra: bool = True,
-    ):
-        if not body or not (item := first_item(body)):
-            errors += f"[{context}] : response had no items in response for {desc}"
-        else:
-            # todo: rewrite this to arbitrarily deep
-            if "." in field:
-                parts = field.split(".")
-                value = item.get(parts[0], {}).get(parts[1])
-            else:
-                value = item.get(field)
-
-            if value:
-                errors += f"[{context}] : {desc} response contained '{field}', but should have been excluded"
-
-            if disallow_extra:
-                if len(item) < 5:
-                    errors += f"[{context}] : {desc} response contained fewer than 5 fields {list(item.keys())}"
-
-    if Method.GET in search_method_to_url:
-        _, body, _ = retrieve(
-            Method.GET,
-            search_method_to_url[Method.GET],
-            params={"fields": "", "limit": 1, "collections": collection},
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        validate_default_fields(
-            first_item(body), "GET with empty 'fields' value", context, errors
-        )
+        validate_default_fields(
+            first_item(body), "GET with empty 'fields' value", context, errors
+        )
 
     if Method.POST in search_method_to_url:
         retrieve(
@@ -2483,6 +2883,9 @@ def validate_item_search_filter(
     collection: str,
     errors: Errors,
     r_session: Session,
+    limit: int = DEFAULT_FILTER_LIMIT,
+    workers: int = DEFAULT_FILTER_WORKERS,
+    repeats: int = DEFAULT_FILTER_REPEATS,
 ) -> None:
     search_links = links_by_rel(root_body["links"], "search")
     search_url = search_links[0]["href"]
@@ -2576,8 +2979,7 @@ def validate_item_search_filter(
     # Property-Property Comparisons: http://www.opengis.net/spec/cql2/1.0/conf/property-property
     # Accent and Case-insensitive Comparison: http://www.opengis.net/spec/cql2/1.0/conf/accent-case-insensitive-comparison
 
-    filter_texts: List[str] = []
-    filter_jsons: List[Dict[str, Any]] = []
+    filters: List[Dict[str, Any]] = []
 
     if basic_cql2_supported:
         # todo: better error handling when the wrong collection name is given, so 0 results
@@ -2593,90 +2995,236 @@ def validate_item_search_filter(
         assert body
         item = body["features"][0]
 
-        if cql2_text_supported:
-            filter_texts.append(cql2_text_ex_3)
-            filter_texts.append(cql2_text_ex_4)
-            filter_texts.append(cql2_text_ex_9)
-            filter_texts.append(cql2_text_and(item["id"], collection))
-            filter_texts.append(cql2_text_or(item["id"], collection))
-            filter_texts.append(cql2_text_not(item["id"]))
-            filter_texts.extend(cql2_text_string_comparisons(collection))
-            filter_texts.extend(cql2_text_numeric_comparisons)
-            filter_texts.extend(cql2_text_timestamp_comparisons)
-
-            # todo boolean and date
-
-        if cql2_json_supported:
-            filter_jsons.append(cql2_json_ex_3)
-            filter_jsons.append(cql2_json_ex_4)
-            filter_jsons.append(cql2_json_ex_9)
-            filter_jsons.append(cql2_json_and(item["id"], collection))
-            filter_jsons.append(cql2_json_or(item["id"], collection))
-            filter_jsons.append(cql2_json_not(item["id"]))
-            filter_jsons.extend(cql2_json_string_comparisons(collection))
-            filter_jsons.extend(cql2_json_numeric_comparisons)
-            filter_jsons.extend(cql2_json_timestamp_comparisons)
-
-            # todo boolean and date
+        filters.append(cql2_json_ex_3)
+        filters.append(cql2_json_ex_4)
+        filters.append(cql2_json_ex_9)
+        filters.append(cql2_json_and(item["id"], collection))
+        filters.append(cql2_json_or(item["id"], collection))
+        filters.append(cql2_json_not(item["id"]))
+        filters.extend(cql2_json_string_comparisons(collection))
+        filters.extend(cql2_json_numeric_comparisons)
+        filters.extend(cql2_json_timestamp_comparisons)
+
+        # todo boolean and date
 
     if advanced_comparison_operators_supported:
-        if cql2_text_supported:
-            filter_texts.append(cql2_text_between)
-            filter_texts.append(cql2_text_not_between)
-            filter_texts.append(cql2_text_like)
-            filter_texts.append(cql2_text_not_like)
-
-        if cql2_json_supported:
-            filter_jsons.append(cql2_json_between)
-            filter_jsons.append(cql2_json_not_between)
-            filter_jsons.append(cql2_json_like)
-            filter_jsons.append(cql2_json_not_like)
+        filters.append(cql2_json_between)
+        filters.append(cql2_json_not_between)
+        filters.append(cql2_json_like)
+        filters.append(cql2_json_not_like)
 
     if basic_spatial_operators_supported:
-        if cql2_text_supported:
-            filter_texts.append(cql2_text_s_intersects)
-            filter_texts.append(cql2_text_ex_2(collection))
-            filter_texts.append(cql2_text_ex_8)
+        filters.append(cql2_json_s_intersects)
+        filters.append(cql2_json_ex_2(collection))
+        filters.append(cql2_json_ex_8)
+
+    if temporal_operators_supported:
+        filters.append(cql2_json_ex_6)
+
+    if basic_spatial_operators_supported and temporal_operators_supported:
+        filters.append(cql2_json_common_1)
 
-        if cql2_json_supported:
-            filter_jsons.append(cql2_json_s_intersects)
-            filter_jsons.append(cql2_json_ex_2(collection))
-            filter_jsons.append(cql2_json_ex_8)
+    # todo: use terms not in queryables
+
+    encodings = [
+        encoding
+        for encoding, supported in (
+            ("cql2-text", cql2_text_supported),
+            ("cql2-json", cql2_json_supported),
+        )
+        if supported
+    ]
+    validate_filter_searches(
+        filters,
+        encodings,
+        filter_search_urls(search_links),
+        errors,
+        r_session,
+        limit=limit,
+        workers=workers,
+        repeats=repeats,
+    )
 
-    if temporal_operators_supported:
-        if cql2_text_supported:
-            filter_texts.append(cql2_text_ex_6)
 
-        if cql2_json_supported:
-            filter_jsons.append(cql2_json_ex_6)
+def filter_search_urls(search_links: List[Dict[str, Any]]) -> Dict[Method, str]:
+    # the url of each search link's method, where a link without one is for GET; both
+    # methods fall back to the first search link, as the filter searches always did
+    search_method_to_url = {
+        Method[x.get("method", "GET")]: x["href"] for x in search_links if x.get("href")
+    }
+    for method in (Method.GET, Method.POST):
+        search_method_to_url.setdefault(method, search_links[0]["href"])
+    return search_method_to_url
+
+
+def filter_search(
+    f_json: Dict[str, Any], encoding: str, method: Method, limit: int
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    # the (params, body) of a search with the filter in either encoding, in the query
+    # string of a GET, where CQL2-JSON is itself encoded as a string, or a POST body
+    if encoding == "cql2-text":
+        encoded: Any = to_text(f_json)
+    elif method == Method.GET:
+        encoded = json.dumps(f_json)
+    else:
+        encoded = f_json
+    search = {"limit": limit, "filter-lang": encoding, "filter": encoded}
+    return (search, None) if method == Method.GET else (None, search)
 
-    if basic_spatial_operators_supported and temporal_operators_supported:
-        if cql2_json_supported:
-            filter_jsons.append(cql2_json_common_1)
 
-    # todo: use terms not in queryables
-    # todo: how to support all 4 combos of GET|POST & Text|JSON ?
+def validate_filter_searches(
+    filters: List[Dict[str, Any]],
+    encodings: List[str],
+    search_method_to_url: Dict[Method, str],
+    errors: Errors,
+    r_session: Session,
+    limit: int = DEFAULT_FILTER_LIMIT,
+    workers: int = DEFAULT_FILTER_WORKERS,
+    repeats: int = DEFAULT_FILTER_REPEATS,
+) -> Dict[int, List[float]]:
+    # every filter in every encoding with every search method, requested
+    # concurrently, and reported in the order of the filters whatever order the
+    # responses arrive in
+    requests = [
+        (index, encoding, method)
+        for index in range(len(filters))
+        for encoding in encodings
+        for method in (Method.GET, Method.POST)
+        if method in search_method_to_url
+    ]
 
-    for f_text in filter_texts:
-        retrieve(
-            Method.GET,
+    # each filter is compiled once, and shared by the threads checking its results
+    compiled_filters = [compile_filter(f_json) for f_json in filters]
+
+    def search(
+        request: Tuple[int, str, Method], check: bool = True
+    ) -> Tuple[Errors, float]:
+        index, encoding, method = request
+        search_errors = Errors()
+        params, body = filter_search(filters[index], encoding, method, limit)
+        search_url = search_method_to_url[method]
+        start = time.perf_counter()
+        _, response, _ = retrieve(
+            method,
             search_url,
-            errors,
+            search_errors,
             Context.ITEM_SEARCH_FILTER,
+            r_session,
+            params=params,
+            body=body,
             content_type=geojson_mt,
-            r_session=r_session,
-            params={"limit": 1, "filter-lang": "cql2-text", "filter": f_text},
+            additional=f"with {encoding} filter",
         )
+        seconds = time.perf_counter() - start
+        if not check:
+            return Errors(), seconds
+        if (
+            (compiled := compiled_filters[index]) is not None
+            and response
+            and isinstance(features := response.get("features"), list)
+        ):
+            validate_filter_results(
+                compiled, features, method, search_url, search_errors
+            )
+        return search_errors, seconds
+
+    # the seconds of each search of each filter, by the filter's index
+    timings: Dict[int, List[float]] = {index: [] for index in range(len(filters))}
+    if not requests:
+        return timings
+    start = time.perf_counter()
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(workers, len(requests)))
+    ) as executor:
+        for search_errors, _ in executor.map(search, requests):
+            errors.errors.extend(search_errors.errors)
+    logger.info(
+        f"[{Context.ITEM_SEARCH_FILTER}] {len(requests)} Filter Extension searches "
+        f"({len(filters)} filters, {', '.join(encodings)}, "
+        f"{', '.join(str(m) for m in search_method_to_url)}) in {time.perf_counter() - start:.2f}s"
+    )
 
-    for f_json in filter_jsons:
-        retrieve(
-            Method.POST,
-            search_url,
-            body={"limit": 1, "filter-lang": "cql2-json", "filter": f_json},
-            errors=errors,
-            context=Context.ITEM_SEARCH_FILTER,
-            content_type=geojson_mt,
-            r_session=r_session,
+    # the latencies are timed apart from the concurrent searches, one search at a
+    # time, so they are of the searches rather than of the server under that load;
+    # only on request, as that sends every search again
+    if repeats:
+        for _ in range(repeats):
+            for request in requests:
+                timings[request[0]].append(search(request, False)[1])
+        log_filter_latency(filter_latency(filters, timings))
+    return timings
+
+
+def filter_latency(
+    filters: List[Dict[str, Any]], timings: Dict[int, List[float]]
+) -> List[Tuple[str, str, int, int, float, float]]:
+    # the (operator class, queryable, filters, searches, p50, p95 seconds) of each
+    # construct, over the searches of every filter using it, slowest p95 first
+    by_construct: Dict[Tuple[str, str], List[int]] = {}
+    for index, f_json in enumerate(filters):
+        for construct in filter_constructs(f_json):
+            by_construct.setdefault(construct, []).append(index)
+
+    rows = []
+    for (operator_class, queryable), indexes in by_construct.items():
+        seconds = [s for index in indexes for s in timings.get(index, [])]
+        if seconds:
+            rows.append(
+                (
+                    operator_class,
+                    queryable,
+                    len(indexes),
+                    len(seconds),
+                    percentile(seconds, 0.5),
+                    percentile(seconds, 0.95),
+                )
+            )
+    return sorted(rows, key=lambda row: (-row[5], -row[4], row[0], row[1]))
+
+
+def log_filter_latency(rows: List[Tuple[str, str, int, int, float, float]]) -> None:
+    if not rows:
+        return
+    width = max(len("queryable"), *(len(row[1]) for row in rows))
+    lines = [
+        f"{'operator':<10}  {'queryable':<{width}}  {'filters':>7}  {'searches':>8}  {'p50 ms':>8}  {'p95 ms':>8}"
+    ] + [
+        f"{operator_class:<10}  {queryable:<{width}}  {filters:>7}  {searches:>8}  {p50 * 1000:>8.0f}  {p95 * 1000:>8.0f}"
+        for operator_class, queryable, filters, searches, p50, p95 in rows
+    ]
+    logger.info(
+        f"[{Context.ITEM_SEARCH_FILTER}] slowest filter constructs, by the latency of the "
+        "searches with filters using them:\n" + "\n".join(lines)
+    )
+
+
+def compile_filter(f_json: Dict[str, Any]) -> Optional[CompiledFilter]:
+    # filters that cannot be evaluated locally are only sent
+    try:
+        return CompiledFilter(f_json)
+    except ValueError as e:
+        logger.warning(
+            f"[{Context.ITEM_SEARCH_FILTER}] results for filter={json.dumps(f_json)} not checked: {e}"
+        )
+        return None
+
+
+def validate_filter_results(
+    compiled: CompiledFilter,
+    features: List[Any],
+    method: Method,
+    search_url: str,
+    errors: Errors,
+) -> None:
+    f_json = compiled.expression
+    offending = compiled.non_matching(features)
+    if offending:
+        sample = ", ".join(
+            feature_label(features, i) for i in offending[:DEFAULT_SAMPLE_IDS]
+        )
+        errors += (
+            f"[{Context.ITEM_SEARCH_FILTER}] : {method} {search_url} {len(offending)} of {len(features)} search results for "
+            f"filter={json.dumps(f_json)} do not match it, including: {sample}"
         )
 
 
@@ -2772,6 +3320,24 @@ def validate_item_search_bbox_xor_intersects(
         )
 
 
+def paginated_duplicates(
+    items: Callable[[], Iterable[Dict[str, Any]]],
+    max_items: int,
+    bloom: bool,
+) -> Tuple[int, int]:
+    # streams up to one item past max_items, keeping only counters and the digests of
+    # (collection, id), so max_items can be in the millions
+    detector = DuplicateDetector(bloom=bloom, expected_items=max_items)
+    for item in itertools.islice(items(), max_items + 1):
+        detector.add(item.get("collection"), str(item.get("id")))
+    if detector.needs_confirmation:
+        detector.confirm(
+            (item.get("collection"), str(item.get("id")))
+            for item in itertools.islice(items(), detector.items)
+        )
+    return detector.items, detector.duplicates
+
+
 def validate_item_pagination(
     root_url: str,
     search_url: str,
@@ -2782,6 +3348,11 @@ def validate_item_pagination(
     use_pystac_client: bool,
     context: Context,
     r_session: Session,
+    max_items: int = DEFAULT_PAGINATION_MAX_ITEMS,
+    bloom: bool = False,
+    warnings: Optional[Warnings] = None,
+    latency_pages: Optional[int] = None,
+    latency_budget: float = DEFAULT_PAGINATION_LATENCY_BUDGET,
 ) -> None:
     url = f"{search_url}?limit=1"
     if collection is not None:
@@ -2822,114 +3393,671 @@ def validate_item_pagination(
                 f"[{context}] GET pagination first request had no 'next' link relation"
             )
 
-    max_items = 100
-
     # todo: how to paginate over items, not just search?
 
     if use_pystac_client and collection is not None:
         try:
             client = Client.open(root_url, headers=r_session.headers)
-            search = client.search(
-                method="GET", collections=[collection], max_items=max_items, limit=5
+            count, duplicates = paginated_duplicates(
+                lambda: client.search(
+                    method="GET", collections=[collection], max_items=max_items, limit=5
+                ).items_as_dicts(),
+                max_items,
+                bloom,
             )
 
-            items = list(search.items_as_dicts())
-
-            if len(items) > max_items:
+            if count > max_items:
                 errors += f"[{context}] GET pagination - more than max items returned from paginating"
 
-            if len(items) > len({item["id"] for item in items}):
+            if duplicates:
                 errors += f"[{context}] GET pagination - duplicate items returned from paginating items"
         except Exception as e:
             errors += (
                 f"{context} pystac-client threw exception while testing pagination {e}"
             )
-    elif use_pystac_client and collection is None:
-        errors += f"[{context}] GET pagination - pystac-client tests not run, collection is not defined"
+    elif use_pystac_client and collection is None:
+        errors += f"[{context}] GET pagination - pystac-client tests not run, collection is not defined"
+
+    # GET paging has a problem with intersects https://github.com/stac-utils/pystac-client/issues/335
+    # search = client.search(method="GET", collections=[collection], intersects=geometry)
+    # if len(list(take(20000, search.items_as_dicts()))) == 20000:
+    #     errors +=
+    #         f"STAC API - Item Search GET pagination - paged through 20,000 results. This could mean the last page "
+    #         f"of results references itself, or your collection and geometry combination has too many results."
+    #     )
+
+    if Method.POST in methods:
+        initial_json_body = {"limit": 1, "collections": [collection]}
+
+        _, first_body, _ = retrieve(
+            Method.POST,
+            search_url,
+            errors,
+            Context.ITEM_SEARCH,
+            body=initial_json_body,
+            r_session=r_session,
+        )
+
+        if first_body and (link := link_by_rel(first_body.get("links"), "next")):
+            if (method := link.get("method")) and method != "POST":
+                errors += f"STAC API - Item Search POST pagination first request 'next' link relation has method {method} instead of 'POST'"
+
+            next_url = link.get("href")
+            if next_url is None:
+                errors += "STAC API - Item Search POST pagination first request 'next' link relation missing href"
+            else:
+                if url == next_url:
+                    errors += "STAC API - Item Search POST pagination next href same as first url"
+
+                next_body: Dict[str, Any] = link.get("body", {})
+                if not link.get("merge", False):
+                    second_json_body = next_body
+                else:
+                    second_json_body = initial_json_body
+                    second_json_body.update(next_body)
+
+                retrieve(
+                    Method.POST,
+                    next_url,
+                    errors,
+                    Context.ITEM_SEARCH,
+                    body=second_json_body,
+                    r_session=r_session,
+                )
+        else:
+            errors += (
+                f"[{context}] POST pagination first request had no 'next' link relation"
+            )
+
+        if use_pystac_client and collection is not None:
+            try:
+                client = Client.open(root_url, headers=r_session.headers)
+                count, duplicates = paginated_duplicates(
+                    lambda: client.search(
+                        method="POST",
+                        collections=[collection],
+                        max_items=max_items,
+                        limit=5,
+                    ).items_as_dicts(),
+                    max_items,
+                    bloom,
+                )
+
+                if count > max_items:
+                    errors += f"[{context}] POST pagination - more than max items returned from paginating"
+
+                if duplicates:
+                    errors += f"[{context}] POST pagination - duplicate items returned from paginating items"
+
+                if geometry is not None:
+                    validate_intersects_results(
+                        Method.POST,
+                        search_url,
+                        collection,
+                        geometry,
+                        errors,
+                        context,
+                        r_session,
+                        max(max_items, DEFAULT_INTERSECTS_MAX_ITEMS),
+                    )
+            except Exception as e:
+                errors += f"pystac-client threw exception while testing pagination {e}"
+        elif collection is not None:
+            errors += f"[{context}] POST pagination - pystac-client tests not run, collection is undefined"
+
+    if (
+        use_pystac_client
+        and collection is not None
+        and warnings is not None
+        and {Method.GET, Method.POST} <= methods
+    ):
+        validate_search_equivalence(
+            search_url,
+            collection,
+            errors,
+            warnings,
+            context,
+            r_session,
+            max_items,
+        )
+
+    if latency_pages and warnings is not None:
+        for method in sorted(methods & {Method.GET, Method.POST}, key=str):
+            validate_pagination_latency(
+                method,
+                search_url,
+                collection,
+                errors,
+                warnings,
+                context,
+                r_session,
+                latency_pages,
+                latency_budget,
+            )
+
+
+def validate_intersects_results(
+    method: Method,
+    search_url: str,
+    collection: str,
+    geometry: str,
+    errors: Errors,
+    context: Context,
+    r_session: Session,
+    max_items: int,
+    limit: int = DEFAULT_INTERSECTS_LIMIT,
+    prefetch_pages: int = DEFAULT_PREFETCH_PAGES,
+) -> Tuple[int, int]:
+    # pages through the whole intersects result set, testing each page against the
+    # prepared query geometry as it arrives, so only one page and counters are held
+    query = query_geometry(json.loads(geometry))
+    params: Optional[Dict[str, Any]] = None
+    body: Optional[Dict[str, Any]] = None
+    if method == Method.GET:
+        params = {"collections": collection, "intersects": geometry, "limit": limit}
+    else:
+        body = {
+            "collections": [collection],
+            "intersects": json.loads(geometry),
+            "limit": limit,
+        }
+
+    # 8 to 16 bytes per item, to stop on the first page repeating earlier items
+    detector = DuplicateDetector(expected_items=max_items)
+    checked = 0
+    non_intersecting_count = 0
+    sample: List[str] = []
+    page_stream = paginate(
+        method, search_url, errors, context, r_session, params=params, body=body
+    )
+    prefetcher = Prefetcher(page_stream, prefetch_pages) if prefetch_pages else None
+    pages = iter(prefetcher or page_stream)
+    try:
+        for _, page in pages:
+            features = page.get("features") or []
+            if any(
+                [
+                    detector.add(item.get("collection"), str(item.get("id")))
+                    for item in features
+                    if isinstance(item, dict)
+                ]
+            ):
+                errors += (
+                    f"[{context}] {method} pagination - duplicate items returned from paginating items with "
+                    "intersects. This could mean the last page of results references itself."
+                )
+                break
+            checked += len(features)
+            if offending := non_intersecting(query, features):
+                non_intersecting_count += len(offending)
+                sample.extend(
+                    feature_label(features, i)
+                    for i in offending[: DEFAULT_SAMPLE_IDS - len(sample)]
+                )
+            if detector.items > max_items:
+                errors += (
+                    f"[{context}] {method} pagination - paged through {max_items:,} results. This could mean the last page "
+                    "of results references itself, or your collection and geometry combination has too many results."
+                )
+                break
+    finally:
+        pages.close()  # type: ignore
+
+    if non_intersecting_count:
+        errors += (
+            f"[{context}] : {method} {search_url} {non_intersecting_count} of {checked} search results for "
+            f"intersects={geometry} do not intersect it, including: {', '.join(sample)}"
+        )
+    logger.info(
+        f"[{context}] {method} intersects verification: {checked} items checked, "
+        f"{non_intersecting_count} do not intersect"
+    )
+    return checked, non_intersecting_count
+
+
+def search_item_keys(
+    method: Method,
+    search_url: str,
+    errors: Errors,
+    context: Context,
+    r_session: Session,
+    query: Dict[str, Any],
+) -> Iterator[Tuple[Optional[str], str]]:
+    # (collection, id) of each item, following 'next' links; query values are as in a
+    # POST body, and are joined with commas for GET
+    params: Optional[Dict[str, Any]] = None
+    body: Optional[Dict[str, Any]] = None
+    if method == Method.GET:
+        params = {
+            k: ",".join(map(str, v)) if isinstance(v, list) else v
+            for k, v in query.items()
+        }
+    else:
+        body = query
+    for _, page in paginate(
+        method, search_url, errors, context, r_session, params=params, body=body
+    ):
+        for item in page.get("features") or []:
+            yield item.get("collection"), str(item.get("id"))
+
+
+def validate_search_equivalence(
+    search_url: str,
+    collection: str,
+    errors: Errors,
+    warnings: Warnings,
+    context: Context,
+    r_session: Session,
+    max_items: int,
+    limit: int = DEFAULT_EQUIVALENCE_LIMIT,
+) -> None:
+    # pages GET and POST in lockstep, each fetched in its own thread, keeping only a
+    # digest of each stream, so memory is constant however many items are compared
+    query: Dict[str, Any] = {"collections": [collection], "limit": limit}
+
+    streams = {
+        method: iter(
+            Prefetcher(
+                search_item_keys(
+                    method, search_url, errors, context, r_session, dict(query)
+                ),
+                2 * limit,
+            )
+        )
+        for method in (Method.GET, Method.POST)
+    }
+    digests = {method: StreamDigest() for method in streams}
+    divergence: Optional[Tuple[int, Any, Any]] = None
+    try:
+        for position, (get_key, post_key) in enumerate(
+            itertools.islice(
+                itertools.zip_longest(streams[Method.GET], streams[Method.POST]),
+                max_items + 1,
+            )
+        ):
+            if get_key is not None:
+                digests[Method.GET].add(*get_key)
+            if post_key is not None:
+                digests[Method.POST].add(*post_key)
+            if divergence is None and get_key != post_key:
+                divergence = (position, get_key, post_key)
+    finally:
+        for stream in streams.values():
+            stream.close()  # type: ignore
+
+    get_digest, post_digest = digests[Method.GET], digests[Method.POST]
+    description = f"GET and POST search of {json.dumps(query)}"
+    if get_digest.same_order(post_digest):
+        return
+
+    at = ""
+    if divergence is not None:
+        position, get_key, post_key = divergence
+        at = (
+            f", first at item {position + 1}, which is "
+            f"{repr(get_key[1]) if get_key else 'missing'} for GET and "
+            f"{repr(post_key[1]) if post_key else 'missing'} for POST"
+        )
+
+    if max(get_digest.count, post_digest.count) > max_items:
+        # only the first max_items were compared, and with no sort specified the two
+        # methods may return different items first
+        warnings += f"[{context}] : {description} returned different items in the first {max_items}{at}"
+    elif get_digest.same_items(post_digest):
+        warnings += f"[{context}] : {description} returned the same {get_digest.count} items in a different order{at}"
+    else:
+        extra = ""
+        _, get_key, post_key = divergence or (0, None, None)
+        for larger, smaller, key in [
+            (get_digest, post_digest, get_key),
+            (post_digest, get_digest, post_key),
+        ]:
+            if key is not None and larger.extra_digest(smaller) == item_digest(*key):
+                extra = f", the difference being one more '{key[1]}'"
+        errors += (
+            f"[{context}] : {description} returned different items, {get_digest.count} for GET and "
+            f"{post_digest.count} for POST{extra}{at}"
+        )
+
+
+def validate_pagination_latency(
+    method: Method,
+    search_url: str,
+    collection: Optional[str],
+    errors: Errors,
+    warnings: Warnings,
+    context: Context,
+    r_session: Session,
+    pages: int,
+    budget: float,
+    limit: int = DEFAULT_PAGINATION_LATENCY_LIMIT,
+) -> LatencyProfile:
+    # follows 'next' links to a depth, to find pagination that slows down on deep pages,
+    # as it does when 'next' tokens are offsets the backend has to skip over
+    profile = LatencyProfile()
+    params: Optional[Dict[str, Any]] = None
+    body: Optional[Dict[str, Any]] = None
+    if method == Method.GET:
+        params = {"limit": limit}
+        if collection is not None:
+            params["collections"] = collection
+    else:
+        body = {"limit": limit}
+        if collection is not None:
+            body["collections"] = [collection]
+
+    for _ in paginate(
+        method,
+        search_url,
+        errors,
+        context,
+        r_session,
+        params=params,
+        body=body,
+        max_pages=pages,
+        profile=profile,
+    ):
+        pass
+
+    if not profile.pages:
+        return profile
+
+    slope, _, r = profile.trend()
+    size_slope, _, _ = profile.size_trend()
+    logger.info(
+        f"[{context}] {method} pagination latency over {len(profile)} pages of {limit}: "
+        f"{profile.pages[0].seconds:.3f}s for the first page, {profile.pages[-1].seconds:.3f}s for the last, "
+        f"{slope * 1000:+.2f} ms per page of depth (r={r:.2f}), "
+        f"{sum(p.size for p in profile.pages) / len(profile):.0f} bytes per page ({size_slope:+.0f} per page of depth)"
+    )
+
+    if profile.degrades():
+        warnings += (
+            f"[{context}] : {method} {search_url} pagination latency grows with page depth, from "
+            f"{profile.fitted(1):.3f}s at page 1 to {profile.fitted(len(profile)):.3f}s at page {len(profile)} "
+            f"({slope * 1000:+.2f} ms per page). This suggests 'next' tokens are offsets, so deep pages may time out."
+        )
+
+    if (over := profile.first_over_budget(budget)) is not None:
+        warnings += (
+            f"[{context}] : {method} {search_url} pagination page {over.page} took {over.seconds:.2f}s, "
+            f"first over the latency budget of {budget:g}s"
+        )
+
+    return profile
+
+
+def advertised_max_limit(
+    root_body: Dict[str, Any], r_session: Session
+) -> Optional[int]:
+    # the smallest 'maximum' of the 'limit' parameters in the OpenAPI service-desc
+    if not (service_desc := link_by_rel(root_body.get("links"), "service-desc")):
+        return None
+    try:
+        r = r_session.send(
+            Request(
+                "GET",
+                service_desc["href"],
+                headers={"Accept": service_desc.get("type", "application/json")},
+            ).prepare()
+        )
+        document = yaml.safe_load(r.text) if r.status_code == 200 else None
+    except (RequestException, yaml.YAMLError):
+        return None
+
+    maximums = []
+    pending = [document]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, dict):
+            if (
+                node.get("name") == "limit"
+                and isinstance(schema := node.get("schema"), dict)
+                and isinstance(maximum := schema.get("maximum"), int)
+            ):
+                maximums.append(maximum)
+            pending.extend(node.values())
+        elif isinstance(node, list):
+            pending.extend(node)
+    return min(maximums) if maximums else None
+
+
+def benchmark_page_sizes(
+    root_body: Dict[str, Any],
+    collection: str,
+    r_session: Session,
+    items: int = DEFAULT_BENCHMARK_ITEMS,
+    limits: Sequence[int] = DEFAULT_BENCHMARK_LIMITS,
+) -> Dict[str, Dict[int, LatencyProfile]]:
+    # traverses the same first items of the collection with each page size, through
+    # each endpoint, and reports the page size with the best throughput for each
+    links = root_body.get("links")
+    endpoints: List[Tuple[str, Method, str, Context]] = []
+    for link in links_by_rel(links, "search"):
+        method = Method(link.get("method", "GET"))
+        if method in (Method.GET, Method.POST):
+            endpoints.append(
+                (f"/search {method}", method, link["href"], Context.ITEM_SEARCH)
+            )
+    if collections_link := link_by_rel(links, "data"):
+        endpoints.append(
+            (
+                f"/collections/{collection}/items",
+                Method.GET,
+                f"{collections_link['href']}/{collection}/items",
+                Context.FEATURES,
+            )
+        )
+
+    all_limits = set(limits)
+    if max_limit := advertised_max_limit(root_body, r_session):
+        logger.info(
+            f"Page size benchmark: the service-desc advertises a maximum limit of {max_limit}"
+        )
+        all_limits = {n for n in all_limits if n <= max_limit} | {max_limit}
+
+    results: Dict[str, Dict[int, LatencyProfile]] = {}
+    for name, method, url, context in dict.fromkeys(endpoints):
+        results[name] = {}
+        for limit in sorted(all_limits):
+            params: Optional[Dict[str, Any]] = None
+            body: Optional[Dict[str, Any]] = None
+            if method == Method.POST:
+                body = {"limit": limit, "collections": [collection]}
+            elif context == Context.ITEM_SEARCH:
+                params = {"limit": limit, "collections": collection}
+            else:
+                params = {"limit": limit}
+
+            # failures here are reported by the conformance checks, not the benchmark
+            errors = Errors()
+            profile = LatencyProfile()
+            for _ in paginate(
+                method,
+                url,
+                errors,
+                context,
+                r_session,
+                params=params,
+                body=body,
+                profile=profile,
+            ):
+                if profile.items >= items:
+                    break
+
+            if errors or not profile.items:
+                logger.warning(
+                    f"Page size benchmark: {name} limit={limit} failed: {'; '.join(errors.as_list()) or 'no items returned'}"
+                )
+                continue
+
+            results[name][limit] = profile
+            largest_page = max(p.items for p in profile.pages)
+            logger.info(
+                f"Page size benchmark: {name} limit={limit}: {profile.items} items in {len(profile)} pages, "
+                f"{profile.items / profile.seconds:.0f} items/s, {profile.size / profile.items:.0f} bytes/item, "
+                f"page latency p50 {profile.latency_percentile(0.5) * 1000:.0f} ms, "
+                f"p95 {profile.latency_percentile(0.95) * 1000:.0f} ms"
+                + (
+                    f", at most {largest_page} items per page"
+                    if largest_page < min(limit, items)
+                    else ""
+                )
+            )
 
-    # GET paging has a problem with intersects https://github.com/stac-utils/pystac-client/issues/335
-    # search = client.search(method="GET", collections=[collection], intersects=geometry)
-    # if len(list(take(20000, search.items_as_dicts()))) == 20000:
-    #     errors +=
-    #         f"STAC API - Item Search GET pagination - paged through 20,000 results. This could mean the last page "
-    #         f"of results references itself, or your collection and geometry combination has too many results."
-    #     )
+        if results[name]:
+            best = max(
+                results[name],
+                key=lambda n: results[name][n].items / results[name][n].seconds,
+            )
+            profile = results[name][best]
+            logger.info(
+                f"Page size benchmark: best page size for {name} is limit={best}, "
+                f"{profile.items / profile.seconds:.0f} items/s"
+            )
 
-    if Method.POST in methods:
-        initial_json_body = {"limit": 1, "collections": [collection]}
+    return results
 
-        _, first_body, _ = retrieve(
-            Method.POST,
-            search_url,
-            errors,
-            Context.ITEM_SEARCH,
-            body=initial_json_body,
-            r_session=r_session,
-        )
 
-        if first_body and (link := link_by_rel(first_body.get("links"), "next")):
-            if (method := link.get("method")) and method != "POST":
-                errors += f"STAC API - Item Search POST pagination first request 'next' link relation has method {method} instead of 'POST'"
+def validate_search_completeness(
+    root_body: Dict[str, Any],
+    collection: str,
+    errors: Errors,
+    r_session: Session,
+    windows: int,
+    crawl_items: int = DEFAULT_COMPLETENESS_ITEMS,
+    seed: int = 0,
+    limit: int = DEFAULT_INTERSECTS_LIMIT,
+    max_results: int = DEFAULT_COMPLETENESS_MAX_RESULTS,
+) -> Dict[Tuple[Method, str], Tuple[int, int, int]]:
+    # crawls a slice of the collection into a spatial index, then searches random
+    # windows over it with bbox and intersects: every crawled item the index says
+    # intersects a window must be in that window's results, wherever the crawl stopped
+    root_links = root_body.get("links")
+    if not (search_links := links_by_rel(root_links, "search")):
+        errors += f"[{Context.ITEM_SEARCH}] /: Link[rel=search] missing, cannot check search completeness"
+        return {}
+    if not (collections_link := link_by_rel(root_links, "data")):
+        errors += (
+            "/: Link[rel=data] must href /collections, cannot check search completeness"
+        )
+        return {}
+    search_url = search_links[0]["href"]
+    methods = sorted(
+        {Method(link.get("method", "GET")) for link in search_links}
+        & {Method.GET, Method.POST},
+        key=str,
+    )
 
-            next_url = link.get("href")
-            if next_url is None:
-                errors += "STAC API - Item Search POST pagination first request 'next' link relation missing href"
-            else:
-                if url == next_url:
-                    errors += "STAC API - Item Search POST pagination next href same as first url"
+    start = time.perf_counter()
+    index = ItemIndex()
+    labels: Dict[int, str] = {}
+    items_url = f"{collections_link['href']}/{collection}/items"
+    for _, page in paginate(
+        Method.GET,
+        items_url,
+        errors,
+        Context.FEATURES,
+        r_session,
+        params={"limit": min(limit, crawl_items)},
+    ):
+        features = [f for f in page.get("features") or [] if isinstance(f, dict)]
+        features = features[: crawl_items - len(labels)]
+        digests = [item_digest(f.get("collection"), str(f.get("id"))) for f in features]
+        labels.update(zip(digests, (str(f.get("id")) for f in features)))
+        index.add(digests, features)
+        if len(labels) >= crawl_items:
+            break
+    index.build()
+    if not len(index):
+        logger.warning(
+            f"Search completeness not checked, no items with geometries in {items_url}"
+        )
+        return {}
 
-                next_body: Dict[str, Any] = link.get("body", {})
-                if not link.get("merge", False):
-                    second_json_body = next_body
-                else:
-                    second_json_body = initial_json_body
-                    second_json_body.update(next_body)
+    query_windows = random_windows(index.bounds(), windows, seed)
+    expected = index.matches(query_windows)
+    logger.info(
+        f"Search completeness: indexed {len(index)} items of collection '{collection}' and matched "
+        f"{len(query_windows)} windows against them in {time.perf_counter() - start:.2f}s"
+    )
 
-                retrieve(
-                    Method.POST,
-                    next_url,
-                    errors,
-                    Context.ITEM_SEARCH,
-                    body=second_json_body,
-                    r_session=r_session,
-                )
-        else:
-            errors += (
-                f"[{context}] POST pagination first request had no 'next' link relation"
+    # (windows searched, crawled items missing from the results, results that do not
+    # intersect the window) for each method and search kind
+    results: Dict[Tuple[Method, str], Tuple[int, int, int]] = {}
+    samples: Dict[Tuple[Method, str], List[str]] = {}
+    for i, (window, window_expected) in enumerate(zip(query_windows, expected)):
+        method = methods[i % len(methods)]
+        bbox = [round(float(x), 7) for x in window]
+        west, south, east, north = bbox
+        intersects = {
+            "type": "Polygon",
+            "coordinates": [
+                [
+                    [west, south],
+                    [east, south],
+                    [east, north],
+                    [west, north],
+                    [west, south],
+                ]
+            ],
+        }
+        for kind, value in [("bbox", bbox), ("intersects", intersects)]:
+            query = {"collections": [collection], kind: value, "limit": limit}
+            if method == Method.GET and kind == "intersects":
+                query[kind] = json.dumps(value)
+            returned: List[int] = []
+            truncated = False
+            for key in search_item_keys(
+                method, search_url, errors, Context.ITEM_SEARCH, r_session, query
+            ):
+                if len(returned) >= max_results:
+                    truncated = True
+                    break
+                returned.append(item_digest(*key))
+
+            found = np.unique(np.array(returned, dtype=np.uint64))
+            # a truncated result set may be missing any item, so only extras count
+            missing = (
+                np.setdiff1d(window_expected, found, assume_unique=True)
+                if not truncated
+                else np.empty(0, dtype=np.uint64)
             )
+            unexpected = np.setdiff1d(found, window_expected, assume_unique=True)
+            unexpected = unexpected[np.isin(unexpected, index.digests)]
 
-        if use_pystac_client and collection is not None:
-            max_items = 100
-            try:
-                client = Client.open(root_url, headers=r_session.headers)
-                search = client.search(
-                    method="POST",
-                    collections=[collection],
-                    max_items=max_items,
-                    limit=5,
+            searched, missing_count, unexpected_count = results.get(
+                (method, kind), (0, 0, 0)
+            )
+            results[(method, kind)] = (
+                searched + 1,
+                missing_count + len(missing),
+                unexpected_count + len(unexpected),
+            )
+            sample = samples.setdefault((method, kind), [])
+            if len(missing) and len(sample) < DEFAULT_SAMPLE_IDS:
+                sample.append(
+                    f"{bbox} ({', '.join(labels[int(d)] for d in missing[:DEFAULT_SAMPLE_IDS])})"
+                )
+            if len(unexpected):
+                errors += (
+                    f"[{Context.ITEM_SEARCH}] : {method} {search_url} Search results for {kind} window "
+                    f"{bbox} include items that do not intersect it: "
+                    f"{', '.join(labels[int(d)] for d in unexpected[:DEFAULT_SAMPLE_IDS])}"
                 )
 
-                items = list(search.items_as_dicts())
-
-                if len(items) > max_items:
-                    errors += f"[{context}] POST pagination - more than max items returned from paginating"
-
-                if len(items) > len({item["id"] for item in items}):
-                    errors += f"[{context}] POST pagination - duplicate items returned from paginating items"
-
-                if geometry is not None:
-                    search = client.search(
-                        method="POST", collections=[collection], intersects=geometry
-                    )
-                    if len(list(take(20000, search.items_as_dicts()))) == 20000:
-                        errors += (
-                            f"[{context}] POST pagination - paged through 20,000 results. This could mean the last page "
-                            "of results references itself, or your collection and geometry combination has too many results."
-                        )
-            except Exception as e:
-                errors += f"pystac-client threw exception while testing pagination {e}"
-        elif collection is not None:
-            errors += f"[{context}] POST pagination - pystac-client tests not run, collection is undefined"
+    for (method, kind), (searched, missing_count, unexpected_count) in results.items():
+        if missing_count:
+            errors += (
+                f"[{Context.ITEM_SEARCH}] : {method} {search_url} {missing_count} items of collection "
+                f"'{collection}' that intersect {kind} query windows are missing from the search results, "
+                f"including: {'; '.join(samples[(method, kind)])}"
+            )
+        logger.info(
+            f"Search completeness: {method} {kind} over {searched} windows, "
+            f"{missing_count} items missing, {unexpected_count} unexpected"
+        )
+    return results
 
 
 def validate_item_search_intersects(
@@ -2973,7 +4101,7 @@ def validate_item_search_intersects(
                 body={"intersects": param},
             )
 
-    intersects_shape = shape(json.loads(geometry))
+    intersects_shape = query_geometry(json.loads(geometry))
 
     if Method.GET in methods:
         _, body, _ = retrieve(
@@ -2988,12 +4116,8 @@ def validate_item_search_intersects(
         if body:
             if not body.get("features"):
                 errors += f"[{Context.ITEM_SEARCH}] GET {search_url} Search result for intersects={geometry} returned no results"
-            else:
-                if any(
-                    not intersects_shape.intersects(shape(item.get("geometry", None)))
-                    for item in body.get("features", [])
-                ):
-                    errors += f"[{Context.ITEM_SEARCH}] GET {search_url} Search results for intersects={geometry} do not all intersect"
+            elif offending := non_intersecting(intersects_shape, body["features"]):
+                errors += f"[{Context.ITEM_SEARCH}] GET {search_url} Search results for intersects={geometry} do not all intersect: {feature_labels(body['features'], offending)}"
 
     if Method.POST in methods:
         _, item_collection, _ = retrieve(
@@ -3006,60 +4130,136 @@ def validate_item_search_intersects(
         )
         if not item_collection or not item_collection.get("features"):
             errors += f"[{Context.ITEM_SEARCH}] POST Search result for intersects={geometry} returned no results"
-        else:
-            for item in item_collection.get("features", []):
-                if not intersects_shape.intersects(shape(item.get("geometry"))):
-                    errors += f"[{Context.ITEM_SEARCH}] POST Search result for intersects={geometry}, does not intersect {item.get('geometry')}"
+        elif offending := non_intersecting(
+            intersects_shape, item_collection["features"]
+        ):
+            errors += f"[{Context.ITEM_SEARCH}] POST Search results for intersects={geometry} do not all intersect: {feature_labels(item_collection['features'], offending)}"
 
 
-def validate_item_search_bbox(
-    search_url: str, methods: Set[Method], errors: Errors, r_session: Session
+def validate_bbox_results(
+    method: Method,
+    url: str,
+    bbox: List[float],
+    body: Optional[Dict[str, Any]],
+    errors: Errors,
+    context: Context,
 ) -> None:
-    bbox_list = [100.0, 0.0, 105.0, 1.0]
+    # the features' bboxes, or their geometries' bounds, must intersect the query bbox
+    if body and (features := body.get("features")):
+        if offending := outside_bbox(bbox, features):
+            errors += f"[{context}] : {method} {url} Search results for bbox={bbox} do not all intersect the bbox: {feature_labels(features, offending)}"
 
-    if Method.GET in methods:
-        _, body, resp_headers = retrieve(
-            Method.GET,
-            search_url,
-            errors,
-            Context.ITEM_SEARCH,
-            params={"bbox": ",".join([str(x) for x in bbox_list])},
-            r_session=r_session,
-        )
 
-    if Method.POST in methods:
-        # Valid POST query
-        _, body, resp_headers = retrieve(
-            Method.POST,
-            search_url,
-            errors,
-            Context.ITEM_SEARCH,
-            body={"bbox": bbox_list},
-            r_session=r_session,
-        )
+def validate_geometry_complexity(
+    search_url: str,
+    collection: Optional[str],
+    geometry: Optional[str],
+    methods: Set[Method],
+    warnings: Warnings,
+    r_session: Session,
+    budget: float = DEFAULT_GEOMETRY_LATENCY_BUDGET,
+    vertex_counts: Sequence[int] = DEFAULT_GEOMETRY_VERTICES,
+    timeout: float = DEFAULT_GEOMETRY_TIMEOUT,
+) -> Dict[Tuple[Method, str], List[Tuple[int, Optional[int], float, int]]]:
+    # intersects searches with polygons and multipolygons of more and more vertices
+    # over the --geometry area, to find where the API starts failing or slowing down;
+    # failures of very large requests are expected, so they are reported as warnings
+    bounds = shape(json.loads(geometry) if geometry else polygon).bounds
+    results: Dict[Tuple[Method, str], List[Tuple[int, Optional[int], float, int]]] = {}
+    for method in sorted(methods & {Method.GET, Method.POST}, key=str):
+        for kind, generate in [
+            ("Polygon", complex_polygon),
+            ("MultiPolygon", complex_multipolygon),
+        ]:
+            # (vertices, status code or None on a timeout, seconds, request bytes)
+            probes = results[(method, kind)] = []
+            over_budget = False
+            for vertices in vertex_counts:
+                intersects = generate(bounds, vertices)
+                if method == Method.GET:
+                    params: Dict[str, Any] = {
+                        "intersects": json.dumps(intersects),
+                        "limit": 1,
+                    }
+                    if collection is not None:
+                        params["collections"] = collection
+                    request = Request("GET", search_url, params=params)
+                else:
+                    body: Dict[str, Any] = {"intersects": intersects, "limit": 1}
+                    if collection is not None:
+                        body["collections"] = [collection]
+                    request = Request("POST", search_url, json=body)
+                prepared = r_session.prepare_request(request)
+                size = len(prepared.url or "") + len(prepared.body or b"")
+
+                start = time.perf_counter()
+                try:
+                    status: Optional[int] = r_session.send(
+                        prepared, timeout=timeout
+                    ).status_code
+                    failure = f"status code {status}" if status != 200 else None
+                except RequestException as e:
+                    status = None
+                    failure = f"{type(e).__name__}"
+                seconds = time.perf_counter() - start
+                probes.append((vertices, status, seconds, size))
+                logger.info(
+                    f"[{Context.ITEM_SEARCH}] {method} intersects {kind} of {vertices:,} vertices: "
+                    f"{status or 'no response'} in {seconds:.3f}s, {size:,} byte request"
+                )
 
-    bbox_list = [100.0, 0.0, 0.0, 105.0, 1.0, 1.0]
+                if failure is not None:
+                    warnings += (
+                        f"[{Context.ITEM_SEARCH}] : {method} {search_url} intersects with a {kind} of "
+                        f"{vertices:,} vertices ({size:,} byte request) failed with {failure}"
+                    )
+                    break
+                if seconds > budget and not over_budget:
+                    over_budget = True
+                    warnings += (
+                        f"[{Context.ITEM_SEARCH}] : {method} {search_url} intersects with a {kind} of "
+                        f"{vertices:,} vertices took {seconds:.2f}s, over the latency budget of {budget:g}s"
+                    )
+    return results
 
-    if Method.GET in methods:
-        _, body, resp_headers = retrieve(
-            Method.GET,
-            search_url,
-            errors,
-            Context.ITEM_SEARCH,
-            params={"bbox": ",".join([str(x) for x in bbox_list])},
-            r_session=r_session,
-        )
 
-    if Method.POST in methods:
-        # Valid POST query
-        _, body, resp_headers = retrieve(
-            Method.POST,
-            search_url,
-            errors,
-            Context.ITEM_SEARCH,
-            body={"bbox": bbox_list},
-            r_session=r_session,
-        )
+def validate_item_search_bbox(
+    search_url: str, methods: Set[Method], errors: Errors, r_session: Session
+) -> None:
+    for bbox_list in [
+        [100.0, 0.0, 105.0, 1.0],
+        [100.0, 0.0, 0.0, 105.0, 1.0, 1.0],
+        # crosses the antimeridian, so results are on either side of it
+        [170.0, -10.0, -170.0, 10.0],
+    ]:
+        if Method.GET in methods:
+            for page_url, page in paginate(
+                Method.GET,
+                search_url,
+                errors,
+                Context.ITEM_SEARCH,
+                r_session,
+                params={"bbox": ",".join([str(x) for x in bbox_list])},
+                max_pages=DEFAULT_BBOX_MAX_PAGES,
+            ):
+                validate_bbox_results(
+                    Method.GET, page_url, bbox_list, page, errors, Context.ITEM_SEARCH
+                )
+
+        if Method.POST in methods:
+            # Valid POST query
+            for page_url, page in paginate(
+                Method.POST,
+                search_url,
+                errors,
+                Context.ITEM_SEARCH,
+                r_session,
+                body={"bbox": bbox_list},
+                max_pages=DEFAULT_BBOX_MAX_PAGES,
+            ):
+                validate_bbox_results(
+                    Method.POST, page_url, bbox_list, page, errors, Context.ITEM_SEARCH
+                )
 
     if Method.GET in methods:
         retrieve(
@@ -3701,6 +4901,27 @@ def validate_transaction(
     )
 
 
+def sortable_fields(landing_page_body: Dict[str, Any], r_session: Session) -> List[str]:
+    # the fields of the sortables schema, if the API links to one; the Sort extension
+    # does not require sortables, so failing to get them is not an error
+    sortables_link = link_by_rel(
+        landing_page_body.get("links"),
+        "http://www.opengis.net/def/rel/ogc/1.0/sortables",
+    )
+    if not sortables_link or not (url := sortables_link.get("href")):
+        return []
+    _, schema, _ = retrieve(
+        Method.GET,
+        url,
+        Errors(),
+        Context.ITEM_SEARCH_SORT,
+        r_session,
+        content_type="application/schema+json",
+    )
+    properties = (schema or {}).get("properties")
+    return list(properties) if isinstance(properties, dict) else []
+
+
 def validate_sort(
     landing_page_body: Dict[str, Any],
     collection: str,
@@ -3709,114 +4930,127 @@ def validate_sort(
     r_session: Session,
     context: Context,
     query_config: QueryConfig,
+    max_items: int = DEFAULT_SORT_MAX_ITEMS,
+    limit: int = 100,
+    sort_keys: Optional[List[str]] = None,
+    sortables: bool = False,
 ) -> None:
-    limit = 100
-
     search_method_to_url: dict[Method, str] = {
-        Method[x.get("method", "GET")]: x.get("href")
+        Method[x.get("method", "GET")]: x["href"]
         for x in links_by_rel(landing_page_body.get("links"), "search")
+        if x.get("href")
     }
 
-    # ascending
-    if Method.GET in search_method_to_url:
-        for sortby in ["properties.datetime", "+properties.datetime"]:
-            _, body, _ = retrieve(
-                Method.GET,
-                search_method_to_url[Method.GET],
-                params={
-                    "sortby": sortby,
-                    "limit": limit,
-                    "collections": collection,
-                },
-                errors=errors,
-                context=context,
-                r_session=r_session,
-            )
-
-            if not len(body["features"]):
-                errors += (
-                    f"[{context}] : GET search with Sort '{sortby}' had no results"
+    # each sortby as GET sortby strings, and the fields they sort by
+    sortbys: List[Tuple[List[str], List[SortField]]] = [
+        (["properties.datetime", "+properties.datetime"], parse_sortby("+datetime")),
+        (["-properties.datetime"], parse_sortby("-datetime")),
+    ]
+    if sort_keys:
+        sortbys += [
+            ([sortby], parse_sortby(sortby))
+            for sort_key in sort_keys
+            if (sortby := sort_key.strip())
+        ]
+    # each sortable is four more searches paged through, so only on request
+    if sortables:
+        for field in sortable_fields(landing_page_body, r_session)[
+            :DEFAULT_SORTABLE_FIELDS
+        ]:
+            if field not in ("datetime", "properties.datetime"):
+                for sort_field in (SortField(field), SortField(field, True)):
+                    sortbys.append(([sort_field.text], [sort_field]))
+
+    for get_sortbys, fields in sortbys:
+        if Method.GET in search_method_to_url:
+            for sortby in get_sortbys:
+                validate_sort_order(
+                    Method.GET,
+                    search_method_to_url[Method.GET],
+                    collection,
+                    sortby,
+                    fields,
+                    errors,
+                    context,
+                    r_session,
+                    max_items,
+                    limit,
                 )
+        if Method.POST in search_method_to_url:
+            validate_sort_order(
+                Method.POST,
+                search_method_to_url[Method.POST],
+                collection,
+                [f.json for f in fields],
+                fields,
+                errors,
+                context,
+                r_session,
+                max_items,
+                limit,
+            )
 
-            datetimes = [f["properties"]["datetime"] for f in body["features"]]
-            sorted_datetimes = copy.deepcopy(datetimes)
-            sorted_datetimes.sort()
-
-            if datetimes != sorted_datetimes:
-                errors += f"[{context}] : GET search with Sort '{sortby}' was not sorted in ascending order {datetimes} {sorted_datetimes}"
-
-    if Method.POST in search_method_to_url:
-        sortby_json = [{"field": "properties.datetime", "direction": "asc"}]
-        retrieve(
-            Method.POST,
-            search_method_to_url[Method.POST],
-            body={
-                "sortby": sortby_json,
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : POST search with Sort '{json.dumps(sortby_json)}' had no results"
-
-        datetimes = [f["properties"]["datetime"] for f in body["features"]]
-        sorted_datetimes = copy.deepcopy(datetimes)
-        sorted_datetimes.sort()
-
-        if datetimes != sorted_datetimes:
-            errors += f"[{context}] : POST search with Sort '{json.dumps(sortby_json)}' was not sorted in ascending order"
-
-    # descending
-    if Method.GET in search_method_to_url:
-        sortby = "-properties.datetime"
-        _, body, _ = retrieve(
-            Method.GET,
-            search_method_to_url[Method.GET],
-            params={
-                "sortby": sortby,
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
-        )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : GET search with Sort '{sortby}' had no results"
-
-        datetimes = [f["properties"]["datetime"] for f in body["features"]]
-        sorted_datetimes = copy.deepcopy(datetimes)
-        sorted_datetimes.sort(reverse=True)
 
-        if datetimes != sorted_datetimes:
-            errors += f"[{context}] : GET search with Sort '{sortby}' was not sorted in descending order {datetimes} {sorted_datetimes}"
+def validate_sort_order(
+    method: Method,
+    search_url: str,
+    collection: str,
+    sortby: Any,
+    fields: List[SortField],
+    errors: Errors,
+    context: Context,
+    r_session: Session,
+    max_items: int = DEFAULT_SORT_MAX_ITEMS,
+    limit: int = 100,
+) -> SortChecker:
+    # follows 'next' links through up to max_items results, holding one page and the
+    # sort key of the last item of the page before it
+    if method == Method.GET:
+        params: Optional[Dict[str, Any]] = {
+            "sortby": sortby,
+            "limit": limit,
+            "collections": collection,
+        }
+        body: Optional[Dict[str, Any]] = None
+        description = f"GET search with Sort '{sortby}'"
+    else:
+        params = None
+        body = {"sortby": sortby, "limit": limit, "collections": [collection]}
+        description = f"POST search with Sort '{json.dumps(sortby)}'"
+    if all(f.descending for f in fields):
+        order = "descending order"
+    elif not any(f.descending for f in fields):
+        order = "ascending order"
+    else:
+        order = "the requested order"
 
-    if Method.POST in search_method_to_url:
-        sortby_json = [{"field": "properties.datetime", "direction": "desc"}]
-        retrieve(
-            Method.POST,
-            search_method_to_url[Method.POST],
-            body={
-                "sortby": sortby_json,
-                "limit": limit,
-                "collections": collection,
-            },
-            errors=errors,
-            context=context,
-            r_session=r_session,
+    checker = SortChecker(fields)
+    sample: List[str] = []
+    for _, page in paginate(
+        method, search_url, errors, context, r_session, params=params, body=body
+    ):
+        features = [f for f in page.get("features") or [] if isinstance(f, dict)]
+        features = features[: max_items - checker.items]
+        rows = [checker.key(f) for f in features]
+        labels = [
+            f"'{feature_label(features, i)}' ({', '.join(map(str, row))})"
+            for i, row in enumerate(rows)
+        ]
+        for earlier, later in checker.check(rows, labels):
+            if len(sample) < DEFAULT_SAMPLE_IDS:
+                sample.append(f"{later} after {earlier}")
+        if checker.items >= max_items:
+            break
+
+    if not checker.items:
+        errors += f"[{context}] : {description} had no results"
+    elif checker.out_of_order:
+        errors += (
+            f"[{context}] : {description} was not sorted in {order}: {checker.out_of_order} of "
+            f"{checker.items} items over {checker.pages} pages out of order, including {'; '.join(sample)}"
         )
-
-        if not len(body["features"]):
-            errors += f"[{context}] : POST search with Sort '{json.dumps(sortby_json)}' had no results"
-
-        datetimes = [f["properties"]["datetime"] for f in body["features"]]
-        sorted_datetimes = copy.deepcopy(datetimes)
-        sorted_datetimes.sort(reverse=True)
-
-        if datetimes != sorted_datetimes:
-            errors += f"[{context}] : POST search with Sort '{json.dumps(sortby_json)}' was not sorted in descending order"
+    logger.info(
+        f"[{context}] {description}: {checker.items} items over {checker.pages} pages checked, "
+        f"{checker.out_of_order} out of {order}, {checker.unsortable} without a value to sort by"
+    )
+    return checker
@@ -0,0 +1,156 @@
+"""
+Test cases for the 'assets' module
+"""
+
+import threading
+import time
+import unittest.mock
+from typing import Any
+from typing import Dict
+
+import requests
+
+from stac_api_validator import assets
+
+
+def response(status_code: int) -> unittest.mock.MagicMock:
+    resp = unittest.mock.MagicMock()
+    resp.status_code = status_code
+    resp.__enter__.return_value = resp
+    return resp
+
+
+def item(item_id: str, **hrefs: str) -> Dict[str, Any]:
+    return {
+        "type": "Feature",
+        "id": item_id,
+        "links": [
+            {"rel": "self", "href": f"https://api.test/collections/c/items/{item_id}"}
+        ],
+        "assets": {key: {"href": href} for key, href in hrefs.items()},
+    }
+
+
+def test_asset_hrefs() -> None:
+    body = item("a", data="https://cdn.test/a.tif", thumbnail="./a.png")
+    body["assets"]["bad"] = "not-an-asset"
+
+    assert list(assets.asset_hrefs(body)) == [
+        ("a", "data", "https://cdn.test/a.tif"),
+        ("a", "thumbnail", "https://api.test/collections/c/items/a.png"),
+    ]
+
+    del body["links"]
+    assert list(assets.asset_hrefs(body, "https://other.test/items/a")) == [
+        ("a", "data", "https://cdn.test/a.tif"),
+        ("a", "thumbnail", "https://other.test/items/a.png"),
+    ]
+
+
+def test_asset_checker_dedupes_and_falls_back_to_ranged_get() -> None:
+    heads = {
+        "https://cdn.test/a.tif": response(200),
+        "https://cdn.test/b.tif": response(405),
+        "https://cdn.test/gone.tif": response(404),
+    }
+    gets = {
+        "https://cdn.test/b.tif": response(206),
+        "https://cdn.test/gone.tif": response(404),
+    }
+    r_session = unittest.mock.MagicMock()
+    r_session.head.side_effect = lambda href, **kwargs: heads[href]
+    r_session.get.side_effect = lambda href, **kwargs: gets[href]
+
+    checker = assets.AssetChecker(r_session=r_session)
+    page_url = "https://api.test/collections/c/items"
+    a = item("a", data="https://cdn.test/a.tif", other="https://cdn.test/b.tif")
+    b = item("b", data="https://cdn.test/gone.tif", s3="s3://bucket/b.tif")
+    assert checker.collect("Features", "GET", page_url, a) == 2
+    assert checker.collect("Features", "GET", page_url, b) == 2
+    assert checker.collect("Features", "GET", page_url, b) == 0
+    assert checker.collect("Features", "GET", f"{page_url}/a", a) == 2
+
+    failures = checker.check()
+
+    assert [(r.url, r.item_id, r.key, failure) for r, failure in failures] == [
+        (page_url, "b", "data", "returned status code 404")
+    ]
+    assert r_session.head.call_count == 3
+    assert r_session.get.call_count == 2
+    assert r_session.get.call_args.kwargs["headers"] == {"Range": "bytes=0-0"}
+    assert checker.requests == 5
+    assert "s3://bucket/b.tif" not in checker.results
+
+    # results are cached across stages
+    checker.collect("Item Search", "POST", "https://api.test/search", b)
+    assert len(checker.check()) == 2
+    assert r_session.head.call_count == 3
+
+
+def test_asset_checker_check_references() -> None:
+    r_session = unittest.mock.MagicMock()
+    r_session.head.return_value = response(404)
+    r_session.get.return_value = response(404)
+
+    checker = assets.AssetChecker(r_session=r_session)
+    page_url = "https://api.test/collections/c/items"
+    references = list(
+        assets.references(
+            "Features", "GET", page_url, item("a", data="https://cdn.test/a.tif")
+        )
+    )
+    failures = checker.check_references(references)
+
+    assert failures == [(references[0], "returned status code 404")]
+    # nothing is kept once the failures are returned
+    assert not checker.references
+    assert not checker.results
+    assert (checker.checked_hrefs, checker.checked_references) == (1, 1)
+
+
+def test_asset_checker_request_failure() -> None:
+    r_session = unittest.mock.MagicMock()
+    r_session.head.side_effect = requests.ConnectionError("connection refused")
+
+    checker = assets.AssetChecker(r_session=r_session)
+    checker.collect(
+        "Collections",
+        "GET",
+        "https://api.test/collections/c",
+        item("c", data="https://down.test/c.tif"),
+    )
+
+    assert [failure for _, failure in checker.check()] == [
+        "request failed: connection refused"
+    ]
+
+
+def test_asset_checker_host_limit() -> None:
+    lock = threading.Lock()
+    active: Dict[str, int] = {}
+    peak: Dict[str, int] = {}
+
+    def head(href: str, **kwargs: Any) -> unittest.mock.MagicMock:
+        host = href.split("/")[2]
+        with lock:
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+        time.sleep(0.01)
+        with lock:
+            active[host] -= 1
+        return response(200)
+
+    r_session = unittest.mock.MagicMock()
+    r_session.head.side_effect = head
+
+    checker = assets.AssetChecker(workers=16, host_limit=2, r_session=r_session)
+    for host in ["one.test", "two.test"]:
+        checker.collect(
+            "Features",
+            "GET",
+            "https://api.test/items",
+            item(host, **{f"a{i}": f"https://{host}/{i}.tif" for i in range(20)}),
+        )
+
+    assert checker.check() == []
+    assert peak == {"one.test": 2, "two.test": 2}
@@ -0,0 +1,248 @@
+"""
+Test cases for the 'cql2' module
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Dict
+from typing import List
+
+import pytest
+
+from stac_api_validator.cql2 import CompiledFilter
+from stac_api_validator.cql2 import filter_constructs
+from stac_api_validator.cql2 import like_pattern
+from stac_api_validator.cql2 import to_text
+from stac_api_validator.filters import cql2_json_ex_2
+from stac_api_validator.filters import cql2_json_ex_3
+from stac_api_validator.filters import cql2_json_ex_8
+from stac_api_validator.filters import cql2_json_ex_9
+from stac_api_validator.filters import cql2_json_not_between
+
+
+def feature(id: str, geometry: object = None, **properties: object) -> Dict[str, Any]:
+    return {"id": id, "collection": "c", "geometry": geometry, "properties": properties}
+
+
+def point(x: float, y: float) -> Dict[str, Any]:
+    return {"type": "Point", "coordinates": [x, y]}
+
+
+FEATURES = [
+    feature(
+        "a",
+        point(-77.05, 38.8),
+        datetime="2021-04-08T04:39:23Z",
+        mission="sentinel-2",
+        **{"eo:cloud_cover": 5},
+    ),
+    feature(
+        "b",
+        point(0, 0),
+        datetime="2021-04-08T06:39:23+02:00",
+        mission="landsat-8",
+        **{"eo:cloud_cover": 60},
+    ),
+    feature(
+        "c",
+        datetime=None,
+        start_datetime="2020-11-10T00:00:00Z",
+        end_datetime="2020-11-11T12:00:00Z",
+        **{"eo:cloud_cover": None},
+    ),
+]
+
+
+def prop(name: str) -> Dict[str, Any]:
+    return {"property": name}
+
+
+@pytest.mark.parametrize(
+    "expression, matching",
+    [
+        ({"op": "=", "args": [prop("id"), "a"]}, ["a"]),
+        ({"op": "<>", "args": [prop("id"), "a"]}, ["b", "c"]),
+        ({"op": "<", "args": [prop("eo:cloud_cover"), 10]}, ["a"]),
+        ({"op": ">=", "args": [prop("eo:cloud_cover"), 5]}, ["a", "b"]),
+        ({"op": "=", "args": [prop("collection"), "c"]}, ["a", "b", "c"]),
+        # the same instant, written with a different offset, is equal
+        (
+            {
+                "op": "=",
+                "args": [prop("datetime"), {"timestamp": "2021-04-08T04:39:23Z"}],
+            },
+            ["a", "b"],
+        ),
+        (
+            {"op": "=", "args": [prop("datetime"), {"date": "2021-04-08"}]},
+            ["a", "b"],
+        ),
+        ({"op": "like", "args": [prop("mission"), "sentinel%"]}, ["a"]),
+        ({"op": "like", "args": [prop("mission"), "landsat-_"]}, ["b"]),
+        ({"op": "between", "args": [prop("eo:cloud_cover"), [0, 50]]}, ["a"]),
+        ({"op": "between", "args": [prop("eo:cloud_cover"), 50, 60]}, ["b"]),
+        ({"op": "in", "args": [prop("id"), ["a", "c", "d"]]}, ["a", "c"]),
+        ({"op": "isNull", "args": [prop("eo:cloud_cover")]}, ["c"]),
+        # not of unknown is unknown, so a null property matches neither
+        (
+            {
+                "op": "not",
+                "args": [{"op": "<", "args": [prop("eo:cloud_cover"), 10]}],
+            },
+            ["b"],
+        ),
+        (cql2_json_ex_9, ["a", "b", "c"]),
+        (cql2_json_ex_8, ["a"]),
+        (
+            {
+                "op": "s_intersects",
+                "args": [prop("geometry"), {"bbox": [-1, -1, 1, 1]}],
+            },
+            ["b"],
+        ),
+        (
+            {"op": "s_disjoint", "args": [prop("geometry"), {"bbox": [-1, -1, 1, 1]}]},
+            ["a"],
+        ),
+        (
+            {"op": "s_within", "args": [prop("geometry"), {"bbox": [-1, -1, 1, 1]}]},
+            ["b"],
+        ),
+        # a null datetime is the interval from start to end datetime
+        (
+            {
+                "op": "t_intersects",
+                "args": [
+                    prop("datetime"),
+                    {"interval": ["2020-11-11T00:00:00Z", ".."]},
+                ],
+            },
+            ["a", "b", "c"],
+        ),
+        (
+            {
+                "op": "t_intersects",
+                "args": [
+                    prop("datetime"),
+                    {"interval": ["..", "2020-11-10T12:00:00Z"]},
+                ],
+            },
+            ["c"],
+        ),
+    ],
+)
+def test_compiled_filter(expression: Dict[str, Any], matching: List[str]) -> None:
+    compiled = CompiledFilter(expression)
+    assert [f["id"] for f, m in zip(FEATURES, compiled.matches(FEATURES)) if m] == (
+        matching
+    )
+
+
+def test_compiled_filter_pages() -> None:
+    compiled = CompiledFilter(cql2_json_ex_8)
+    # the spatial results of one page are not used for the next
+    assert compiled.non_matching(FEATURES) == [1, 2]
+    assert compiled.non_matching(FEATURES[1:]) == [0, 1]
+    assert compiled.non_matching([]) == []
+    assert compiled.non_matching(["not a feature", FEATURES[0]]) == [0]
+
+
+def test_compiled_filter_concurrent_pages() -> None:
+    compiled = CompiledFilter(cql2_json_ex_8)
+    pages = [FEATURES, FEATURES[1:], FEATURES[::-1]] * 20
+    # pages checked at once by one compiled filter don't share spatial results
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(compiled.non_matching, pages)) == [
+            compiled.non_matching(page) for page in pages
+        ]
+
+
+def test_compiled_filter_unsupported() -> None:
+    with pytest.raises(ValueError):
+        CompiledFilter({"op": "a_contains", "args": [prop("x"), [1]]})
+    with pytest.raises(ValueError):
+        CompiledFilter({"op": "=", "args": [prop("x"), {"function": "f"}]})
+
+
+def test_like_pattern() -> None:
+    assert like_pattern("a%b_").fullmatch("axxxbc")
+    assert not like_pattern("a%b_").fullmatch("axxxb")
+    assert like_pattern(r"100\%").fullmatch("100%")
+    assert not like_pattern(r"100\%").fullmatch("1000")
+    assert like_pattern("a.b").fullmatch("a.b")
+    assert not like_pattern("a.b").fullmatch("axb")
+
+
+@pytest.mark.parametrize(
+    "expression, text",
+    [
+        (cql2_json_ex_3, "eo:cloud_cover >= 5 AND eo:cloud_cover < 10"),
+        (
+            cql2_json_ex_9,
+            "eo:cloud_cover > 50 OR eo:cloud_cover < 10 OR "
+            "(eo:cloud_cover IS NULL AND eo:cloud_cover IS NULL)",
+        ),
+        (cql2_json_not_between, "NOT (eo:cloud_cover BETWEEN 0 AND 50)"),
+        (
+            {"op": "=", "args": [prop("id"), "it's"]},
+            "id = 'it''s'",
+        ),
+        (
+            {"op": "in", "args": [prop("a property"), ["a", 1, True]]},
+            "\"a property\" IN ('a', 1, TRUE)",
+        ),
+        (
+            {"op": "<", "args": [prop("datetime"), {"date": "2021-04-08"}]},
+            "datetime < DATE('2021-04-08')",
+        ),
+        (
+            {
+                "op": "t_intersects",
+                "args": [
+                    prop("datetime"),
+                    {"interval": ["2020-11-11T00:00:00Z", ".."]},
+                ],
+            },
+            "T_INTERSECTS(datetime, INTERVAL('2020-11-11T00:00:00Z', '..'))",
+        ),
+        (
+            {
+                "op": "s_intersects",
+                "args": [prop("geometry"), {"bbox": [0, 1, 2.5, 3]}],
+            },
+            "S_INTERSECTS(geometry, BBOX(0, 1, 2.5, 3))",
+        ),
+        (
+            {"op": "s_within", "args": [prop("geometry"), point(1.5, -2)]},
+            "S_WITHIN(geometry, POINT (1.5 -2))",
+        ),
+    ],
+)
+def test_to_text(expression: Dict[str, Any], text: str) -> None:
+    assert to_text(expression) == text
+
+
+def test_to_text_ex_2() -> None:
+    assert to_text(cql2_json_ex_2("c")) == (
+        "collection = 'c' AND eo:cloud_cover <= 10"
+        " AND datetime >= TIMESTAMP('2021-04-08T04:39:23Z')"
+        " AND S_INTERSECTS(geometry, POLYGON ((43.5845 -79.5442, 43.6079 -79.4893, 43.5677 -79.4632, 43.6129 -79.3925, 43.6223 -79.3238, 43.6576 -79.3163, 43.7945 -79.1178, 43.8144 -79.1542, 43.8555 -79.1714, 43.7509 -79.639, 43.5845 -79.5442)))"
+    )
+    with pytest.raises(ValueError):
+        to_text({"op": "a_contains", "args": [prop("x"), [1]]})
+
+
+def test_filter_constructs() -> None:
+    assert filter_constructs(cql2_json_ex_2("c")) == [
+        ("comparison", "collection"),
+        ("comparison", "eo:cloud_cover"),
+        ("comparison", "datetime"),
+        ("spatial", "geometry"),
+    ]
+    # each construct once, through not
+    assert filter_constructs(cql2_json_ex_9) == [
+        ("comparison", "eo:cloud_cover"),
+        ("isNull", "eo:cloud_cover"),
+    ]
+    assert filter_constructs(cql2_json_not_between) == [("between", "eo:cloud_cover")]
+    assert filter_constructs("not a filter") == []
@@ -0,0 +1,70 @@
+"""
+Test cases for the 'digests' module
+"""
+
+from stac_api_validator import digests
+
+
+def test_item_digest() -> None:
+    assert digests.item_digest("a", "1") == digests.item_digest("a", "1")
+    assert digests.item_digest("a", "1") != digests.item_digest("b", "1")
+    # the separator keeps ("a", "b1") apart from ("ab", "1")
+    assert digests.item_digest("a", "b1") != digests.item_digest("ab", "1")
+    assert 0 < digests.item_digest(None, "1") < 2**64
+
+
+def test_digest_set_grows() -> None:
+    digest_set = digests.DigestSet(capacity=4)
+    initial_bytes = digest_set.nbytes
+    for i in range(1, 1001):
+        assert digest_set.add(i * 0x9E3779B97F4A7C15 % 2**64)
+    assert not digest_set.add(0x9E3779B97F4A7C15)
+    assert len(digest_set) == 1000
+    assert all(i * 0x9E3779B97F4A7C15 % 2**64 in digest_set for i in range(1, 1001))
+    assert 12345 not in digest_set
+    assert digest_set.nbytes > initial_bytes
+    assert len(digest_set) <= len(digest_set.slots) * digests.MAX_LOAD_FACTOR
+
+
+def test_duplicate_detector_exact() -> None:
+    detector = digests.DuplicateDetector(expected_items=10)
+    keys = [("c", "1"), ("c", "2"), ("d", "1"), ("c", "1"), ("c", "1")]
+    assert [detector.add(*key) for key in keys] == [False, False, False, True, True]
+    assert detector.items == 5
+    assert detector.duplicates == 2
+    assert not detector.needs_confirmation
+
+
+def test_duplicate_detector_bloom() -> None:
+    keys = [("c", str(i)) for i in range(5000)] + [("c", "7"), ("c", "7"), ("c", "9")]
+    detector = digests.DuplicateDetector(bloom=True, expected_items=len(keys))
+    for key in keys:
+        detector.add(*key)
+    assert detector.duplicates == 0
+    assert detector.needs_confirmation
+    # only true duplicates survive the exact confirming pass
+    assert detector.confirm(keys) == 3
+    assert (detector.duplicates, detector.needs_confirmation) == (3, False)
+
+    # ~14.4 bits per item at the default false positive rate
+    assert detector.bloom is not None
+    assert detector.bloom.nbytes < 2 * len(keys)
+
+
+def test_stream_digest() -> None:
+    def stream(*ids: str) -> digests.StreamDigest:
+        result = digests.StreamDigest()
+        for item_id in ids:
+            result.add("c", item_id)
+        return result
+
+    assert stream("a", "b", "c").same_order(stream("a", "b", "c"))
+    assert stream("a", "b", "c").same_items(stream("c", "a", "b"))
+    assert not stream("a", "b", "c").same_order(stream("c", "a", "b"))
+    assert not stream("a", "b", "c").same_items(stream("a", "b", "d"))
+    assert not stream("a", "b").same_items(stream("a", "b", "b"))
+
+    assert stream("a", "b", "b").extra_digest(stream("b", "a")) == (
+        digests.item_digest("c", "b")
+    )
+    assert stream("a", "b").extra_digest(stream("a", "b")) is None
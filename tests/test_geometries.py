@@ -0,0 +1,26 @@
+"""
+Test cases for the 'geometries' module
+"""
+
+import pytest
+from shapely.geometry import shape
+
+from stac_api_validator import geometries
+
+
+@pytest.mark.parametrize("vertices", [3, 10, 101, 10_000])
+def test_complex_polygon(vertices: int) -> None:
+    polygon = shape(geometries.complex_polygon((100.0, 0.0, 101.0, 1.0), vertices))
+    assert polygon.is_valid
+    assert len(polygon.exterior.coords) == vertices + 1
+    min_x, min_y, max_x, max_y = polygon.bounds
+    assert 100.0 <= min_x and max_x <= 101.0 and 0.0 <= min_y and max_y <= 1.0
+
+
+@pytest.mark.parametrize("vertices", [10, 1000])
+def test_complex_multipolygon(vertices: int) -> None:
+    multipolygon = shape(
+        geometries.complex_multipolygon((100.0, 0.0, 101.0, 1.0), vertices)
+    )
+    assert multipolygon.is_valid
+    assert len(multipolygon.geoms) == 4
@@ -0,0 +1,55 @@
+"""
+Test cases for the 'latency' module
+"""
+
+from typing import List
+
+import pytest
+
+from stac_api_validator import latency
+
+
+def test_linear_fit() -> None:
+    slope, intercept, r = latency.linear_fit([1, 2, 3, 4], [3, 5, 7, 9])
+    assert slope == pytest.approx(2)
+    assert intercept == pytest.approx(1)
+    assert r == pytest.approx(1)
+
+    assert latency.linear_fit([1, 2, 3], [4, 4, 4]) == (0.0, 4.0, 0.0)
+    assert latency.linear_fit([1, 1], [1, 2]) == (0.0, 1.5, 0.0)
+
+
+def profile(seconds: List[float]) -> latency.LatencyProfile:
+    result = latency.LatencyProfile()
+    for s in seconds:
+        result.record(s, 1000)
+    return result
+
+
+def test_latency_profile_degrades() -> None:
+    # an offset-based backend, slower by 50 ms every page
+    offsets = profile([0.1 + 0.05 * page for page in range(20)])
+    assert offsets.degrades()
+    assert offsets.growth() == pytest.approx(1.05 / 0.1)
+    assert [p.page for p in offsets.pages[:2]] == [1, 2]
+
+    flat = profile([0.1, 0.12, 0.09, 0.11, 0.1, 0.13, 0.1, 0.09])
+    assert not flat.degrades()
+
+    # a trend over too few pages is noise
+    assert not profile([0.1, 0.2, 0.4]).degrades()
+
+
+def test_latency_profile_first_over_budget() -> None:
+    timings = profile([0.5, 1.0, 2.5, 1.0, 3.0])
+    over = timings.first_over_budget(2.0)
+    assert over is not None
+    assert (over.page, over.seconds) == (3, 2.5)
+    assert timings.first_over_budget(5.0) is None
+
+
+def test_percentile() -> None:
+    assert latency.percentile([3, 1, 2], 0.5) == 2
+    assert latency.percentile([1, 2, 3, 4], 0.5) == 2.5
+    assert latency.percentile(list(range(101)), 0.95) == pytest.approx(95)
+    assert latency.percentile([7], 0.95) == 7
@@ -0,0 +1,33 @@
+"""
+Test cases for the 'memo' module
+"""
+
+from stac_api_validator import memo
+
+
+def test_content_digest() -> None:
+    assert memo.content_digest({"a": 1, "b": [1, 2]}, ["x"]) == memo.content_digest(
+        {"b": [1, 2], "a": 1}, ["x"]
+    )
+    assert memo.content_digest({"a": 1}, ["x"]) != memo.content_digest({"a": 1}, ["y"])
+    assert memo.content_digest({"a": 1}, ["x"]) != memo.content_digest({"a": 2}, ["x"])
+
+
+def test_verdict_cache() -> None:
+    cache = memo.VerdictCache(max_entries=2)
+    findings = [("error", True, "failed schema validation: bad")]
+
+    assert cache.get("stac-check", "a") is None
+    cache.put("a", findings, 2.0)
+    cache.put("b", [], 1.0)
+    assert cache.get("stac-check", "a") == findings
+
+    # "b" is now the least recently used entry
+    cache.put("c", [], 1.0)
+    assert len(cache) == 2
+    assert cache.get("stac-check", "b") is None
+    assert cache.get("stac-validator", "c") == []
+
+    assert cache.lookups == {"stac-check": 3, "stac-validator": 1}
+    assert cache.hits == {"stac-check": 1, "stac-validator": 1}
+    assert cache.seconds_saved == 3.0
@@ -0,0 +1,66 @@
+"""
+Test cases for the 'pipeline' module
+"""
+
+import time
+from typing import Iterator
+from typing import List
+
+import pytest
+
+from stac_api_validator import pipeline
+
+
+def slow_pages(count: int, seconds: float, fetched: List[int]) -> Iterator[int]:
+    for i in range(count):
+        time.sleep(seconds)
+        fetched.append(i)
+        yield i
+
+
+def test_prefetcher_overlaps_fetching_with_processing() -> None:
+    fetched: List[int] = []
+    prefetcher = pipeline.Prefetcher(slow_pages(5, 0.02, fetched), depth=2)
+    pages = []
+    for page in prefetcher:
+        time.sleep(0.02)
+        pages.append(page)
+
+    assert pages == [0, 1, 2, 3, 4]
+    assert prefetcher.fetch_seconds >= 0.1
+    assert prefetcher.process_seconds >= 0.1
+    # sequentially this would take 0.2s
+    assert prefetcher.overlap_seconds > 0.05
+
+
+def test_prefetcher_is_bounded_and_stops_early() -> None:
+    fetched: List[int] = []
+    prefetcher = pipeline.Prefetcher(slow_pages(100, 0, fetched), depth=3)
+    for page in prefetcher:
+        time.sleep(0.05)
+        break
+
+    assert page == 0
+    # the page being processed, the buffered pages, and the one waiting to be buffered
+    assert len(fetched) <= 5
+    assert not prefetcher._thread.is_alive()
+
+
+def test_prefetcher_raises_source_errors() -> None:
+    def failing() -> Iterator[int]:
+        yield 1
+        raise ValueError("bad page")
+
+    with pytest.raises(ValueError, match="bad page"):
+        list(pipeline.Prefetcher(failing()))
+
+
+def test_prefetcher_raises_unexpected_errors() -> None:
+    def failing() -> Iterator[int]:
+        yield 1
+        raise KeyError("bug")
+
+    prefetcher = pipeline.Prefetcher(failing())
+    with pytest.raises(KeyError, match="bug"):
+        list(prefetcher)
+    assert not prefetcher._thread.is_alive()
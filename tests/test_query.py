@@ -0,0 +1,47 @@
+"""
+Test cases for the 'query' module
+"""
+
+from typing import List
+
+import pytest
+
+from stac_api_validator.query import OPERATORS
+from stac_api_validator.query import QueryProbe
+
+
+@pytest.mark.parametrize(
+    "operator, value, matching, non_matching",
+    [
+        ("eq", "5", [5, 5.0], [4, "5", None, True]),
+        ("neq", "5", [4, "5", None], [5]),
+        ("lt", "5", [4, -1.5], [5, 6, "4", None]),
+        ("lte", "5", [5, 4], [6, None]),
+        ("gt", "5", [6], [5, None]),
+        ("gte", "5", [5, 6], [4]),
+        ("startsWith", "ab", ["abc", "ab"], ["cab", None]),
+        ("endsWith", "bc", ["abc"], ["bca"]),
+        ("contains", "b", ["abc", "b"], ["ac"]),
+        ("in", ["a", "b"], ["a", ["c", "b"], ["a"]], ["c", ["c", "d"], []]),
+    ],
+)
+def test_operators(
+    operator: str, value: object, matching: List[object], non_matching: List[object]
+) -> None:
+    predicate = OPERATORS[operator](value)
+    assert all(predicate(x) for x in matching)
+    assert not any(predicate(x) for x in non_matching)
+
+
+def test_query_probe() -> None:
+    probe = QueryProbe("eo:cloud_cover", "lt", "10")
+    assert probe.query == {"eo:cloud_cover": {"lt": "10"}}
+    assert probe.text == '{"eo:cloud_cover": {"lt": "10"}}'
+    features = [
+        {"properties": {"eo:cloud_cover": 5}},
+        {"properties": {"eo:cloud_cover": 15}},
+        {"properties": {}},
+        "not a feature",
+    ]
+    assert probe.values(features) == [5, 15, None, None]
+    assert probe.non_matching(features) == [15, None, None]
@@ -0,0 +1,76 @@
+"""
+Test cases for the 'sampling' module
+"""
+
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+
+from stac_api_validator import sampling
+
+
+def test_collection_extent() -> None:
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert sampling.collection_extent(
+        {
+            "extent": {
+                "spatial": {"bbox": [[10, 20, 0, 30, 40, 100]]},
+                "temporal": {"interval": [["2020-01-01T00:00:00Z", None]]},
+            }
+        },
+        now=now,
+    ) == ((10.0, 20.0, 30.0, 40.0), datetime(2020, 1, 1, tzinfo=timezone.utc), now)
+
+    assert sampling.collection_extent({}, now=now) == (
+        sampling.WORLD_BBOX,
+        sampling.EPOCH,
+        now,
+    )
+
+
+def test_strata() -> None:
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 5, tzinfo=timezone.utc)
+
+    result = sampling.strata((0, 0, 20, 20), start, end, 4, seed=1)
+
+    assert [interval for interval, _ in result] == [
+        "2020-01-01T00:00:00Z/2020-01-02T00:00:00Z",
+        "2020-01-02T00:00:00Z/2020-01-03T00:00:00Z",
+        "2020-01-03T00:00:00Z/2020-01-04T00:00:00Z",
+        "2020-01-04T00:00:00Z/2020-01-05T00:00:00Z",
+    ]
+    assert sorted(bbox for _, bbox in result) == [
+        [0, 0, 10, 10],
+        [0, 10, 10, 20],
+        [10, 0, 20, 10],
+        [10, 10, 20, 20],
+    ]
+    assert result == sampling.strata((0, 0, 20, 20), start, end, 4, seed=1)
+
+
+def test_strata_antimeridian() -> None:
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 5, tzinfo=timezone.utc)
+
+    result = sampling.strata((170, 0, -170, 20), start, end, 4, seed=1)
+
+    assert sorted(bbox for _, bbox in result) == [
+        [-180, 0, -170, 10],
+        [-180, 10, -170, 20],
+        [170, 0, 180, 10],
+        [170, 10, 180, 20],
+    ]
+
+
+def test_wilson_interval() -> None:
+    assert sampling.wilson_interval(0, 0) == (0.0, 1.0)
+
+    low, high = sampling.wilson_interval(0, 100)
+    assert low == 0.0
+    assert high == pytest.approx(0.037, abs=0.001)
+
+    low, high = sampling.wilson_interval(10, 100)
+    assert low == pytest.approx(0.0552, abs=0.0001)
+    assert high == pytest.approx(0.1744, abs=0.0001)
@@ -0,0 +1,232 @@
+"""
+Test cases for the 'schemas' module
+"""
+
+import json
+import pathlib
+import unittest.mock
+from typing import Any
+from typing import Dict
+
+import pytest
+import requests
+from stac_validator import utilities as stac_validator_utilities
+from stac_validator.stac_validator import StacValidate
+
+from stac_api_validator import schemas
+
+
+extension_id = "https://example.com/private-ext/v1.0.0/schema.json"
+
+extension_schema = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "$id": f"{extension_id}#",
+    "type": "object",
+    "required": ["properties"],
+    "properties": {
+        "properties": {
+            "type": "object",
+            "required": ["private:flag"],
+            "properties": {"private:flag": {"type": "boolean"}},
+        }
+    },
+}
+
+
+@pytest.fixture
+def schema_dir(tmp_path: pathlib.Path) -> pathlib.Path:
+    (tmp_path / "nested").mkdir()
+    with open(tmp_path / "nested" / "private.json", "w") as f:
+        json.dump(extension_schema, f)
+    with open(tmp_path / "no-id.json", "w") as f:
+        json.dump({"type": "object"}, f)
+    return tmp_path
+
+
+def test_schema_store_indexes_bundle_and_schema_dir(
+    tmp_path: pathlib.Path, schema_dir: pathlib.Path
+) -> None:
+    bundle_dir = tmp_path / "bundle"
+    path = schemas.bundle_path(
+        bundle_dir,
+        "https://schemas.stacspec.org/v1.0.0/item-spec/json-schema/item.json",
+    )
+    path.parent.mkdir(parents=True)
+    path.write_text("{}")
+
+    store = schemas.SchemaStore(bundle_dir=bundle_dir, schema_dir=schema_dir)
+
+    assert len(store) == 2
+    assert extension_id in store
+    assert f"{extension_id}#" in store
+    assert "http://example.com/private-ext/v1.0.0/schema.json" in store
+    assert (
+        "https://schemas.stacspec.org/v1.0.0/item-spec/json-schema/item.json" in store
+    )
+    assert "https://example.com/other/schema.json" not in store
+
+
+def test_schema_store_missing_schema_dir(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(ValueError):
+        schemas.SchemaStore(bundle_dir=None, schema_dir=tmp_path / "missing")
+
+
+def test_schema_store_installed(schema_dir: pathlib.Path) -> None:
+    store = schemas.SchemaStore(bundle_dir=None, schema_dir=schema_dir)
+    original = stac_validator_utilities.fetch_and_parse_file
+    remote_schema = {"type": "object"}
+
+    with unittest.mock.patch.object(
+        stac_validator_utilities, "fetch_and_parse_file", return_value=remote_schema
+    ) as fetch_mock:
+        with store.installed():
+            assert stac_validator_utilities.fetch_and_parse_file(extension_id) == (
+                extension_schema
+            )
+            assert (
+                stac_validator_utilities.fetch_and_parse_file(
+                    "https://example.com/remote.json"
+                )
+                == remote_schema
+            )
+        assert stac_validator_utilities.fetch_and_parse_file is fetch_mock
+
+    assert stac_validator_utilities.fetch_and_parse_file is original
+    assert fetch_mock.call_count == 1
+    assert store.remote_fetches == ["https://example.com/remote.json"]
+
+
+def test_stac_validator_uses_installed_store(schema_dir: pathlib.Path) -> None:
+    store = schemas.SchemaStore(bundle_dir=None, schema_dir=schema_dir)
+    item: Dict[str, Any] = {"type": "Feature", "properties": {"private:flag": "no"}}
+
+    with store.installed():
+        validator = StacValidate(custom=extension_id)
+        assert not validator.validate_dict(item)
+
+    assert store.remote_fetches == []
+
+
+def test_refresh_schema_bundle(tmp_path: pathlib.Path) -> None:
+    responses = {
+        "https://example.com/v1/item.json": {
+            "$id": "https://example.com/v1/item.json#",
+            "allOf": [
+                {"$ref": "https://json-schema.org/draft-07/schema#"},
+                {"$ref": "common.json#/definitions/common"},
+                {"$ref": "#/definitions/local"},
+            ],
+        },
+        "https://example.com/v1/common.json": {
+            "definitions": {"common": {"$ref": "http://example.com/v1/item.json"}}
+        },
+    }
+
+    def get(url: str, timeout: int) -> unittest.mock.MagicMock:
+        resp = unittest.mock.MagicMock()
+        if url in responses:
+            resp.json.return_value = responses[url]
+        else:
+            resp.raise_for_status.side_effect = requests.HTTPError("404")
+        return resp
+
+    r_session = unittest.mock.MagicMock()
+    r_session.get.side_effect = get
+
+    fetched, failed = schemas.refresh_schema_bundle(
+        tmp_path,
+        urls=["https://example.com/v1/item.json", "https://example.com/v1/gone.json"],
+        r_session=r_session,
+    )
+
+    assert fetched == [
+        "https://example.com/v1/item.json",
+        "https://example.com/v1/common.json",
+    ]
+    assert failed == ["https://example.com/v1/gone.json"]
+
+    store = schemas.SchemaStore(bundle_dir=tmp_path)
+    assert (
+        store.fetch("https://example.com/v1/common.json")
+        == (responses["https://example.com/v1/common.json"])
+    )
+    assert store.remote_fetches == []
+
+
+@pytest.fixture
+def stac_bundle(tmp_path: pathlib.Path) -> pathlib.Path:
+    bundle_dir = tmp_path / "bundle"
+    bundle_schemas = {
+        "https://schemas.stacspec.org/v1.0.0/item-spec/json-schema/item.json": {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "$id": "https://schemas.stacspec.org/v1.0.0/item-spec/json-schema/item.json#",
+            "type": "object",
+            "required": ["id", "properties"],
+            "properties": {
+                "id": {"type": "string"},
+                "properties": {"$ref": "basics.json"},
+            },
+        },
+        "https://schemas.stacspec.org/v1.0.0/item-spec/json-schema/basics.json": {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "$id": "https://schemas.stacspec.org/v1.0.0/item-spec/json-schema/basics.json#",
+            "type": "object",
+            "properties": {"title": {"type": "string"}},
+        },
+    }
+    for url, schema in bundle_schemas.items():
+        path = schemas.bundle_path(bundle_dir, url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(schema, f)
+    return bundle_dir
+
+
+def feature(item_id: Any, **properties: Any) -> Dict[str, Any]:
+    return {
+        "type": "Feature",
+        "stac_version": "1.0.0",
+        "id": item_id,
+        "properties": properties,
+    }
+
+
+def test_validator_index(stac_bundle: pathlib.Path, schema_dir: pathlib.Path) -> None:
+    store = schemas.SchemaStore(bundle_dir=stac_bundle, schema_dir=schema_dir)
+    index = schemas.ValidatorIndex(store)
+
+    assert index.validate(feature("a")) == []
+    assert index.validate(feature("b", title="b")) == []
+    assert index.validate(feature("c", title=3)) == [
+        "3 is not of type 'string'. Error is in properties -> title"
+    ]
+    assert index.hits == 2
+    assert index.misses == 1
+
+    with_extension = {**feature("d", title="d"), "stac_extensions": [extension_id]}
+    assert index.validate(with_extension) == [
+        "'private:flag' is a required property. Error is in properties"
+    ]
+    with_extension["properties"]["private:flag"] = True
+    assert index.validate(with_extension) == []
+
+    assert len(index) == 2
+    assert index.hits == 3
+    assert index.misses == 2
+    assert index.hit_rate == 0.6
+    assert store.remote_fetches == []
+
+    # signatures the index can't build fall back to stac-validator
+    assert index.validate({**feature("e"), "stac_version": "0.9.0"}) is None
+    assert index.validate({**feature("f"), "stac_extensions": ["eo"]}) is None
+
+
+def test_feature_validation_pool(stac_bundle: pathlib.Path) -> None:
+    store = schemas.SchemaStore(bundle_dir=stac_bundle)
+    with schemas.FeatureValidationPool(store, workers=2) as pool:
+        findings = pool.validate(
+            [feature("a"), feature(2), feature("b"), feature(2), feature(None)]
+        )
+
+    assert set(findings) == {"2", "features[4]"}
+    assert findings["2"] == ["2 is not of type 'string'. Error is in id"] * 2
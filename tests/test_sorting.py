@@ -0,0 +1,113 @@
+"""
+Test cases for the 'sorting' module
+"""
+
+from typing import List
+from typing import Tuple
+
+import numpy as np
+
+from stac_api_validator import sorting
+
+
+def test_parse_datetimes() -> None:
+    parsed = sorting.parse_datetimes(
+        [
+            "2020-01-01T12:00:00Z",
+            "2020-01-01T14:00:00+02:00",
+            "2020-01-01T09:30:00.5-02:30",
+            "2020-01-01",
+            None,
+            "not a datetime",
+        ]
+    )
+    assert parsed.tolist()[:4] == [
+        np.datetime64("2020-01-01T12:00:00", "ns").item(),
+        np.datetime64("2020-01-01T12:00:00", "ns").item(),
+        np.datetime64("2020-01-01T12:00:00.5", "ns").item(),
+        np.datetime64("2020-01-01T00:00:00", "ns").item(),
+    ]
+    assert np.isnat(parsed[4:]).all()
+    assert len(sorting.parse_datetimes([])) == 0
+
+
+def rows(*values: object) -> List[Tuple[object, ...]]:
+    return [(value,) for value in values]
+
+
+def test_parse_sortby() -> None:
+    assert sorting.parse_sortby("eo:cloud_cover, -datetime,+id,") == [
+        sorting.SortField("eo:cloud_cover"),
+        sorting.SortField("datetime", descending=True),
+        sorting.SortField("id"),
+    ]
+    field = sorting.SortField("properties.datetime", descending=True)
+    assert field.text == "-properties.datetime"
+    assert field.json == {"field": "properties.datetime", "direction": "desc"}
+
+
+def test_compile_key() -> None:
+    key = sorting.compile_key(
+        sorting.parse_sortby("eo:cloud_cover,properties.datetime,id")
+    )
+    item = {
+        "id": "a",
+        "properties": {"eo:cloud_cover": 5, "datetime": "2020-01-01T00:00:00Z"},
+    }
+    assert key(item) == (5, "2020-01-01T00:00:00Z", "a")
+    assert key({"id": "b"}) == (None, None, "b")
+
+
+def test_sort_column() -> None:
+    numbers, missing = sorting.sort_column([2, None, 1.5])
+    assert numbers[[0, 2]].tolist() == [2.0, 1.5]
+    assert missing.tolist() == [False, True, False]
+
+    instants, missing = sorting.sort_column(
+        ["2020-01-01T12:00:00Z", "2020-01-01T13:00:00+02:00"]
+    )
+    assert instants[0] > instants[1]
+
+    strings, _ = sorting.sort_column(["b", "a", None])
+    assert strings[0] > strings[1]
+
+    _, missing = sorting.sort_column([1, "a"])
+    assert missing.all()
+
+
+def test_sort_checker() -> None:
+    checker = sorting.SortChecker(sorting.parse_sortby("datetime"))
+    # as strings, the second sorts before the first
+    assert checker.check(
+        rows("2020-01-01T12:00:00Z", "2020-01-01T13:00:00+02:00"), "ab"
+    ) == [("a", "b")]
+    # across the page boundary, and skipping an item without a datetime
+    assert checker.check(
+        rows(None, "2020-01-01T10:00:00Z", "2021-01-01T00:00:00Z"), "cde"
+    ) == [("b", "d")]
+    assert checker.check([], []) == []
+    assert (checker.pages, checker.items, checker.unsortable) == (3, 5, 1)
+    assert checker.out_of_order == 2
+    assert checker.last_label == "e"
+
+    descending = sorting.SortChecker(sorting.parse_sortby("-datetime"))
+    assert (
+        descending.check(rows("2021-01-01T00:00:00Z", "2020-01-01T00:00:00Z"), "ab")
+        == []
+    )
+    assert descending.check(rows("2020-06-01T00:00:00Z"), "c") == [("b", "c")]
+
+
+def test_sort_checker_multiple_keys() -> None:
+    checker = sorting.SortChecker(sorting.parse_sortby("eo:cloud_cover,-datetime,id"))
+    page = [
+        (0, "2020-01-02T00:00:00Z", "b"),
+        (0, "2020-01-01T00:00:00Z", "a"),
+        # ties on the first two keys, ordered by the third
+        (0, "2020-01-01T00:00:00Z", "c"),
+        (0, "2020-01-01T00:00:00Z", "b"),
+        (10, "2020-01-03T00:00:00Z", "a"),
+    ]
+    assert checker.check(page, "ABCDE") == [("C", "D")]
+    # the first key decides, whatever the others
+    assert checker.check([(5, "2021-01-01T00:00:00Z", "z")], "F") == [("E", "F")]
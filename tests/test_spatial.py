@@ -0,0 +1,101 @@
+"""
+Test cases for the 'spatial' module
+"""
+
+from typing import Any
+from typing import Dict
+
+import numpy as np
+
+from stac_api_validator import spatial
+
+
+def feature(item_id: str, x: float, y: float) -> Dict[str, Any]:
+    return {
+        "id": item_id,
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[[x, y], [x + 1, y], [x + 1, y + 1], [x, y + 1], [x, y]]],
+        },
+    }
+
+
+def test_page_geometries() -> None:
+    geometries = spatial.page_geometries(
+        [feature("a", 0, 0), {"id": "b", "geometry": None}, {"id": "c"}, "d"]
+    )
+    assert geometries[0].geom_type == "Polygon"
+    assert list(geometries[1:]) == [None, None, None]
+
+
+def test_non_intersecting() -> None:
+    query = spatial.query_geometry(
+        {
+            "type": "Polygon",
+            "coordinates": [[[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]]],
+        }
+    )
+    features = [
+        feature("inside", 2, 2),
+        feature("outside", 20, 20),
+        feature("touching", 10, 10),
+        {"id": "no geometry", "geometry": None},
+        {"id": "bad geometry", "geometry": {"type": "Polygon"}},
+    ]
+    assert spatial.non_intersecting(query, features) == [1, 3, 4]
+    assert spatial.non_intersecting(query, []) == []
+
+
+def test_page_bboxes() -> None:
+    boxes = spatial.page_bboxes(
+        [
+            {"bbox": [1, 2, 3, 4]},
+            {"bbox": [1, 2, 0, 3, 4, 10]},
+            {"geometry": {"type": "Point", "coordinates": [5, 6]}},
+            {"bbox": ["a", 2, 3, 4]},
+            {},
+        ]
+    )
+    assert boxes[:3].tolist() == [[1, 2, 3, 4], [1, 2, 3, 4], [5, 6, 5, 6]]
+    assert np.isnan(boxes[3:]).all()
+
+
+def test_outside_bbox() -> None:
+    features = [
+        {"id": "inside", "bbox": [100.5, 0.2, 101, 0.5]},
+        {"id": "outside", "bbox": [0, 0, 1, 1]},
+        {"id": "crossing the antimeridian", "bbox": [170, 0, -170, 1]},
+        {"id": "no bbox", "geometry": {"type": "Point", "coordinates": [104, 0.5]}},
+        {"id": "no bbox or geometry"},
+    ]
+    assert spatial.outside_bbox([100, 0, 105, 1], features) == [1, 2, 4]
+    assert spatial.outside_bbox([100, 0, 0, 105, 1, 1], features) == [1, 2, 4]
+    # query bboxes crossing the antimeridian
+    assert spatial.outside_bbox([175, -1, -175, 2], features) == [0, 1, 3, 4]
+    assert spatial.outside_bbox([-179, 0, -178, 1], features) == [0, 1, 3, 4]
+    assert spatial.outside_bbox([90, 0, 0.5, 1], features) == [4]
+    assert spatial.outside_bbox([100, 0, 105, 1], []) == []
+
+
+def test_item_index() -> None:
+    index = spatial.ItemIndex()
+    index.add([1, 2], [feature("a", 0, 0), feature("b", 5, 5)])
+    # crawled twice, and without a geometry
+    index.add([2, 3], [feature("b", 5, 5), {"id": "c", "geometry": None}])
+    index.build()
+    assert len(index) == 2
+
+    windows = np.array([[0.5, 0.5, 0.6, 0.6], [-1, -1, 10, 10], [20, 20, 21, 21]])
+    matches = index.matches(windows)
+    assert [m.tolist() for m in matches] == [[1], [1, 2], []]
+
+
+def test_random_windows() -> None:
+    bounds = np.array([[0.0, 0.0, 1.0, 1.0], [179.5, 89.5, 180.0, 90.0]])
+    windows = spatial.random_windows(bounds, 100, seed=1)
+    assert windows.shape == (100, 4)
+    assert (windows[:, 0] <= windows[:, 2]).all()
+    assert (windows[:, 1] <= windows[:, 3]).all()
+    assert windows[:, 0].min() >= -180 and windows[:, 2].max() <= 180
+    assert windows[:, 1].min() >= -90 and windows[:, 3].max() <= 90
+    assert np.array_equal(windows, spatial.random_windows(bounds, 100, seed=1))
@@ -0,0 +1,78 @@
+"""
+Test cases for the 'structure' module
+"""
+
+from typing import Any
+from typing import Dict
+
+from stac_api_validator import structure
+
+
+def item(**overrides: Any) -> Dict[str, Any]:
+    body: Dict[str, Any] = {
+        "type": "Feature",
+        "stac_version": "1.0.0",
+        "id": "a",
+        "geometry": {"type": "Point", "coordinates": [0, 0]},
+        "bbox": [0, 0, 0, 0],
+        "properties": {"datetime": "2020-01-01T00:00:00Z"},
+        "links": [{"rel": "self", "href": "https://invalid/items/a"}],
+        "assets": {"data": {"href": "https://invalid/a.tif"}},
+    }
+    body.update(overrides)
+    return {k: v for k, v in body.items() if v is not ...}
+
+
+def test_item_structure_errors() -> None:
+    assert structure.item_structure_errors(item()) == []
+    assert structure.item_structure_errors(item(geometry=None, bbox=...)) == []
+    assert (
+        structure.item_structure_errors(
+            item(properties={"start_datetime": "2020", "end_datetime": "2021"})
+        )
+        == []
+    )
+
+    assert structure.item_structure_errors([]) == ["is not a JSON object"]
+    assert structure.item_structure_errors(item(bbox=..., assets=...)) == [
+        "missing 'bbox'",
+        "missing 'assets'",
+    ]
+    assert structure.item_structure_errors(
+        item(type="Collection", id="", bbox=[0, 0, "1", 1])
+    ) == [
+        "'type' is 'Collection' instead of 'Feature'",
+        "'id' is not a non-empty string",
+        "'bbox' is not an array of 4 or 6 numbers",
+    ]
+    assert structure.item_structure_errors(
+        item(
+            properties={},
+            links=[{"rel": "self", "href": "x"}, {"rel": "root"}, "x"],
+            assets={"data": {}},
+            stac_extensions="eo",
+        )
+    ) == [
+        "does not have either 'properties.datetime' or "
+        "('properties.start_datetime' and 'properties.end_datetime')",
+        "'links' entries [1, 2] do not have string 'href' and 'rel'",
+        "'assets' ['data'] do not have a string 'href'",
+        "'stac_extensions' is not an array of strings",
+    ]
+
+
+def test_page_structure_errors() -> None:
+    assert structure.page_structure_errors([item(), item(id=None), item(), None]) == {
+        1: ["'id' is not a non-empty string"],
+        3: ["is not a JSON object"],
+    }
+
+
+def test_in_sample() -> None:
+    items = [item(id=f"item-{i}") for i in range(1000)]
+
+    assert all(structure.in_sample(i, 1.0) for i in items)
+    assert not any(structure.in_sample(i, 0.0) for i in items)
+    sampled = [i["id"] for i in items if structure.in_sample(i, 0.25)]
+    assert 200 < len(sampled) < 300
+    assert sampled == [i["id"] for i in items if structure.in_sample(i, 0.25)]
@@ -3,19 +3,32 @@ Test cases for the 'validations' module
 """
 
 import json
+import logging
+import operator as operator_module
 import os
 import pathlib
+import re
+import time
 import unittest.mock
 from copy import copy
+from typing import Any
 from typing import Dict
 from typing import Generator
+from typing import List
+from typing import Optional
+from typing import Tuple
 
 import pystac
 import pytest
 import requests
 import sys
+from jsonschema import Draft7Validator
+from shapely.geometry import shape
 
 from stac_api_validator import validations
+from stac_api_validator.memo import VerdictCache
+from stac_api_validator.schemas import ValidatorIndex
+from stac_api_validator.sorting import parse_sortby
 
 
 @pytest.fixture
@@ -160,3 +173,1466 @@ def test_validate_browseable(
         assert get_catalog_mock.call_count == 1
         session_from_mock = get_catalog_mock.call_args.args[-1]
         assert session_from_mock.headers == expected_headers
+
+
+def test_stac_validate_all_features(sample_item: pystac.Item) -> None:
+    feature_pool = unittest.mock.MagicMock()
+    feature_pool.validate.return_value = {"bad-item": ["'id' is a required property"]}
+    run = validations.ValidationRun(
+        schema_store=unittest.mock.MagicMock(), feature_pool=feature_pool
+    )
+    errors = validations.Errors()
+
+    validations.stac_validate(
+        "https://invalid/search",
+        {"type": "FeatureCollection", "features": [sample_item.to_dict()]},
+        errors,
+        validations.Context.ITEM_SEARCH,
+        run=run,
+    )
+
+    assert feature_pool.validate.call_count == 1
+    assert errors.as_list() == [
+        "[Item Search] : GET https://invalid/search item 'bad-item' failed "
+        "stac-validator validation: 'id' is a required property"
+    ]
+
+
+def test_stac_validate_validator_index(sample_item: pystac.Item) -> None:
+    validator_index = unittest.mock.MagicMock()
+    validator_index.validate.return_value = ["'id' is a required property"]
+    run = validations.ValidationRun(
+        schema_store=unittest.mock.MagicMock(), validator_index=validator_index
+    )
+    errors = validations.Errors()
+
+    validations.stac_validate(
+        "https://invalid/collections/c/items/i",
+        sample_item.to_dict(),
+        errors,
+        validations.Context.FEATURES,
+        run=run,
+    )
+
+    assert validator_index.validate.call_count == 1
+    assert errors.as_list() == [
+        "[Features] : GET https://invalid/collections/c/items/i failed schema "
+        "validation: 'id' is a required property"
+    ]
+
+
+def test_stac_validate_uses_empty_validator_index(sample_item: pystac.Item) -> None:
+    validator_index = ValidatorIndex(unittest.mock.MagicMock())
+    run = validations.ValidationRun(
+        schema_store=unittest.mock.MagicMock(), validator_index=validator_index
+    )
+    errors = validations.Errors()
+
+    with unittest.mock.patch.object(
+        validator_index, "_build", return_value=Draft7Validator({"required": ["foo"]})
+    ):
+        validations.stac_validate(
+            "https://invalid/collections/c/items/i",
+            sample_item.to_dict(),
+            errors,
+            validations.Context.FEATURES,
+            run=run,
+        )
+
+    assert validator_index.misses == 1
+    assert errors.as_list() == [
+        "[Features] : GET https://invalid/collections/c/items/i failed schema "
+        "validation: 'foo' is a required property"
+    ]
+
+
+def test_stac_validate_structure_only_with_all_features(
+    sample_item: pystac.Item,
+) -> None:
+    body = {
+        "type": "FeatureCollection",
+        "features": [{**sample_item.to_dict(), "bbox": None}],
+    }
+    errors = validations.Errors()
+
+    validations.stac_validate(
+        "https://invalid/search", body, errors, validations.Context.ITEM_SEARCH
+    )
+
+    assert not any("structural validation" in e for e in errors)
+
+
+def test_stac_validate_defers_assets_to_asset_checker(
+    sample_item: pystac.Item,
+) -> None:
+    asset_checker = unittest.mock.MagicMock()
+    run = validations.ValidationRun(
+        schema_store=unittest.mock.MagicMock(), asset_checker=asset_checker
+    )
+    body = sample_item.to_dict()
+
+    with unittest.mock.patch.object(validations, "StacValidate") as stac_validate_mock:
+        validations.stac_validate(
+            "https://invalid/collections/c/items/i",
+            body,
+            validations.Errors(),
+            validations.Context.FEATURES,
+            run=run,
+        )
+
+    asset_checker.collect.assert_called_once_with(
+        validations.Context.FEATURES,
+        validations.Method.GET,
+        "https://invalid/collections/c/items/i",
+        body,
+    )
+    assert stac_validate_mock.call_args.kwargs["assets_open_urls"] is False
+
+
+def test_validate_item_sample(
+    request: pytest.FixtureRequest, r_session: requests.Session
+) -> None:
+    if request.config.getoption("typeguard_packages"):
+        pytest.skip(
+            "The import hook that typeguard uses seems to break the mock below."
+        )
+    root_body = {
+        "links": [
+            {"rel": "data", "href": "https://invalid/collections"},
+            {"rel": "search", "href": "https://invalid/search"},
+        ]
+    }
+    collection_body = {
+        "extent": {
+            "spatial": {"bbox": [[0, 0, 10, 10]]},
+            "temporal": {
+                "interval": [["2020-01-01T00:00:00Z", "2020-01-05T00:00:00Z"]]
+            },
+        }
+    }
+
+    def item(item_id: str, parent: bool = True) -> Dict[str, Any]:
+        links = [
+            {"rel": "self", "href": f"https://invalid/items/{item_id}"},
+            {"rel": "root", "href": "https://invalid"},
+        ]
+        if parent:
+            links.append({"rel": "parent", "href": "https://invalid/collections/c"})
+        return {"type": "Feature", "id": item_id, "links": links}
+
+    items = {"a": item("a"), "b": item("b", parent=False), "c": item("c")}
+    searches = []
+
+    def retrieve(method, url, errors, context, r_session, params=None, **kwargs):  # type: ignore
+        if url == "https://invalid/collections/c":
+            return 200, collection_body, {}
+        if url == "https://invalid/search":
+            searches.append(params)
+            return 200, {"features": list(items.values())}, {}
+        return 200, items[url.rsplit("/", 1)[-1]], {}
+
+    errors = validations.Errors()
+    warnings = validations.Warnings()
+    with (
+        unittest.mock.patch.object(validations, "retrieve", side_effect=retrieve),
+        unittest.mock.patch.object(validations, "stac_validate") as stac_validate_mock,
+        unittest.mock.patch.object(validations, "stac_check"),
+    ):
+        validations.validate_item_sample(
+            root_body, "c", 4, 0, errors, warnings, r_session
+        )
+
+    # the fourth stratum has no unsampled items left
+    assert len(searches) == 5
+    assert searches[0]["collections"] == "c"
+    assert searches[0]["datetime"] == "2020-01-01T00:00:00Z/2020-01-02T00:00:00Z"
+    assert "bbox" not in searches[-1]
+    assert stac_validate_mock.call_count == 3
+    assert errors.as_list() == [
+        "[Item Search] GET https://invalid/items/b does not have parent link"
+    ]
+
+
+def test_stac_check_lints_body(sample_item: pystac.Item) -> None:
+    body = sample_item.to_dict()
+
+    with unittest.mock.patch.object(validations, "Linter") as linter_mock:
+        linter_mock.return_value.best_practices_msg = []
+        validations.stac_check(
+            "https://invalid/collections/c/items/i",
+            validations.Errors(),
+            validations.Warnings(),
+            validations.Context.FEATURES,
+            body=body,
+        )
+
+    assert linter_mock.call_args.args == (body,)
+
+
+def test_paginate(request: pytest.FixtureRequest, r_session: requests.Session) -> None:
+    if request.config.getoption("typeguard_packages"):
+        pytest.skip(
+            "The import hook that typeguard uses seems to break the mock below."
+        )
+    pages = {
+        "https://invalid/search": {
+            "features": [{"id": "a"}],
+            "links": [
+                {
+                    "rel": "next",
+                    "href": "https://invalid/search/next",
+                    "method": "POST",
+                    "body": {"token": "b"},
+                    "merge": True,
+                }
+            ],
+        },
+        "https://invalid/search/next": {
+            "features": [{"id": "b"}],
+            "links": [
+                {
+                    "rel": "next",
+                    "href": "https://invalid/search/next",
+                    "method": "POST",
+                    "body": {"token": "b"},
+                    "merge": True,
+                }
+            ],
+        },
+    }
+    requested = []
+
+    def retrieve(
+        method: validations.Method,
+        url: str,
+        errors: validations.Errors,
+        context: validations.Context,
+        r_session: requests.Session,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        requested.append((method, url, params, body))
+        return 200, pages[url], {}
+
+    errors = validations.Errors()
+    with unittest.mock.patch.object(validations, "retrieve", side_effect=retrieve):
+        result = list(
+            validations.paginate(
+                validations.Method.POST,
+                "https://invalid/search",
+                errors,
+                validations.Context.ITEM_SEARCH,
+                r_session,
+                body={"collections": ["c"]},
+            )
+        )
+
+    assert [page["features"][0]["id"] for _, page in result] == ["a", "b"]
+    assert requested == [
+        (
+            validations.Method.POST,
+            "https://invalid/search",
+            None,
+            {"collections": ["c"]},
+        ),
+        (
+            validations.Method.POST,
+            "https://invalid/search/next",
+            None,
+            {"collections": ["c"], "token": "b"},
+        ),
+    ]
+    assert errors.as_list() == [
+        "[Item Search] : POST https://invalid/search/next 'next' link relation refers to the same page"
+    ]
+
+
+def test_validate_item_search_bbox_pages(
+    request: pytest.FixtureRequest, r_session: requests.Session
+) -> None:
+    if request.config.getoption("typeguard_packages"):
+        pytest.skip(
+            "The import hook that typeguard uses seems to break the mock below."
+        )
+
+    def item(item_id: str, bbox: List[float]) -> Dict[str, Any]:
+        return {"id": item_id, "bbox": bbox, "geometry": None}
+
+    def mock_retrieve(
+        method: validations.Method,
+        url: str,
+        errors: validations.Errors,
+        context: validations.Context,
+        r_session: requests.Session,
+        params: Any = None,
+        body: Any = None,
+        **kwargs: Any,
+    ) -> Any:
+        if kwargs.get("status_code") == 400:
+            return 400, None, None
+        if url == "https://invalid/search":
+            return (
+                200,
+                {
+                    "features": [item("east", [175, 0, 176, 1])],
+                    "links": [
+                        {"rel": "next", "href": f"https://invalid/next?{params}"}
+                    ],
+                },
+                {},
+            )
+        # the second page has an item at 0, 0, far from the antimeridian
+        return 200, {"features": [item("zero", [0, 0, 0.5, 0.5])], "links": []}, {}
+
+    errors = validations.Errors()
+    with unittest.mock.patch.object(
+        validations, "retrieve", side_effect=mock_retrieve
+    ) as retrieve_mock:
+        validations.validate_item_search_bbox(
+            "https://invalid/search", {validations.Method.GET}, errors, r_session
+        )
+
+    assert retrieve_mock.call_args_list[4].kwargs["params"] == {
+        "bbox": "170.0,-10.0,-170.0,10.0"
+    }
+    assert [e for e in errors if "170.0" in e] == [
+        "[Item Search] : GET https://invalid/next?{'bbox': '170.0,-10.0,-170.0,10.0'} "
+        "Search results for bbox=[170.0, -10.0, -170.0, 10.0] do not all intersect "
+        "the bbox: features[0] 'zero'"
+    ]
+
+
+def test_validate_deep_collection(
+    request: pytest.FixtureRequest, r_session: requests.Session
+) -> None:
+    if request.config.getoption("typeguard_packages"):
+        pytest.skip(
+            "The import hook that typeguard uses seems to break the mock below."
+        )
+    root_body = {"links": [{"rel": "data", "href": "https://invalid/collections"}]}
+
+    def item(item_id: str, coordinates: Any) -> Dict[str, Any]:
+        return {
+            "type": "Feature",
+            "stac_version": "1.0.0",
+            "id": item_id,
+            "geometry": {"type": "Polygon", "coordinates": coordinates},
+            "bbox": [0, 0, 1, 1],
+            "properties": {"datetime": "2020-01-01T00:00:00Z"},
+            "assets": {},
+            "links": [
+                {"rel": "self", "href": f"https://invalid/items/{item_id}"},
+                {"rel": "root", "href": "https://invalid"},
+                {"rel": "parent", "href": "https://invalid/collections/c"},
+            ],
+        }
+
+    square = [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]
+    bowtie = [[[0, 0], [1, 1], [1, 0], [0, 1], [0, 0]]]
+    pages = [
+        {
+            "features": [item(f"item-{i}", square) for i in range(50)],
+            "links": [{"rel": "next", "href": "https://invalid/page-2"}],
+        },
+        {
+            "features": [
+                item("bowtie", bowtie),
+                {**item("no-bbox", square), "bbox": None},
+            ],
+            "links": [],
+        },
+    ]
+
+    errors = validations.Errors()
+    with (
+        unittest.mock.patch.object(
+            validations, "retrieve", side_effect=[(200, page, {}) for page in pages]
+        ) as retrieve_mock,
+        unittest.mock.patch.object(validations, "stac_validate") as stac_validate_mock,
+        unittest.mock.patch.object(validations, "stac_check"),
+    ):
+        validations.validate_deep_collection(
+            root_body,
+            "c",
+            errors,
+            validations.Warnings(),
+            r_session,
+            workers=4,
+        )
+
+    assert retrieve_mock.call_args_list[0].args[1] == (
+        "https://invalid/collections/c/items"
+    )
+    assert retrieve_mock.call_args_list[0].kwargs["params"] == {"limit": 100}
+    assert stac_validate_mock.call_count == 51
+    assert sorted(errors.as_list()) == [
+        "[Features] : GET https://invalid/page-2 item 'no-bbox' failed structural "
+        "validation: 'bbox' is not an array of 4 or 6 numbers",
+        "[Features] GET https://invalid/items/bowtie geometry is not valid: "
+        "Self-intersection[0.5 0.5]",
+    ]
+
+
+def test_validate_deep_collection_bounds_findings(
+    request: pytest.FixtureRequest, r_session: requests.Session
+) -> None:
+    if request.config.getoption("typeguard_packages"):
+        pytest.skip(
+            "The import hook that typeguard uses seems to break the mock below."
+        )
+    root_body = {"links": [{"rel": "data", "href": "https://invalid/collections"}]}
+    features = [
+        {
+            "type": "Feature",
+            "stac_version": "1.0.0",
+            "id": f"item-{i}",
+            "geometry": None,
+            "properties": {"datetime": "2020-01-01T00:00:00Z"},
+            "assets": {"data": {"href": f"https://invalid/item-{i}.tif"}},
+            "links": [
+                {"rel": "self", "href": f"https://invalid/items/item-{i}"},
+                {"rel": "root", "href": "https://invalid"},
+                {"rel": "parent", "href": "https://invalid/collections/c"},
+            ],
+        }
+        for i in range(3)
+    ]
+    asset_checker = unittest.mock.MagicMock()
+    asset_checker.check_references.side_effect = lambda refs: [
+        (r, "returned status code 404") for r in refs
+    ]
+    run = validations.ValidationRun(
+        schema_store=unittest.mock.MagicMock(),
+        asset_checker=asset_checker,
+        verdicts=VerdictCache(),
+    )
+
+    errors = validations.Errors()
+    warnings = validations.Warnings()
+    with (
+        unittest.mock.patch.object(
+            validations, "retrieve", return_value=(200, {"features": features}, {})
+        ),
+        unittest.mock.patch.object(validations, "stac_validate") as stac_validate_mock,
+        unittest.mock.patch.object(validations, "stac_check"),
+    ):
+        validations.validate_deep_collection(
+            root_body,
+            "c",
+            errors,
+            warnings,
+            r_session,
+            run=run,
+            workers=2,
+            max_findings=2,
+        )
+
+    # the assets are checked with their page, and nothing is kept for the end of the run
+    assert asset_checker.check_references.call_count == 1
+    asset_checker.collect.assert_not_called()
+    assert stac_validate_mock.call_args.kwargs["run"].asset_checker is None
+    assert stac_validate_mock.call_args.kwargs["run"].verdicts is None
+    assert errors.as_list() == []
+    assert warnings.as_list() == [
+        "[Features] : GET https://invalid/items/item-0 'item-0' asset 'data' "
+        "https://invalid/item-0.tif is not reachable: returned status code 404",
+        "[Features] : GET https://invalid/items/item-1 'item-1' asset 'data' "
+        "https://invalid/item-1.tif is not reachable: returned status code 404",
+        "[Features] : GET https://invalid/collections/c/items 1 more warnings from "
+        "deep validation of collection 'c' were not reported",
+    ]
+
+
+def test_stac_validate_memoizes_findings(sample_item: pystac.Item) -> None:
+    validator_index = unittest.mock.MagicMock()
+    validator_index.validate.return_value = ["'id' is a required property"]
+    run = validations.ValidationRun(
+        schema_store=unittest.mock.MagicMock(),
+        validator_index=validator_index,
+        verdicts=VerdictCache(),
+    )
+    errors = validations.Errors()
+
+    for context, url in [
+        (validations.Context.FEATURES, "https://invalid/collections/c/items"),
+        (validations.Context.FEATURES, "https://invalid/collections/c/items/i"),
+        (validations.Context.ITEM_SEARCH, "https://invalid/search"),
+    ]:
+        validations.stac_validate(url, sample_item.to_dict(), errors, context, run=run)
+
+    assert validator_index.validate.call_count == 1
+    assert run.verdicts is not None
+    assert run.verdicts.hits == {"stac-validator": 2}
+    assert errors.as_list() == [
+        "[Features] : GET https://invalid/collections/c/items failed schema "
+        "validation: 'id' is a required property",
+        "[Features] : GET https://invalid/collections/c/items/i failed schema "
+        "validation: 'id' is a required property",
+        "[Item Search] : GET https://invalid/search failed schema "
+        "validation: 'id' is a required property",
+    ]
+
+
+def test_stac_check_memoizes_findings(sample_item: pystac.Item) -> None:
+    run = validations.ValidationRun(
+        schema_store=unittest.mock.MagicMock(), verdicts=VerdictCache()
+    )
+    errors = validations.Errors()
+    warnings = validations.Warnings()
+
+    with unittest.mock.patch.object(validations, "Linter") as linter_mock:
+        linter_mock.return_value.valid_stac = True
+        linter_mock.return_value.best_practices_msg = ["header", "  use a bbox  "]
+        for url in ["https://invalid/a", "https://invalid/b"]:
+            validations.stac_check(
+                url,
+                errors,
+                warnings,
+                validations.Context.FEATURES,
+                run=run,
+                body=sample_item.to_dict(),
+            )
+
+    assert linter_mock.call_count == 1
+    assert not errors
+    assert warnings.as_list() == [
+        "[Features] : GET https://invalid/a has these stac-check recommendations: use a bbox",
+        "[Features] : GET https://invalid/b has these stac-check recommendations: use a bbox",
+    ]
+
+
+def test_paginated_duplicates() -> None:
+    items = [{"collection": "c", "id": str(i)} for i in range(10)]
+    # the last page references itself
+    looping = items + items[-3:] * 100
+
+    assert validations.paginated_duplicates(lambda: iter(items), 100, False) == (10, 0)
+    assert validations.paginated_duplicates(lambda: iter(items), 5, False) == (6, 0)
+    assert validations.paginated_duplicates(lambda: iter(looping), 1000, False) == (
+        310,
+        300,
+    )
+    assert validations.paginated_duplicates(lambda: iter(looping), 1000, True) == (
+        310,
+        300,
+    )
+
+
+def test_validate_pagination_latency(
+    request: pytest.FixtureRequest, r_session: requests.Session
+) -> None:
+    if request.config.getoption("typeguard_packages"):
+        pytest.skip(
+            "The import hook that typeguard uses seems to break the mock below."
+        )
+    requested = []
+
+    def retrieve(
+        method: validations.Method,
+        url: str,
+        errors: validations.Errors,
+        context: validations.Context,
+        r_session: requests.Session,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        # each page is 20 ms slower than the one before, as when skipping an offset
+        page = int(url.rpartition("=")[2]) if "page=" in url else 1
+        requested.append((method, url, params))
+        time.sleep(0.02 * page)
+        return (
+            200,
+            {
+                "features": [{"id": str(page)}],
+                "links": [
+                    {"rel": "next", "href": f"https://invalid/search?page={page + 1}"}
+                ],
+            },
+            {"content-length": "1000"},
+        )
+
+    errors = validations.Errors()
+    warnings = validations.Warnings()
+    with unittest.mock.patch.object(validations, "retrieve", side_effect=retrieve):
+        profile = validations.validate_pagination_latency(
+            validations.Method.GET,
+            "https://invalid/search",
+            "c",
+            errors,
+            warnings,
+            validations.Context.ITEM_SEARCH,
+            r_session,
+            pages=6,
+            budget=0.07,
+        )
+
+    assert len(profile) == 6
+    assert [p.size for p in profile.pages] == [1000] * 6
+    assert requested[0] == (
+        validations.Method.GET,
+        "https://invalid/search",
+        {"limit": 10, "collections": "c"},
+    )
+    assert not errors
+    assert len(warnings.as_list()) == 2
+    assert "pagination latency grows with page depth" in warnings.as_list()[0]
+    assert "pagination page 4 took" in warnings.as_list()[1]
+
+
+def test_benchmark_page_sizes(
+    request: pytest.FixtureRequest, r_session: requests.Session
+) -> None:
+    if request.config.getoption("typeguard_packages"):
+        pytest.skip(
+            "The import hook that typeguard uses seems to break the mock below."
+        )
+    root_body = {
+        "links": [
+            {"rel": "search", "href": "https://invalid/search", "method": "GET"},
+            {"rel": "data", "href": "https://invalid/collections"},
+        ]
+    }
+    requested = []
+
+    def retrieve(
+        method: validations.Method,
+        url: str,
+        errors: validations.Errors,
+        context: validations.Context,
+        r_session: requests.Session,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        # the server caps pages at 50 items, and puts the limit in its 'next' links
+        path, _, query = url.partition("?")
+        limit = min(int((params or {}).get("limit") or query.split("&")[0]), 50)
+        page = int(query.split("&")[1]) if query else 0
+        requested.append((path, limit))
+        return (
+            200,
+            {
+                "features": [{"id": str(i)} for i in range(limit)],
+                "links": [{"rel": "next", "href": f"{path}?{limit}&{page + 1}"}],
+            },
+            {"content-length": str(100 * limit)},
+        )
+
+    with unittest.mock.patch.object(validations, "retrieve", side_effect=retrieve):
+        results = validations.benchmark_page_sizes(
+            root_body, "c", r_session, items=100, limits=(10, 100)
+        )
+
+    assert list(results) == ["/search GET", "/collections/c/items"]
+    for profiles in results.values():
+        assert [len(profiles[10]), len(profiles[100])] == [10, 2]
+        assert max(p.items for p in profiles[100].pages) == 50
+        assert profiles[10].items == profiles[100].items == 100
+        assert profiles[100].size == 10000
+    assert requested[0] == ("https://invalid/search", 10)
+    assert ("https://invalid/collections/c/items", 10) in requested
+
+
+@pytest.mark.parametrize(
+    "post_ids, error, warning",
+    [
+        (["a", "b", "c", "d"], None, None),
+        (
+            ["a", "c", "b", "d"],
+            None,
+            "returned the same 4 items in a different order, first at item 2, which is 'b' for GET and 'c' for POST",
+        ),
+        (
+            ["a", "b", "b", "c", "d"],
+            "returned different items, 4 for GET and 5 for POST, the difference being one more 'b', first at item 3",
+            None,
+        ),
+        (
+            ["a", "b", "c"],
+            "returned different items, 4 for GET and 3 for POST, the difference being one more 'd', first at item 4, which is 'd' for GET and missing for POST",
+            None,
+        ),
+    ],
+)
+def test_validate_search_equivalence(
+    request: pytest.FixtureRequest,
+    r_session: requests.Session,
+    post_ids: List[str],
+    error: Any,
+    warning: Any,
+) -> None:
+    if request.config.getoption("typeguard_packages"):
+        pytest.skip(
+            "The import hook that typeguard uses seems to break the mock below."
+        )
+    ids = {
+        validations.Method.GET: ["a", "b", "c", "d"],
+        validations.Method.POST: post_ids,
+    }
+
+    def retrieve(
+        method: validations.Method,
+        url: str,
+        errors: validations.Errors,
+        context: validations.Context,
+        r_session: requests.Session,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        # pages of two items
+        start = int(url.partition("?page=")[2] or 0)
+        features = [
+            {"collection": "c", "id": i} for i in ids[method][start : start + 2]
+        ]
+        links = []
+        if start + 2 < len(ids[method]):
+            links.append(
+                {
+                    "rel": "next",
+                    "href": f"https://invalid/search?page={start + 2}",
+                    "method": str(method),
+                }
+            )
+        return 200, {"features": features, "links": links}, {}
+
+    errors = validations.Errors()
+    warnings = validations.Warnings()
+    with unittest.mock.patch.object(validations, "retrieve", side_effect=retrieve):
+        validations.validate_search_equivalence(
+            "https://invalid/search",
+            "c",
+            errors,
+            warnings,
+            validations.Context.ITEM_SEARCH,
+            r_session,
+            max_items=100,
+        )
+
+    assert [error in e for e in errors.as_list()] == ([True] if error else [])
+    assert [warning in w for w in warnings.as_list()] == ([True] if warning else [])
+
+
+@pytest.mark.parametrize("prefetch_pages", [0, 2])
+def test_validate_intersects_results(
+    request: pytest.FixtureRequest, r_session: requests.Session, prefetch_pages: int
+) -> None:
+    if request.config.getoption("typeguard_packages"):
+        pytest.skip(
+            "The import hook that typeguard uses seems to break the mock below."
+        )
+
+    def point(i: int, x: float) -> Dict[str, Any]:
+        return {
+            "collection": "c",
+            "id": f"item-{i}",
+            "geometry": {"type": "Point", "coordinates": [x, 0.5]},
+        }
+
+    # every third item is outside the query geometry, and the last page links to itself
+    items = [point(i, 0.5 if i % 3 else 5) for i in range(30)]
+
+    def retrieve(
+        method: validations.Method,
+        url: str,
+        errors: validations.Errors,
+        context: validations.Context,
+        r_session: requests.Session,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        offset = int(url.partition("?page=")[2] or 0)
+        start = min(offset, 20)
+        return (
+            200,
+            {
+                "features": items[start : start + 10],
+                "links": [
+                    {
+                        "rel": "next",
+                        "href": f"https://invalid/search?page={offset + 10}",
+                        "method": "POST",
+                        "body": body,
+                    }
+                ],
+            },
+            {},
+        )
+
+    geometry = json.dumps(
+        {
+            "type": "Polygon",
+            "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]],
+        }
+    )
+    errors = validations.Errors()
+    with unittest.mock.patch.object(validations, "retrieve", side_effect=retrieve):
+        checked, outside = validations.validate_intersects_results(
+            validations.Method.POST,
+            "https://invalid/search",
+            "c",
+            geometry,
+            errors,
+            validations.Context.ITEM_SEARCH,
+            r_session,
+            max_items=1000,
+            prefetch_pages=prefetch_pages,
+        )
+
+    # the repeated last page is not checked
+    assert (checked, outside) == (30, 10)
+    assert len(errors.as_list()) == 2
+    assert (
+        "duplicate items returned from paginating items with intersects"
+        in (errors.as_list()[0])
+    )
+    assert errors.as_list()[1].endswith(
+        f"10 of 30 search results for intersects={geometry} do not intersect it, including: "
+        + ", ".join(f"item-{i}" for i in range(0, 30, 3))
+    )
+
+
+def test_validate_geometry_complexity(r_session: requests.Session) -> None:
+    def send(prepared: requests.PreparedRequest, **kwargs: Any) -> Any:
+        # URLs over 64 KiB are too long, and 100,000 vertices time out
+        if len(prepared.url or "") > 65536:
+            return unittest.mock.Mock(status_code=414)
+        if len(prepared.body or b"") > 1_000_000:
+            raise requests.exceptions.ReadTimeout()
+        return unittest.mock.Mock(status_code=200)
+
+    warnings = validations.Warnings()
+    with unittest.mock.patch.object(r_session, "send", side_effect=send):
+        results = validations.validate_geometry_complexity(
+            "https://invalid/search",
+            "c",
+            None,
+            {validations.Method.GET, validations.Method.POST},
+            warnings,
+            r_session,
+        )
+
+    get_polygon = results[(validations.Method.GET, "Polygon")]
+    assert [(vertices, status) for vertices, status, _, _ in get_polygon] == [
+        (10, 200),
+        (100, 200),
+        (1000, 200),
+        (10000, 414),
+    ]
+    post_polygon = results[(validations.Method.POST, "Polygon")]
+    assert post_polygon[-1][:2] == (100000, None)
+    assert post_polygon[-1][3] > 1_000_000
+    assert len(warnings.as_list()) == 4
+    assert (
+        "GET https://invalid/search intersects with a Polygon of 10,000 vertices"
+        in warnings.as_list()[0]
+    )
+    assert warnings.as_list()[2].endswith("failed with ReadTimeout")
+
+
+def test_validate_search_completeness(
+    request: pytest.FixtureRequest, r_session: requests.Session
+) -> None:
+    if request.config.getoption("typeguard_packages"):
+        pytest.skip(
+            "The import hook that typeguard uses seems to break the mock below."
+        )
+
+    def box(item_id: str, west: float, south: float, east: float, north: float) -> Any:
+        return {
+            "collection": "c",
+            "id": item_id,
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [
+                    [
+                        [west, south],
+                        [east, south],
+                        [east, north],
+                        [west, north],
+                        [west, south],
+                    ]
+                ],
+            },
+        }
+
+    # small items over a grid, and one covering all of them that search leaves out
+    items = [
+        box(f"item-{i}", i % 5, i // 5, i % 5 + 0.5, i // 5 + 0.5) for i in range(25)
+    ]
+    items.append(box("everywhere", -1, -1, 6, 6))
+
+    def retrieve(
+        method: validations.Method,
+        url: str,
+        errors: validations.Errors,
+        context: validations.Context,
+        r_session: requests.Session,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        query = {**(params or {}), **(body or {})}
+        if url.endswith("/items"):
+            return 200, {"features": items, "links": []}, {}
+        if "bbox" in query:
+            bbox = query["bbox"]
+            west, south, east, north = (
+                bbox if isinstance(bbox, list) else map(float, bbox.split(","))
+            )
+        else:
+            intersects = query["intersects"]
+            west, south, east, north = shape(
+                json.loads(intersects) if isinstance(intersects, str) else intersects
+            ).bounds
+        features = [
+            item
+            for item in items[:-1]
+            if shape(item["geometry"]).intersects(
+                shape(box("", west, south, east, north)["geometry"])
+            )
+        ]
+        return 200, {"features": features, "links": []}, {}
+
+    root_body = {
+        "links": [
+            {"rel": "data", "href": "https://invalid/collections"},
+            {"rel": "search", "href": "https://invalid/search", "method": "GET"},
+            {"rel": "search", "href": "https://invalid/search", "method": "POST"},
+        ]
+    }
+    errors = validations.Errors()
+    with unittest.mock.patch.object(validations, "retrieve", side_effect=retrieve):
+        results = validations.validate_search_completeness(
+            root_body, "c", errors, r_session, windows=10
+        )
+
+    # every window intersects the one item missing from search
+    assert results == {
+        (method, kind): (5, 5, 0)
+        for method in (validations.Method.GET, validations.Method.POST)
+        for kind in ("bbox", "intersects")
+    }
+    assert len(errors.as_list()) == 4
+    assert all("(everywhere)" in error for error in errors.as_list())
+
+
+def test_validate_sort_order(
+    request: pytest.FixtureRequest, r_session: requests.Session
+) -> None:
+    if request.config.getoption("typeguard_packages"):
+        pytest.skip(
+            "The import hook that typeguard uses seems to break the mock below."
+        )
+
+    # ascending by instant, written with different offsets, except that the first item
+    # of the third page is earlier than the last of the second
+    datetimes = [f"2020-01-{1 + i:02d}T02:00:00+02:00" for i in range(30)]
+    datetimes[20] = "2020-01-01T00:00:00Z"
+
+    def retrieve(
+        method: validations.Method,
+        url: str,
+        errors: validations.Errors,
+        context: validations.Context,
+        r_session: requests.Session,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        offset = int(url.partition("?page=")[2] or 0)
+        features = [
+            {"id": f"item-{i}", "properties": {"datetime": datetimes[i]}}
+            for i in range(offset, min(offset + 10, len(datetimes)))
+        ]
+        links = []
+        if offset + 10 < len(datetimes):
+            links.append(
+                {
+                    "rel": "next",
+                    "href": f"https://invalid/search?page={offset + 10}",
+                    "method": method.value,
+                    "body": body,
+                }
+            )
+        return 200, {"features": features, "links": links}, {}
+
+    errors = validations.Errors()
+    with unittest.mock.patch.object(validations, "retrieve", side_effect=retrieve):
+        checker = validations.validate_sort_order(
+            validations.Method.GET,
+            "https://invalid/search",
+            "c",
+            "properties.datetime",
+            parse_sortby("datetime"),
+            errors,
+            validations.Context.ITEM_SEARCH_SORT,
+            r_session,
+        )
+        assert (checker.pages, checker.items, checker.out_of_order) == (3, 30, 1)
+        assert errors.as_list() == [
+            "[Item Search - Sort Ext] : GET search with Sort 'properties.datetime' was not sorted in "
+            "ascending order: 1 of 30 items over 3 pages out of order, including "
+            "'item-20' (2020-01-01T00:00:00Z) after 'item-19' (2020-01-20T02:00:00+02:00)"
+        ]
+
+        errors = validations.Errors()
+        checker = validations.validate_sort_order(
+            validations.Method.POST,
+            "https://invalid/search",
+            "c",
+            [{"field": "properties.datetime", "direction": "desc"}],
+            parse_sortby("-datetime"),
+            errors,
+            validations.Context.ITEM_SEARCH_SORT,
+            r_session,
+            max_items=15,
+        )
+        assert (checker.pages, checker.items, checker.out_of_order) == (2, 15, 14)
+        assert "was not sorted in descending order" in errors.as_list()[0]
+
+
+def test_validate_sort(
+    request: pytest.FixtureRequest, r_session: requests.Session
+) -> None:
+    if request.config.getoption("typeguard_packages"):
+        pytest.skip(
+            "The import hook that typeguard uses seems to break the mock below."
+        )
+
+    # sorted by cloud cover, then id, over three pages, for any sortby
+    items = [
+        {
+            "id": f"item-{i % 10:02d}",
+            "properties": {
+                "eo:cloud_cover": i // 10,
+                "datetime": f"2020-01-{1 + i % 28:02d}T00:00:00Z",
+            },
+        }
+        for i in range(30)
+    ]
+    requests_made = []
+
+    def retrieve(
+        method: validations.Method,
+        url: str,
+        errors: validations.Errors,
+        context: validations.Context,
+        r_session: requests.Session,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        offset = int(url.partition("?page=")[2] or 0)
+        if offset == 0:
+            requests_made.append((method, (params or body or {}).get("sortby")))
+        links = []
+        if offset + 10 < len(items):
+            links.append(
+                {
+                    "rel": "next",
+                    "href": f"https://invalid/search?page={offset + 10}",
+                    "method": method.value,
+                    "body": body,
+                }
+            )
+        return 200, {"features": items[offset : offset + 10], "links": links}, {}
+
+    landing_page_body = {
+        "links": [
+            {"rel": "search", "href": "https://invalid/search", "method": "GET"},
+            {"rel": "search", "href": "https://invalid/search", "method": "POST"},
+        ]
+    }
+    errors = validations.Errors()
+    with unittest.mock.patch.object(validations, "retrieve", side_effect=retrieve):
+        validations.validate_sort(
+            landing_page_body,
+            "c",
+            errors,
+            validations.Warnings(),
+            r_session,
+            validations.Context.ITEM_SEARCH_SORT,
+            unittest.mock.Mock(),
+            sort_keys=["eo:cloud_cover,id", "eo:cloud_cover,-id"],
+        )
+
+    assert requests_made[-4:] == [
+        (validations.Method.GET, "eo:cloud_cover,id"),
+        (
+            validations.Method.POST,
+            [
+                {"field": "eo:cloud_cover", "direction": "asc"},
+                {"field": "id", "direction": "asc"},
+            ],
+        ),
+        (validations.Method.GET, "eo:cloud_cover,-id"),
+        (
+            validations.Method.POST,
+            [
+                {"field": "eo:cloud_cover", "direction": "asc"},
+                {"field": "id", "direction": "desc"},
+            ],
+        ),
+    ]
+    out_of_order = [
+        re.search(r"was not sorted in (.+ order): (\d+) of 30", e).groups()  # type: ignore
+        for e in errors.as_list()
+    ]
+    # the datetimes are not sorted, nor are the ids within each cloud cover in
+    # descending order, while cloud cover then id is
+    assert out_of_order == [
+        ("ascending order", "1"),
+        ("ascending order", "1"),
+        ("ascending order", "1"),
+        ("descending order", "28"),
+        ("descending order", "28"),
+        ("the requested order", "27"),
+        ("the requested order", "27"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "sortables, sortbys",
+    [
+        (False, ["+datetime", "-datetime"]),
+        (True, ["+datetime", "-datetime", "+eo:cloud_cover", "-eo:cloud_cover"]),
+    ],
+)
+def test_validate_sort_sortables(
+    request: pytest.FixtureRequest,
+    r_session: requests.Session,
+    sortables: bool,
+    sortbys: List[str],
+) -> None:
+    if request.config.getoption("typeguard_packages"):
+        pytest.skip(
+            "The import hook that typeguard uses seems to break the mock below."
+        )
+
+    def retrieve(
+        method: validations.Method,
+        url: str,
+        errors: validations.Errors,
+        context: validations.Context,
+        r_session: requests.Session,
+        body: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        if url.endswith("/sortables"):
+            schema: Dict[str, Any] = {
+                "properties": {"datetime": {}, "eo:cloud_cover": {}}
+            }
+            return 200, schema, {}
+        return 200, {"features": [{"id": "item", "properties": {}}]}, {}
+
+    landing_page_body = {
+        "links": [
+            {"rel": "search", "href": "https://invalid/search", "method": "POST"},
+            {
+                "rel": "http://www.opengis.net/def/rel/ogc/1.0/sortables",
+                "href": "https://invalid/sortables",
+            },
+        ]
+    }
+    with unittest.mock.patch.object(
+        validations, "retrieve", side_effect=retrieve
+    ) as mock:
+        validations.validate_sort(
+            landing_page_body,
+            "c",
+            validations.Errors(),
+            validations.Warnings(),
+            r_session,
+            validations.Context.ITEM_SEARCH_SORT,
+            unittest.mock.Mock(),
+            sortables=sortables,
+        )
+
+    searched = [
+        ("-" if field["direction"] == "desc" else "+") + field["field"]
+        for call in mock.call_args_list
+        if (body := call.kwargs.get("body"))
+        for field in body["sortby"]
+    ]
+    assert searched == sortbys
+
+
+def test_validate_query(
+    request: pytest.FixtureRequest, r_session: requests.Session
+) -> None:
+    if request.config.getoption("typeguard_packages"):
+        pytest.skip(
+            "The import hook that typeguard uses seems to break the mock below."
+        )
+
+    searches = []
+
+    def retrieve(
+        method: validations.Method,
+        url: str,
+        errors: validations.Errors,
+        context: validations.Context,
+        r_session: requests.Session,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        searches.append((method, params, body))
+        search = params or body or {}
+        query = json.loads(search["query"]) if params else search["query"]
+        [(field, operators)] = query.items()
+        [(operator, value)] = operators.items()
+        # GET searches match, and POST searches return everything
+        cloud_covers = list(range(0, 100, 10))
+        compare = {
+            "eq": operator_module.eq,
+            "neq": operator_module.ne,
+            "lt": operator_module.lt,
+            "lte": operator_module.le,
+            "gt": operator_module.gt,
+            "gte": operator_module.ge,
+        }.get(operator)
+        if method == validations.Method.GET and compare:
+            cloud_covers = [c for c in cloud_covers if compare(c, float(value))]
+        features = [
+            {
+                "properties": {
+                    "eo:cloud_cover": c,
+                    "platform": "sentinel-2a",
+                    "instruments": ["msi"],
+                }
+            }
+            for c in cloud_covers
+        ]
+        if method == validations.Method.POST and operator == "startsWith":
+            features = []
+        return 200, {"features": features}, {}
+
+    landing_page_body = {
+        "links": [
+            {"rel": "search", "href": "https://invalid/search", "method": "GET"},
+            {"rel": "search", "href": "https://invalid/search", "method": "POST"},
+        ]
+    }
+    query_config = validations.QueryConfig(
+        "eo:cloud_cover",
+        "30",
+        "30",
+        "30",
+        "30",
+        "30",
+        "30",
+        "platform",
+        "sentinel",
+        "2a",
+        "inel",
+        "instruments",
+        "msi,olci",
+    )
+    errors = validations.Errors()
+    with unittest.mock.patch.object(validations, "retrieve", side_effect=retrieve):
+        validations.validate_query(
+            landing_page_body,
+            "c",
+            errors,
+            validations.Warnings(),
+            r_session,
+            validations.Context.ITEM_SEARCH_QUERY,
+            query_config,
+        )
+
+    assert len(searches) == 20
+    assert all(
+        body["collections"] == ["c"] for method, _, body in searches if body is not None
+    )
+    # only POST results are wrong, and reported in the order of the operators
+    assert errors.as_list() == [
+        f'[Item Search - Query Ext] : POST search with Query \'{{"eo:cloud_cover": {{"{operator}": "30"}}}}\' had non-matching results: got [0, 10, 20, 30, 40, 50, 60, 70, 80, 90]'
+        for operator in ("eq", "neq", "lt", "lte", "gt", "gte")
+    ] + [
+        '[Item Search - Query Ext] : POST search with Query \'{"platform": {"startsWith": "sentinel"}}\' had no results'
+    ]
+
+
+def test_validate_filter_results() -> None:
+    f_json = {
+        "op": "and",
+        "args": [
+            {"op": ">", "args": [{"property": "eo:cloud_cover"}, 5]},
+            {"op": "<", "args": [{"property": "eo:cloud_cover"}, 10]},
+        ],
+    }
+    features = [
+        {"id": f"item-{c}", "properties": {"eo:cloud_cover": c}} for c in range(12)
+    ]
+    compiled = validations.compile_filter(f_json)
+    assert compiled is not None
+    errors = validations.Errors()
+    validations.validate_filter_results(
+        compiled, features, validations.Method.POST, "https://invalid/search", errors
+    )
+    assert errors.as_list() == [
+        "[Item Search - Filter Ext] : POST https://invalid/search 8 of 12 search results for "
+        f"filter={json.dumps(f_json)} do not match it, including: item-0, item-1, item-2, "
+        "item-3, item-4, item-5, item-10, item-11"
+    ]
+
+    errors = validations.Errors()
+    validations.validate_filter_results(
+        compiled,
+        features[6:10],
+        validations.Method.GET,
+        "https://invalid/search",
+        errors,
+    )
+    assert errors.as_list() == []
+    # filters that cannot be evaluated locally are only sent
+    assert (
+        validations.compile_filter(
+            {"op": "a_contains", "args": [{"property": "x"}, [1]]}
+        )
+        is None
+    )
+
+
+def test_filter_search_urls() -> None:
+    GET, POST = validations.Method.GET, validations.Method.POST
+    assert validations.filter_search_urls(
+        [{"rel": "search", "href": "https://invalid/search"}]
+    ) == {GET: "https://invalid/search", POST: "https://invalid/search"}
+    assert validations.filter_search_urls(
+        [
+            {"rel": "search", "href": "https://invalid/search"},
+            {"rel": "search", "href": "https://invalid/post", "method": "POST"},
+        ]
+    ) == {GET: "https://invalid/search", POST: "https://invalid/post"}
+
+
+def test_validate_filter_searches(
+    request: pytest.FixtureRequest, r_session: requests.Session
+) -> None:
+    if request.config.getoption("typeguard_packages"):
+        pytest.skip(
+            "The import hook that typeguard uses seems to break the mock below."
+        )
+
+    searches = []
+
+    def retrieve(
+        method: validations.Method,
+        url: str,
+        errors: validations.Errors,
+        context: validations.Context,
+        r_session: requests.Session,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        search = params or body or {}
+        searches.append((method, search["filter-lang"], search["filter"]))
+        # only POST CQL2-text searches ignore the filter
+        cloud_covers = [0, 5, 10, 60]
+        if not (
+            method == validations.Method.POST
+            and params is None
+            and isinstance(search["filter"], str)
+        ):
+            cloud_covers = [5]
+        features = [
+            {"id": f"item-{c}", "properties": {"eo:cloud_cover": c}}
+            for c in cloud_covers
+        ]
+        return 200, {"features": features}, {}
+
+    f_json = {"op": "=", "args": [{"property": "eo:cloud_cover"}, 5]}
+    between = {"op": "between", "args": [{"property": "eo:cloud_cover"}, [1, 9]]}
+    errors = validations.Errors()
+    with unittest.mock.patch.object(validations, "retrieve", side_effect=retrieve):
+        timings = validations.validate_filter_searches(
+            [f_json, between],
+            ["cql2-text", "cql2-json"],
+            {
+                validations.Method.GET: "https://invalid/search",
+                validations.Method.POST: "https://invalid/search",
+            },
+            errors,
+            r_session,
+            workers=4,
+            repeats=2,
+        )
+
+    each_search = [
+        (validations.Method.GET, "cql2-text", "eo:cloud_cover = 5"),
+        (validations.Method.POST, "cql2-text", "eo:cloud_cover = 5"),
+        (validations.Method.GET, "cql2-json", json.dumps(f_json)),
+        (validations.Method.POST, "cql2-json", f_json),
+        (validations.Method.GET, "cql2-text", "eo:cloud_cover BETWEEN 1 AND 9"),
+        (validations.Method.POST, "cql2-text", "eo:cloud_cover BETWEEN 1 AND 9"),
+        (validations.Method.GET, "cql2-json", json.dumps(between)),
+        (validations.Method.POST, "cql2-json", between),
+    ]
+    # each search is sent once concurrently and checked, then twice one at a time
+    # and only timed
+    assert timings == {0: unittest.mock.ANY, 1: unittest.mock.ANY}
+    assert [len(seconds) for seconds in timings.values()] == [8, 8]
+    assert sorted(searches[:8], key=str) == sorted(each_search, key=str)
+    assert searches[8:] == 2 * each_search
+    # reported in the order of the filters
+    assert errors.as_list() == [
+        "[Item Search - Filter Ext] : POST https://invalid/search 3 of 4 search results for "
+        f"filter={json.dumps(f_json)} do not match it, including: item-0, item-10, item-60",
+        "[Item Search - Filter Ext] : POST https://invalid/search 3 of 4 search results for "
+        f"filter={json.dumps(between)} do not match it, including: item-0, item-10, item-60",
+    ]
+
+
+def test_validate_filter_searches_default_sends_each_search_once(
+    request: pytest.FixtureRequest,
+    r_session: requests.Session,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    if request.config.getoption("typeguard_packages"):
+        pytest.skip(
+            "The import hook that typeguard uses seems to break the mock below."
+        )
+
+    f_json = {"op": "=", "args": [{"property": "eo:cloud_cover"}, 5]}
+    with (
+        unittest.mock.patch.object(
+            validations, "retrieve", return_value=(200, {"features": []}, {})
+        ) as retrieve,
+        caplog.at_level(logging.INFO),
+    ):
+        timings = validations.validate_filter_searches(
+            [f_json],
+            ["cql2-text", "cql2-json"],
+            {
+                validations.Method.GET: "https://invalid/search",
+                validations.Method.POST: "https://invalid/search",
+            },
+            validations.Errors(),
+            r_session,
+        )
+
+    assert retrieve.call_count == 4
+    assert timings == {0: []}
+    assert "slowest filter constructs" not in caplog.text
+
+
+def test_filter_latency() -> None:
+    like = {"op": "like", "args": [{"property": "mission"}, "sentinel%"]}
+    comparison = {"op": "<", "args": [{"property": "eo:cloud_cover"}, 10]}
+    both = {"op": "and", "args": [like, comparison]}
+    rows = validations.filter_latency(
+        [comparison, like, both, {"op": "s_intersects", "args": []}],
+        {0: [0.1, 0.1, 0.1], 1: [2.0, 1.0, 3.0], 2: [1.0], 3: []},
+    )
+    assert [row[:5] for row in rows] == [
+        ("like", "mission", 2, 4, 1.5),
+        ("comparison", "eo:cloud_cover", 2, 4, 0.1),
+    ]
+    assert [row[5] for row in rows] == pytest.approx([2.85, 0.865])